@@ -0,0 +1,337 @@
+"""Predict which programs the VSCPU pipeline cannot handle, from their IR
+
+    python analyze_ir.py [--jobs=N] [--llvm-as=<path>] [--list] <file.ll|.bc>...
+
+The modified Sparc backend only turns a part of LLVM IR into VSCPU code.
+Everything else comes out as plain Sparc mnemonics that cleaner.py passes
+through and the simulator rejects. This walks each module with the Python
+bindings in llvm/bindings/python, in a pool of --jobs processes, and reports
+per function what llc will not lower to VSCPU code, and the control flow
+that cleaner.py is known to mishandle: nested loops, branches to the return
+block of a function other than main and recursion without a base case. An
+estimate of the number of VSCPU instructions the program turns into is
+printed with it.
+
+The checks are patterns, not a simulation. A flagged program may still run
+to completion when the offending code is not reached, and programs that are
+not flagged can fail for reasons the checks do not know about.
+
+.ll files are assembled with llvm-as first. With --list only the files that
+are expected to fail are printed, one per line, so that a pipeline can skip
+them. The exit status is 1 if any file is expected to fail.
+"""
+
+import os, sys, subprocess, tempfile
+import multiprocessing
+
+from vscpu import splitoptions
+
+BINDINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "llvm", "bindings", "python")
+
+# immediates must be simm13 operands, which the backend defines as 14-bit
+# signed values. larger constants are built with sethi and or
+IMM_BITS = 14
+IMM_MIN = -(1 << (IMM_BITS - 1))
+IMM_MAX = (1 << (IMM_BITS - 1)) - 1
+
+FLOAT_TYPES = ["Half", "Float", "Double", "X86_FP80", "FP128", "PPC_FP128"]
+
+# estimated number of VSCPU instructions for each opcode that is lowered to
+# VSCPU code, after the expansions of SparcInstrInfo.td and cleaner.py. add
+# and icmp are cheaper with an immediate operand, conditional branches cost
+# more than unconditional ones
+COSTS = {
+    "Ret": 2,
+    "Br": 1,
+    "Add": 4,
+    "Alloca": 0,
+    "Load": 3,
+    "Store": 3,
+    "GetElementPtr": 3,
+    "Trunc": 0,
+    "ZExt": 0,
+    "SExt": 0,
+    "PtrToInt": 0,
+    "IntToPtr": 0,
+    "BitCast": 0,
+    "ICmp": 7,
+    "PHI": 1,
+    "Call": 1,
+    "Unreachable": 0,
+}
+IMM_COSTS = {"Add": 3, "ICmp": 5}
+COND_BR_COST = 3
+# every basic block becomes a jump and a label cell, every function a label
+BLOCK_COST = 2
+FUNCTION_COST = 1
+
+class Discard(object):
+    def write(self, text):
+        pass
+
+core = None
+bit_reader = None
+
+def load_bindings():
+    global core, bit_reader
+    if core != None:
+        return
+    if BINDINGS_DIR not in sys.path:
+        sys.path.insert(0, BINDINGS_DIR)
+    # llvm.core prints its enumerations while it is imported
+    stdout = sys.stdout
+    sys.stdout = Discard()
+    try:
+        import llvm.core
+        import llvm.bit_reader
+    finally:
+        sys.stdout = stdout
+    core = llvm.core
+    bit_reader = llvm.bit_reader
+
+def type_problem(value):
+    """the reason the type of value cannot be handled, or None"""
+    try:
+        kind = value.type_kind.name
+    except ValueError:
+        return "unknown type"
+    if kind in FLOAT_TYPES:
+        return "floating point"
+    if kind == "Vector":
+        return "vector"
+    if kind == "Integer" and value.int_width > 32:
+        return "%d-bit integer" % value.int_width
+    return None
+
+def instruction_problems(inst, op, operands):
+    """the reasons the instruction cannot be lowered to VSCPU code"""
+    problems = []
+    if op not in COSTS:
+        problems.append("instruction " + op)
+    checked = [inst] + operands
+    if op == "GetElementPtr":
+        # the indices are narrowed to the pointer width of Sparc
+        checked = checked[:2]
+    for value in checked:
+        problem = type_problem(value)
+        if problem != None and problem not in problems:
+            problems.append(problem)
+    if op == "Load" or op == "Store":
+        # only whole words can be loaded and stored, ldub and stb are not
+        # lowered
+        value = inst
+        if op == "Store":
+            value = operands[0]
+        width = value.int_width
+        if width != None and width < 32:
+            problems.append("%d-bit memory access" % width)
+    if (op == "ZExt" or op == "SExt") and operands[0].int_width == 1:
+        # booleans become integers through conditional moves
+        problems.append("boolean to integer")
+    for value in operands:
+        constant = value.constant_int
+        if constant != None and not IMM_MIN <= constant <= IMM_MAX:
+            problems.append("immediate %d" % constant)
+    return problems
+
+def find_loops(blocks, successors):
+    """map each loop header to the blocks of its loop"""
+    loops = {}
+    predecessors = dict((block, []) for block in blocks)
+    for block in blocks:
+        for succ in successors[block]:
+            predecessors[succ].append(block)
+    # a depth-first walk finds the back edges, which go to a block that is
+    # still on the walk's stack
+    on_stack = set([blocks[0]])
+    visited = set([blocks[0]])
+    stack = [(blocks[0], iter(successors[blocks[0]]))]
+    while stack:
+        block, succs = stack[-1]
+        for succ in succs:
+            if succ in on_stack:
+                body = loops.setdefault(succ, set([succ]))
+                work = [block]
+                while work:
+                    member = work.pop()
+                    if member not in body:
+                        body.add(member)
+                        work.extend(predecessors[member])
+            elif succ not in visited:
+                visited.add(succ)
+                on_stack.add(succ)
+                stack.append((succ, iter(successors[succ])))
+                break
+        else:
+            on_stack.discard(block)
+            stack.pop()
+    return loops
+
+def control_flow_problems(function, blocks):
+    """the reasons the control flow of function cannot be handled"""
+    problems = []
+    successors = {}
+    conditional = False
+    recursive = False
+    for block in blocks:
+        terminator = block.last
+        successors[block] = terminator.get_successors()
+        if len(successors[block]) > 1:
+            conditional = True
+        for inst in block.get_instructions():
+            if inst.opcode.name == "Call" and \
+                    inst.get_operands()[-1].name == function.name:
+                recursive = True
+
+    # llc marks the blocks of inner loops with "! Child Loop" comments,
+    # which cleaner.py passes through and memgen cannot parse
+    loops = find_loops(blocks, successors)
+    for header in loops:
+        for other, body in loops.items():
+            if other is not header and header in body:
+                problems.append("nested loop")
+                break
+
+    # cleaner.py drops ret, which leaves the label of the return block of a
+    # function other than main at the end of the program. a branch to it
+    # runs off the program
+    if function.name != "main":
+        for index, block in enumerate(blocks):
+            if block.last.opcode.name != "Ret":
+                continue
+            for pred in blocks:
+                if block not in successors[pred]:
+                    continue
+                if len(successors[pred]) > 1 or \
+                        index == 0 or blocks[index - 1] is not pred:
+                    problems.append("branch to return")
+
+    # without a conditional branch every call recurses again, and the
+    # program never halts
+    if recursive and not conditional:
+        problems.append("recursion without a base case")
+    return problems
+
+def analyze_function(function):
+    problems = {}
+    estimate = FUNCTION_COST
+    blocks = function.get_basic_blocks()
+    for problem in control_flow_problems(function, blocks):
+        problems[problem] = problems.get(problem, 0) + 1
+    for block in blocks:
+        estimate += BLOCK_COST
+        for inst in block.get_instructions():
+            try:
+                op = inst.opcode.name
+            except ValueError:
+                # newer than the enumerations of the bindings
+                op = "unknown"
+            operands = inst.get_operands()
+            for problem in instruction_problems(inst, op, operands):
+                problems[problem] = problems.get(problem, 0) + 1
+            if op == "Br" and len(operands) == 3:
+                estimate += COND_BR_COST
+            elif op in IMM_COSTS and [o for o in operands
+                                      if o.constant_int != None]:
+                estimate += IMM_COSTS[op]
+            else:
+                estimate += COSTS.get(op, 0)
+    return problems, estimate
+
+def read_module(filename, llvm_as):
+    if not filename.endswith(".ll"):
+        return bit_reader.parse_bitcode(core.MemoryBuffer(filename=filename))
+    handle, bitcode = tempfile.mkstemp(suffix=".bc")
+    os.close(handle)
+    try:
+        process = subprocess.Popen([llvm_as, filename, "-o", bitcode],
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT)
+        output = process.communicate()[0]
+        if process.returncode != 0:
+            lines = output.strip().splitlines() or [llvm_as + " failed"]
+            raise Exception(lines[0])
+        return bit_reader.parse_bitcode(core.MemoryBuffer(filename=bitcode))
+    finally:
+        os.remove(bitcode)
+
+def analyze_file(job):
+    """analyze_file((filename, llvm_as)) -> (filename, error, functions)
+
+    functions lists (name, problems, estimate) for every defined function,
+    where problems maps each reason to its number of instructions"""
+    filename, llvm_as = job
+    load_bindings()
+    try:
+        module = read_module(filename, llvm_as)
+    except Exception as e:
+        return filename, str(e) or e.__class__.__name__, []
+    functions = []
+    for function in module.get_functions():
+        if function.first is None:
+            # only declared
+            continue
+        problems, estimate = analyze_function(function)
+        functions.append((function.name, problems, estimate))
+    return filename, None, functions
+
+def analyze(filenames, jobs=1, llvm_as="llvm-as"):
+    """yield the result of analyze_file for each file, in order"""
+    work = [(filename, llvm_as) for filename in filenames]
+    if jobs <= 1 or len(work) <= 1:
+        for job in work:
+            yield analyze_file(job)
+        return
+    pool = multiprocessing.Pool(min(jobs, len(work)))
+    try:
+        for result in pool.imap(analyze_file, work):
+            yield result
+    finally:
+        pool.terminate()
+
+def main():
+    args, options = splitoptions(sys.argv)
+    only_list = "--list" in args
+    filenames = [arg for arg in args[1:] if arg != "--list"]
+    if not filenames:
+        print(__doc__.strip())
+        sys.exit(2)
+    jobs = int(options.get("jobs", multiprocessing.cpu_count()))
+    llvm_as = options.get("llvm-as", "llvm-as")
+
+    failing = 0
+    total = 0
+    if not only_list:
+        print("{0:32} {1:>10} {2}".format("program", "estimate", "status"))
+    for filename, error, functions in analyze(filenames, jobs, llvm_as):
+        name = os.path.splitext(os.path.basename(filename))[0]
+        problems = [(function, problem, count)
+                    for function, found, estimate in functions
+                    for problem, count in sorted(found.items())]
+        if error != None or problems:
+            failing += 1
+            if only_list:
+                print(filename)
+        if only_list:
+            continue
+        if error != None:
+            print("{0:32} {1:>10} error: {2}".format(name, "-", error))
+            continue
+        estimate = sum(function[2] for function in functions)
+        total += estimate
+        if problems:
+            print("{0:32} {1:10} unsupported".format(name, estimate))
+        else:
+            print("{0:32} {1:10} ok".format(name, estimate))
+        for function, problem, count in problems:
+            print("    {0}: {1} ({2})".format(function, problem, count))
+    if not only_list:
+        print("{0} of {1} programs expected to fail, {2} instructions "
+              "estimated".format(failing, len(filenames), total))
+    if failing:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,18 @@ block_dict = {}
 ret_block = []
 fun_dict = {}
 
+# cells from 16314 up hold the sparc registers, the program never takes
+# their address so indirect loads and stores only touch memory below
+REG_BASE = 16314
+MEM_SIZE = 16384
+WORD_MASK = 0xFFFFFFFF
+IMM_LIMIT = 1 << 14
+STATIC_CELLS = {16316: 4294967295, 16319: 0, 16349: 16313}
+
+ALU_OPS = ["ADD", "NAND", "SRL", "LT", "MUL"]
+DEST_OPS = ALU_OPS + [op + "i" for op in ALU_OPS] + ["CP", "CPi", "CPI"]
+KNOWN_OPS = DEST_OPS + ["CPIi", "BZJ", "BZJi"]
+
 def print_lines(lines):
     for line in lines:
         print(line)
@@ -16,9 +28,8 @@ def is_block_ref(word):
     return re.match("^(\\.|!).*", word) != None
 
 def add_static_lines(lines):
-    lines.append("16316: 4294967295")
-    lines.append("16319: 0")
-    lines.append("16349: 16313")
+    for cell in sorted(STATIC_CELLS.keys()):
+        lines.append(str(cell) + ": " + str(STATIC_CELLS[cell]))
     return lines
 
 def numarize_lines(lines):
@@ -107,6 +118,223 @@ def fix_branches(lines):
             new_lines.append(line)
     return new_lines
 
+def is_reg(word):
+    return re.match("^[0-9]+$", word) != None and REG_BASE <= int(word) < MEM_SIZE
+
+def parse_inst(line):
+    words = line.split()
+    if len(words) != 3 or words[0] not in KNOWN_OPS:
+        return None
+    return words
+
+def inst_uses(words):
+    if words == None:
+        return set(range(REG_BASE, MEM_SIZE))
+    inst = words[0]
+    if inst == "CPi":
+        operands = []
+    elif inst == "CP" or inst == "CPI":
+        operands = [words[2]]
+    elif inst[-1] == "i" and inst != "CPIi":
+        operands = [words[1]]
+    else:
+        operands = [words[1], words[2]]
+    return set(int(x) for x in operands if is_reg(x))
+
+def inst_def(words):
+    if words != None and words[0] in DEST_OPS and is_reg(words[1]):
+        return int(words[1])
+    return None
+
+def fold(inst, x, y):
+    if inst == "ADD":
+        return (x + y) & WORD_MASK
+    elif inst == "NAND":
+        return (~(x & y)) & WORD_MASK
+    elif inst == "SRL":
+        if y < 32:
+            return (x >> y) & WORD_MASK
+        return (x << (y - 32)) & WORD_MASK
+    elif inst == "LT":
+        return int(x < y)
+    elif inst == "MUL":
+        return (x * y) & WORD_MASK
+
+def split_functions(lines):
+    functions = []
+    for line in lines:
+        if line[0] == "@" or not functions:
+            functions.append([])
+        functions[-1].append(line)
+    return functions
+
+def split_blocks(lines):
+    blocks = [[]]
+    for line in lines:
+        if is_block(line) or line[0] == "@":
+            blocks.append([])
+        blocks[-1].append(line)
+        words = line.split()
+        if words[0] in ["BZJ", "BZJi", "call"]:
+            blocks.append([])
+    return [block for block in blocks if block]
+
+def block_label(block):
+    if is_block(block[0]):
+        return re.search("^(\\.|!)[^:]*", block[0]).group(0)
+    return None
+
+def block_successors(blocks, i, labels):
+    words = blocks[i][-1].split()
+    if words[0] == "BZJ" or words[0] == "BZJi":
+        if words[1] not in labels:
+            return None
+        targets = [labels[words[1]]]
+        if words[0] == "BZJ":
+            if i + 1 == len(blocks):
+                return None
+            targets.append(i + 1)
+        elif words[2] != "0":
+            return None
+        return targets
+    if words[0] == "call" or i + 1 == len(blocks):
+        return None
+    return [i + 1]
+
+# forward pass: value numbering of the register cells inside a basic block.
+# instructions that leave a register with the value it already holds are
+# dropped, results known to be small constants become CPi
+def propagate_values(block, constants):
+    new_lines = []
+    vals = dict(constants)
+    numbers = [0]
+    def fresh():
+        numbers[0] = numbers[0] + 1
+        return ("v", numbers[0])
+    def immediate(word):
+        if re.match("^[0-9]+$", word) == None:
+            return fresh()
+        return ("c", int(word))
+    def value(word):
+        if not is_reg(word):
+            return fresh()
+        if int(word) not in vals:
+            vals[int(word)] = fresh()
+        return vals[int(word)]
+    for line in block:
+        words = parse_inst(line)
+        if words == None:
+            if not is_block(line) and line[0] != "@":
+                vals = dict(constants)
+            new_lines.append(line)
+            continue
+        inst = words[0]
+        dest = inst_def(words)
+        if dest == None:
+            if inst == "CPIi" and value(words[1])[0] == "c" and value(words[1])[1] >= REG_BASE:
+                vals = dict(constants)
+            new_lines.append(line)
+            continue
+        if inst == "CPI":
+            result = fresh()
+        elif inst == "CPi":
+            result = immediate(words[2])
+        elif inst == "CP":
+            result = value(words[2])
+        else:
+            x = value(words[1])
+            if inst[-1] == "i":
+                inst = inst[:-1]
+                y = immediate(words[2])
+            else:
+                y = value(words[2])
+            if x[0] == "c" and y[0] == "c":
+                result = ("c", fold(inst, x[1], y[1]))
+            else:
+                result = fresh()
+        if vals.get(dest) == result:
+            continue
+        vals[dest] = result
+        if result[0] == "c" and result[1] < IMM_LIMIT and words[0] != "CPi":
+            new_lines.append("CPi " + words[1] + " " + str(result[1]))
+        else:
+            new_lines.append(line)
+    return new_lines
+
+# backward pass: registers that are overwritten before being read are dead.
+# registers are assumed live wherever control flow leaves what we can see
+def block_live_in(block, live):
+    for line in reversed(block):
+        words = parse_inst(line)
+        dest = inst_def(words)
+        if dest != None:
+            live.discard(dest)
+        if not is_block(line) and line[0] != "@":
+            live |= inst_uses(words)
+    return live
+
+def eliminate_dead_stores(blocks):
+    all_regs = set(range(REG_BASE, MEM_SIZE))
+    labels = {}
+    for i in range(len(blocks)):
+        if block_label(blocks[i]) != None:
+            labels[block_label(blocks[i])] = i
+    successors = [block_successors(blocks, i, labels) for i in range(len(blocks))]
+    removed = True
+    while removed:
+        live_in = [set() for block in blocks]
+        live_out = [set() for block in blocks]
+        changed = True
+        while changed:
+            changed = False
+            for i in reversed(range(len(blocks))):
+                if successors[i] == None:
+                    live_out[i] = set(all_regs)
+                else:
+                    live_out[i] = set()
+                    for j in successors[i]:
+                        live_out[i] |= live_in[j]
+                live = block_live_in(blocks[i], set(live_out[i]))
+                if live != live_in[i]:
+                    live_in[i] = live
+                    changed = True
+        removed = False
+        for i in range(len(blocks)):
+            live = set(live_out[i])
+            new_block = []
+            for line in reversed(blocks[i]):
+                words = parse_inst(line)
+                dest = inst_def(words)
+                if dest != None and dest not in live:
+                    removed = True
+                    continue
+                if dest != None:
+                    live.discard(dest)
+                if not is_block(line) and line[0] != "@":
+                    live |= inst_uses(words)
+                new_block.append(line)
+            new_block.reverse()
+            blocks[i] = new_block
+    return blocks
+
+def promote_registers(lines):
+    constants = {}
+    written = set()
+    for line in lines:
+        dest = inst_def(parse_inst(line))
+        if dest != None:
+            written.add(dest)
+    for cell in STATIC_CELLS:
+        if cell not in written:
+            constants[cell] = ("c", STATIC_CELLS[cell])
+    new_lines = []
+    for function in split_functions(lines):
+        blocks = [propagate_values(block, constants) for block in split_blocks(function)]
+        blocks = eliminate_dead_stores([block for block in blocks if block])
+        for block in blocks:
+            new_lines.extend(block)
+    return new_lines
+
 def fix_negatives(lines):
     new_lines = []
     for line in lines:
@@ -286,10 +514,10 @@ def organize_functions(lines):
     return new_lines
 
 
-def main():
-    filename = sys.argv[1]
-    file = open(filename).read()
-    lines = file.splitlines()
+def clean(lines, promote=True):
+    del ret_block[:]
+    block_dict.clear()
+    fun_dict.clear()
     lines = organize_functions(lines)
     lines = skip_header(lines)
     lines = delete_line_nums(lines)
@@ -300,12 +528,23 @@ def main():
     lines = fix_instructions(lines)
     lines = fix_negatives(lines)
     lines = fix_branches(lines)
+    if promote:
+        lines = promote_registers(lines)
     #lines = fix_ret(lines)
     lines = numarize_blocks(lines)
     lines = refer_blocks(lines)
     #lines = num_ret(lines)
     lines = numarize_lines(lines)
     lines = add_static_lines(lines)
+    return lines
+
+
+def main():
+    filename = sys.argv[1]
+    promote = "--no-promote" not in sys.argv[2:]
+    file = open(filename).read()
+    lines = file.splitlines()
+    lines = clean(lines, promote)
     print_lines(lines)
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+#===- bench_core.py - IR Walking Benchmark -------------------*- python -*--===#
+#
+#                     The LLVM Compiler Infrastructure
+#
+# This file is distributed under the University of Illinois Open Source
+# License. See LICENSE.TXT for details.
+#
+#===------------------------------------------------------------------------===#
+
+"""Time walking the instructions of bitcode modules with llvm.core.
+
+Usage: bench_core.py [options] <bitcode file>...
+
+Each module is walked with the Module, Function and BasicBlock iterators, and
+with the get_functions() and get_instructions() lists, collecting the opcode
+and operand count of every instruction.
+"""
+
+from __future__ import print_function
+
+import optparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir))
+
+from llvm.bit_reader import parse_bitcode
+from llvm.core import MemoryBuffer
+
+def walk_iterators(modules):
+    count = 0
+    for module in modules:
+        for function in module:
+            for bb in function:
+                for inst in bb:
+                    inst.opcode
+                    len(inst)
+                    count += 1
+    return count
+
+def walk_lists(modules):
+    count = 0
+    for module in modules:
+        for function in module.get_functions():
+            for inst in function.get_instructions():
+                inst.opcode
+                len(inst)
+                count += 1
+    return count
+
+def run(label, function, modules, repeat):
+    start = time.time()
+    for i in range(repeat):
+        count = function(modules)
+    elapsed = time.time() - start
+    print('%-20s %8.3fs %12.0f instructions/s' % (label, elapsed,
+                                                   count * repeat / elapsed))
+
+def main():
+    parser = optparse.OptionParser(usage=__doc__.split('\n\n')[1])
+    parser.add_option('--repeat', type=int, default=20,
+                      help='Number of times to walk the modules [%default]')
+    opts, args = parser.parse_args()
+    if not args:
+        parser.error('expected bitcode files')
+
+    modules = [parse_bitcode(MemoryBuffer(filename=path)) for path in args]
+    run('iterators', walk_iterators, modules, opts.repeat)
+    run('lists', walk_lists, modules, opts.repeat)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+#===- bench_disassembler.py - Disassembler Benchmark ---------*- python -*--===#
+#
+#                     The LLVM Compiler Infrastructure
+#
+# This file is distributed under the University of Illinois Open Source
+# License. See LICENSE.TXT for details.
+#
+#===------------------------------------------------------------------------===#
+
+"""Compare Disassembler.get_instruction() and get_instructions() with
+Disassembler.disassemble().
+
+Usage: bench_disassembler.py [options] <object file>
+
+The .text section of the object file is disassembled both ways and the time
+and instruction rate of each are printed. Use a binary with a multi-megabyte
+.text section, such as an llc or clang executable, for meaningful numbers.
+"""
+
+from __future__ import print_function
+
+import optparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir))
+
+from llvm.disassembler import Disassembler
+from llvm.object import ObjectFile
+
+def get_section(filename, name):
+    for section in ObjectFile(filename=filename).get_sections():
+        if section.name == name:
+            return section.address, section.contents
+    raise SystemExit('error: no %s section in %s' % (name, filename))
+
+def one_at_a_time(disassembler, contents, address):
+    # What callers of get_instruction() do to get past invalid bytes. No x86
+    # instruction is longer than 15 bytes.
+    offset = 0
+    count = 0
+    while offset < len(contents):
+        size, text = disassembler.get_instruction(
+            contents[offset:offset + 16], address + offset)
+        offset += size or 1
+        count += 1
+    return count
+
+def run(label, function):
+    start = time.time()
+    count = function()
+    elapsed = time.time() - start
+    print('%-32s %8.3fs %12.0f instructions/s' % (label, elapsed,
+                                                   count / elapsed))
+
+def main():
+    parser = optparse.OptionParser(usage=__doc__.split('\n\n')[1])
+    parser.add_option('--triple', default='x86_64-unknown-linux-gnu',
+                      help='Triple to disassemble for [%default]')
+    parser.add_option('--section', default='.text',
+                      help='Section to disassemble [%default]')
+    parser.add_option('--limit', type=int, default=0,
+                      help='Only disassemble the first LIMIT bytes')
+    opts, args = parser.parse_args()
+    if len(args) != 1:
+        parser.error('expected an object file')
+
+    address, contents = get_section(args[0], opts.section)
+    if opts.limit:
+        contents = contents[:opts.limit]
+    print('%s: %d bytes of %s' % (args[0], len(contents), opts.section))
+
+    disassembler = Disassembler(opts.triple)
+    run('get_instruction()', lambda:
+        one_at_a_time(disassembler, contents, address))
+    # get_instructions() stops at the first invalid byte, so its rate is all
+    # that can be compared.
+    run('get_instructions()', lambda:
+        sum(1 for _ in disassembler.get_instructions(contents, address)))
+    run('disassemble()', lambda:
+        len(disassembler.disassemble(contents, address, skip_invalid=True)))
+    run('disassemble(memoryview)', lambda:
+        len(disassembler.disassemble(memoryview(bytearray(contents)), address,
+                                     skip_invalid=True)))
+
+if __name__ == '__main__':
+    main()
@@ -14,7 +14,12 @@ __all__ = ['parse_bitcode']
 lib = get_library()
 
 def parse_bitcode(mem_buffer):
-    """Input is .core.MemoryBuffer"""
+    """Input is .core.MemoryBuffer, or a Python buffer holding bitcode.
+
+    Buffers are wrapped in a MemoryBuffer without being copied.
+    """
+    if not isinstance(mem_buffer, MemoryBuffer):
+        mem_buffer = MemoryBuffer(contents=mem_buffer)
     module = c_object_p()
     result = lib.LLVMParseBitcode2(mem_buffer, byref(module))
     if result:
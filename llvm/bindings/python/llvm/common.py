@@ -8,8 +8,19 @@
 #===------------------------------------------------------------------------===#
 
 from ctypes import POINTER
+from ctypes import PYFUNCTYPE
+from ctypes import Structure
+from ctypes import addressof
+from ctypes import byref
+from ctypes import c_char_p
+from ctypes import c_int
+from ctypes import c_ssize_t
+from ctypes import c_ubyte
 from ctypes import c_void_p
+from ctypes import cast
 from ctypes import cdll
+from ctypes import py_object
+from ctypes import pythonapi
 
 import ctypes.util
 import platform
@@ -20,6 +31,7 @@ LLVM_VERSION = '3.4'
 
 __all__ = [
     'c_object_p',
+    'get_buffer',
     'get_library',
 ]
 
@@ -29,7 +41,14 @@ class LLVMObject(object):
     """Base class for objects that are backed by an LLVM data structure.
 
     This class should never be instantiated outside of this package.
+
+    Subclasses that define no __slots__ of their own get an instance
+    dictionary as usual. Lightweight wrappers, such as those of IR values,
+    define empty __slots__ to avoid it.
     """
+    __slots__ = ('_ptr', '_as_parameter_', '_self_owned', '_ownable',
+                 '_disposer', '_owned_objects', '__weakref__')
+
     def __init__(self, ptr, ownable=True, disposer=None):
         assert isinstance(ptr, c_object_p)
 
@@ -39,7 +58,8 @@ class LLVMObject(object):
         self._ownable = ownable
         self._disposer = disposer
 
-        self._owned_objects = []
+        # Created on the first take_ownership() call.
+        self._owned_objects = None
 
     def take_ownership(self, obj):
         """Take ownership of another object.
@@ -54,6 +74,8 @@ class LLVMObject(object):
         """
         assert isinstance(obj, LLVMObject)
 
+        if self._owned_objects is None:
+            self._owned_objects = []
         self._owned_objects.append(obj)
         obj._self_owned = False
 
@@ -91,6 +113,88 @@ class CachedProperty(object):
 
         return value
 
+class _Py_buffer(Structure):
+    # The fields of Py_buffer that get_buffer() reads come first in every
+    # Python version. Python 2 has smalltable before internal, which only
+    # makes this larger than needed on Python 3.
+    _fields_ = [
+        ('buf', c_void_p),
+        ('obj', c_void_p),
+        ('len', c_ssize_t),
+        ('itemsize', c_ssize_t),
+        ('readonly', c_int),
+        ('ndim', c_int),
+        ('format', c_char_p),
+        ('shape', c_void_p),
+        ('strides', c_void_p),
+        ('suboffsets', c_void_p),
+        ('smalltable', c_ssize_t * 2),
+        ('internal', c_void_p),
+    ]
+
+_PyObject_GetBuffer = PYFUNCTYPE(c_int, py_object, POINTER(_Py_buffer), c_int)(
+    ('PyObject_GetBuffer', pythonapi))
+_PyBuffer_Release = PYFUNCTYPE(None, POINTER(_Py_buffer))(
+    ('PyBuffer_Release', pythonapi))
+
+# The old buffer protocol, the only one mmap and buffer objects support in
+# Python 2. Python 3.10 removed it.
+try:
+    _PyObject_AsReadBuffer = PYFUNCTYPE(c_int, py_object, POINTER(c_void_p),
+                                        POINTER(c_ssize_t))(
+        ('PyObject_AsReadBuffer', pythonapi))
+except AttributeError: # pragma: no cover
+    _PyObject_AsReadBuffer = None
+
+class _BufferView(object):
+    """A contiguous buffer exported by an object, held until this is freed."""
+
+    def __init__(self, source):
+        self._view = None
+        view = _Py_buffer()
+        # PyBUF_SIMPLE, which fails for buffers that are not contiguous.
+        _PyObject_GetBuffer(source, byref(view), 0)
+        self._view = view
+
+    @property
+    def address(self):
+        return self._view.buf
+
+    def __len__(self):
+        return self._view.len
+
+    def __del__(self):
+        if self._view is not None:
+            _PyBuffer_Release(byref(self._view))
+
+def get_buffer(source):
+    """Obtain the address and length of the bytes in source.
+
+    This returns a 3-tuple of the address, the length and an object that must
+    be kept alive while the address is in use. bytes and all objects
+    supporting the buffer protocol, such as bytearray, mmap (read-only ones
+    included) and memoryview objects, are used in place. Only buffers that
+    are not contiguous are copied.
+    """
+    if isinstance(source, bytes):
+        pointer = c_char_p(source)
+        return cast(pointer, c_void_p).value, len(source), pointer
+    try:
+        view = _BufferView(source)
+        return view.address or 0, len(view), view
+    except (TypeError, BufferError):
+        pass
+    if _PyObject_AsReadBuffer is not None:
+        address = c_void_p()
+        length = c_ssize_t()
+        try:
+            _PyObject_AsReadBuffer(source, byref(address), byref(length))
+            # The old protocol does not lock the buffer, so keep source.
+            return address.value or 0, length.value, source
+        except (TypeError, BufferError):
+            pass
+    return get_buffer(memoryview(source).tobytes())
+
 def get_library():
     """Obtain a reference to the llvm library."""
 
@@ -9,6 +9,7 @@
 
 from .common import LLVMObject
 from .common import c_object_p
+from .common import get_buffer
 from .common import get_library
 
 from . import enumerations
@@ -16,12 +17,19 @@ from . import enumerations
 from ctypes import POINTER
 from ctypes import byref
 from ctypes import c_char_p
+from ctypes import c_int
+from ctypes import c_longlong
+from ctypes import c_size_t
 from ctypes import c_uint
+from ctypes import c_void_p
+
+import weakref
 
 __all__ = [
     "lib",
     "Enums",
     "OpCode",
+    "TypeKind",
     "MemoryBuffer",
     "Module",
     "Value",
@@ -35,6 +43,52 @@ __all__ = [
 lib = get_library()
 Enums = []
 
+# Weak references to the wrappers of IR objects, by (class, address). Walking
+# the IR again returns the wrappers that are still alive instead of creating
+# new ones. Dead references are purged once the table has doubled in size,
+# which is cheaper than a WeakValueDictionary's removal callbacks.
+_wrappers = {}
+_wrappers_purge_size = 1024
+
+def _get_wrapper(cls, address):
+    """Obtain the cls instance wrapping the object at address.
+
+    This returns None if address is NULL.
+    """
+    global _wrappers_purge_size
+
+    if not address:
+        return None
+
+    key = (cls, address)
+    ref = _wrappers.get(key)
+    if ref is not None:
+        wrapper = ref()
+        if wrapper is not None:
+            return wrapper
+
+    # A pointer to a c_void_p placed at address holds address, and is much
+    # cheaper to create than a cast().
+    wrapper = cls(c_object_p(c_void_p.from_address(address)))
+    _wrappers[key] = weakref.ref(wrapper)
+
+    if len(_wrappers) > _wrappers_purge_size:
+        for dead in [k for k, r in _wrappers.items() if r() is None]:
+            del _wrappers[dead]
+        _wrappers_purge_size = max(1024, 2 * len(_wrappers))
+
+    return wrapper
+
+def _walk(first, next, parent):
+    """Obtain the addresses of a list of IR objects, from first to last."""
+    addresses = []
+    address = first(parent)
+    while address:
+        addresses.append(address)
+        address = next(address)
+
+    return addresses
+
 class LLVMEnumeration(object):
     """Represents an individual LLVM enumeration."""
 
@@ -146,14 +200,30 @@ class LandingPadClauseTy(LLVMEnumeration):
 class MemoryBuffer(LLVMObject):
     """Represents an opaque memory buffer."""
 
-    def __init__(self, filename=None):
+    def __init__(self, filename=None, contents=None, name=''):
         """Create a new memory buffer.
 
-        Currently, we support creating from the contents of a file at the
-        specified filename.
+        The buffer holds either the contents of a file at the specified
+        filename or the bytes of contents, which may be a str, bytes,
+        bytearray, memoryview or mmap object.
+
+        contents are wrapped without being copied, read-only mmap objects
+        included, unless they are a buffer that is not contiguous. The buffer
+        keeps a reference to them, and they must not be modified while the
+        buffer, or any object parsed from it, is alive. name is the buffer
+        identifier that LLVM uses in diagnostics.
         """
-        if filename is None:
-            raise Exception("filename argument must be defined")
+        if (filename is None) == (contents is None):
+            raise Exception("exactly one of the filename and contents "
+                            "arguments must be defined")
+
+        if contents is not None:
+            address, length, self._contents = get_buffer(contents)
+            memory = lib.LLVMCreateMemoryBufferWithMemoryRange(address, length,
+                                                               name, False)
+            LLVMObject.__init__(self, memory,
+                                disposer=lib.LLVMDisposeMemoryBuffer)
+            return
 
         memory = c_object_p()
         out = c_char_p(None)
@@ -170,25 +240,51 @@ class MemoryBuffer(LLVMObject):
         return lib.LLVMGetBufferSize(self)
 
 class Value(LLVMObject):
-    
-    def __init__(self, value):
-        LLVMObject.__init__(self, value)
+    __slots__ = ()
 
     @property
     def name(self):
-        return lib.LLVMGetValueName(self)
+        return _get_value_name(self._ptr)
 
     def dump(self):
         lib.LLVMDumpValue(self)
     
     def get_operand(self, i):
         return Value(lib.LLVMGetOperand(self, i))
+
+    def get_operands(self):
+        """Obtain the operands of this value as a list of Value instances."""
+        ptr = self._ptr
+        return [_get_wrapper(Value, _get_operand(ptr, i))
+                for i in range(_get_num_operands(ptr))]
     
     def set_operand(self, i, v):
         return lib.LLVMSetOperand(self, i, v)
     
     def __len__(self):
-        return lib.LLVMGetNumOperands(self)
+        return _get_num_operands(self._ptr)
+
+    @property
+    def type_kind(self):
+        """The TypeKind of the type of this value."""
+        return TypeKind.from_value(_get_type_kind(_type_of(self._ptr)))
+
+    @property
+    def int_width(self):
+        """The bit width of the type of this value, or None if it is not an
+        integer type."""
+        type = _type_of(self._ptr)
+        if _get_type_kind(type) != TypeKind.Integer.value:
+            return None
+        return _get_int_type_width(type)
+
+    @property
+    def constant_int(self):
+        """The sign-extended value of this constant integer, or None if this
+        value is not a constant integer."""
+        if not _is_a_constant_int(self._ptr):
+            return None
+        return _const_int_get_sext_value(self._ptr)
 
 class Module(LLVMObject):
     """Represents the top-level structure of an llvm program in an opaque object."""
@@ -253,11 +349,16 @@ class Module(LLVMObject):
 
     @property
     def first(self):
-        return Function(lib.LLVMGetFirstFunction(self))
+        return _get_wrapper(Function, _get_first_function(self))
 
     @property
     def last(self):
-        return Function(lib.LLVMGetLastFunction(self))
+        return _get_wrapper(Function, _get_last_function(self))
+
+    def get_functions(self):
+        """Obtain the functions of this module as a list."""
+        return [_get_wrapper(Function, f)
+                for f in _walk(_get_first_function, _get_next_function, self)]
 
     def print_module_to_file(self, filename):
         out = c_char_p(None)
@@ -267,29 +368,43 @@ class Module(LLVMObject):
             raise RuntimeError("LLVM Error: %s" % out.value)
 
 class Function(Value):
-
-    def __init__(self, value):
-        Value.__init__(self, value)
+    __slots__ = ()
     
     @property
     def next(self):
-        f = lib.LLVMGetNextFunction(self)
-        return f and Function(f)
+        return _get_wrapper(Function, _get_next_function(self))
     
     @property
     def prev(self):
-        f = lib.LLVMGetPreviousFunction(self)
-        return f and Function(f)
+        return _get_wrapper(Function, _get_previous_function(self))
     
     @property
     def first(self):
-        b = lib.LLVMGetFirstBasicBlock(self)
-        return b and BasicBlock(b)
+        return _get_wrapper(BasicBlock, _get_first_basic_block(self))
 
     @property
     def last(self):
-        b = lib.LLVMGetLastBasicBlock(self)
-        return b and BasicBlock(b)
+        return _get_wrapper(BasicBlock, _get_last_basic_block(self))
+
+    def get_basic_blocks(self):
+        """Obtain the basic blocks of this function as a list."""
+        return [_get_wrapper(BasicBlock, b)
+                for b in _walk(_get_first_basic_block, _get_next_basic_block,
+                               self)]
+
+    def get_instructions(self):
+        """Obtain the instructions of all basic blocks of this function.
+
+        This is a single list, in the order of the basic blocks.
+        """
+        instructions = []
+        for b in _walk(_get_first_basic_block, _get_next_basic_block, self):
+            instructions.extend(
+                _get_wrapper(Instruction, i)
+                for i in _walk(_get_first_instruction, _get_next_instruction,
+                               b))
+
+        return instructions
 
     class __bb_iterator(object):
         def __init__(self, function, reverse=False):
@@ -323,29 +438,29 @@ class Function(Value):
         return lib.LLVMCountBasicBlocks(self)
 
 class BasicBlock(LLVMObject):
-    
-    def __init__(self, value):
-        LLVMObject.__init__(self, value)
+    __slots__ = ()
 
     @property
     def next(self):
-        b = lib.LLVMGetNextBasicBlock(self)
-        return b and BasicBlock(b)
+        return _get_wrapper(BasicBlock, _get_next_basic_block(self))
 
     @property
     def prev(self):
-        b = lib.LLVMGetPreviousBasicBlock(self)
-        return b and BasicBlock(b)
+        return _get_wrapper(BasicBlock, _get_previous_basic_block(self))
     
     @property
     def first(self):
-        i = lib.LLVMGetFirstInstruction(self)
-        return i and Instruction(i)
+        return _get_wrapper(Instruction, _get_first_instruction(self))
 
     @property
     def last(self):
-        i = lib.LLVMGetLastInstruction(self)
-        return i and Instruction(i)
+        return _get_wrapper(Instruction, _get_last_instruction(self))
+
+    def get_instructions(self):
+        """Obtain the instructions of this basic block as a list."""
+        return [_get_wrapper(Instruction, i)
+                for i in _walk(_get_first_instruction, _get_next_instruction,
+                               self)]
 
     def __as_value(self):
         return Value(lib.LLVMBasicBlockAsValue(self))
@@ -398,23 +513,34 @@ class BasicBlock(LLVMObject):
 
 
 class Instruction(Value):
-
-    def __init__(self, value):
-        Value.__init__(self, value)
+    __slots__ = ()
 
     @property
     def next(self):
-        i = lib.LLVMGetNextInstruction(self)
-        return i and Instruction(i)
+        return _get_wrapper(Instruction, _get_next_instruction(self))
 
     @property
     def prev(self):
-        i = lib.LLVMGetPreviousInstruction(self)
-        return i and Instruction(i)
+        return _get_wrapper(Instruction, _get_previous_instruction(self))
 
     @property
     def opcode(self):
-        return OpCode.from_value(lib.LLVMGetInstructionOpcode(self))
+        return OpCode.from_value(_get_instruction_opcode(self._ptr))
+
+    def get_successors(self):
+        """Obtain the basic blocks this instruction branches to as a list.
+
+        They are listed in operand order, which puts the false destination of
+        a conditional branch before the true one.
+        """
+        ptr = self._ptr
+        successors = []
+        for i in range(_get_num_operands(ptr)):
+            operand = _get_operand(ptr, i)
+            if _value_is_basic_block(operand):
+                successors.append(_get_wrapper(BasicBlock,
+                                               _value_as_basic_block(operand)))
+        return successors
 
 class Context(LLVMObject):
 
@@ -493,6 +619,10 @@ def register_library(library):
             POINTER(c_object_p), POINTER(c_char_p)]
     library.LLVMCreateMemoryBufferWithContentsOfFile.restype = bool
 
+    library.LLVMCreateMemoryBufferWithMemoryRange.argtypes = [c_void_p,
+            c_size_t, c_char_p, c_int]
+    library.LLVMCreateMemoryBufferWithMemoryRange.restype = c_object_p
+
     library.LLVMGetBufferSize.argtypes = [MemoryBuffer]
 
     library.LLVMDisposeMemoryBuffer.argtypes = [MemoryBuffer]
@@ -621,6 +751,49 @@ def initialize_llvm():
     lib.LLVMInitializeCodeGen(p)
     lib.LLVMInitializeTarget(p)
 
+def _get_address_function(library, name, restype=c_void_p, *argtypes):
+    """Obtain a separate prototype of a function working on plain addresses.
+
+    The cached wrappers and bulk iterators walk the IR with these, creating
+    ctypes pointers and wrappers only for the objects they return. Wrappers
+    pass their pointers to them directly, rather than through from_param().
+    """
+    function = library[name]
+    function.argtypes = [c_void_p] + list(argtypes)
+    function.restype = restype
+    return function
+
 register_library(lib)
 Enums = register_enumerations()
 initialize_llvm()
+
+_get_first_function = _get_address_function(lib, 'LLVMGetFirstFunction')
+_get_last_function = _get_address_function(lib, 'LLVMGetLastFunction')
+_get_next_function = _get_address_function(lib, 'LLVMGetNextFunction')
+_get_previous_function = _get_address_function(lib, 'LLVMGetPreviousFunction')
+_get_first_basic_block = _get_address_function(lib, 'LLVMGetFirstBasicBlock')
+_get_last_basic_block = _get_address_function(lib, 'LLVMGetLastBasicBlock')
+_get_next_basic_block = _get_address_function(lib, 'LLVMGetNextBasicBlock')
+_get_previous_basic_block = _get_address_function(lib,
+                                                  'LLVMGetPreviousBasicBlock')
+_get_first_instruction = _get_address_function(lib, 'LLVMGetFirstInstruction')
+_get_last_instruction = _get_address_function(lib, 'LLVMGetLastInstruction')
+_get_next_instruction = _get_address_function(lib, 'LLVMGetNextInstruction')
+_get_previous_instruction = _get_address_function(lib,
+                                                  'LLVMGetPreviousInstruction')
+_get_operand = _get_address_function(lib, 'LLVMGetOperand', c_void_p, c_uint)
+_get_num_operands = _get_address_function(lib, 'LLVMGetNumOperands', c_uint)
+_get_value_name = _get_address_function(lib, 'LLVMGetValueName', c_char_p)
+_get_instruction_opcode = _get_address_function(lib,
+                                                'LLVMGetInstructionOpcode',
+                                                c_uint)
+_value_is_basic_block = _get_address_function(lib, 'LLVMValueIsBasicBlock',
+                                              c_uint)
+_value_as_basic_block = _get_address_function(lib, 'LLVMValueAsBasicBlock')
+_type_of = _get_address_function(lib, 'LLVMTypeOf')
+_get_type_kind = _get_address_function(lib, 'LLVMGetTypeKind', c_uint)
+_get_int_type_width = _get_address_function(lib, 'LLVMGetIntTypeWidth', c_uint)
+_is_a_constant_int = _get_address_function(lib, 'LLVMIsAConstantInt')
+_const_int_get_sext_value = _get_address_function(lib,
+                                                  'LLVMConstIntGetSExtValue',
+                                                  c_longlong)
@@ -18,9 +18,11 @@ from ctypes import c_ubyte
 from ctypes import c_uint64
 from ctypes import c_void_p
 from ctypes import cast
+from ctypes import create_string_buffer
 
 from .common import LLVMObject
 from .common import c_object_p
+from .common import get_buffer
 from .common import get_library
 
 __all__ = [
@@ -33,7 +35,8 @@ callbacks = {}
 # Constants for set_options
 Option_UseMarkup = 1
 
-
+# Size of the buffer instructions are printed into.
+_OUTPUT_SIZE = 255
 
 _initialized = False
 _targets = ['AArch64', 'ARM', 'Hexagon', 'MSP430', 'Mips', 'NVPTX', 'PowerPC', 'R600', 'Sparc', 'SystemZ', 'X86', 'XCore']
@@ -81,6 +84,9 @@ class Disassembler(LLVMObject):
 
         LLVMObject.__init__(self, ptr, disposer=lib.LLVMDisasmDispose)
 
+        # Output buffer reused by disassemble().
+        self._output = None
+
     def get_instruction(self, source, pc=0):
         """Obtain the next instruction from an input source.
 
@@ -141,6 +147,53 @@ class Disassembler(LLVMObject):
             address += result
             offset += result
 
+    def disassemble(self, source, pc=0, skip_invalid=False):
+        """Disassemble all instructions in an input source.
+
+        The input source may be a str, bytes, bytearray, memoryview or mmap
+        object. It is read in place, without being copied, unless it is a
+        read-only buffer other than str or bytes.
+
+        The pc argument specifies the address that the first byte is at.
+
+        This returns a list of 3-tuples of:
+
+          long offset of the instruction from the start of source.
+          long size of instruction, in bytes.
+          str representation of instruction.
+
+        Disassembly stops at the first byte that does not start a valid
+        instruction, unless skip_invalid is true, in which case each such byte
+        is returned as an instruction of size 1 with a representation of None.
+
+        Unlike get_instructions(), this prints every instruction into the same
+        output buffer and makes a single ctypes call per instruction.
+        """
+        address, length, keepalive = get_buffer(source)
+        if self._output is None:
+            self._output = create_string_buffer(_OUTPUT_SIZE)
+        output = self._output
+        output_address = addressof(output)
+
+        disasm = _disasm_instruction
+        ptr = self._ptr
+        instructions = []
+        offset = 0
+        while offset < length:
+            size = disasm(ptr, address + offset, length - offset, pc + offset,
+                          output_address, _OUTPUT_SIZE)
+            if size == 0:
+                if not skip_invalid:
+                    break
+                instructions.append((offset, 1, None))
+                offset += 1
+                continue
+
+            instructions.append((offset, size, output.value))
+            offset += size
+
+        return instructions
+
     def set_options(self, options):
         if not lib.LLVMSetDisasmOptions(self, options):
             raise Exception('Unable to set all disassembler options in %i' % options)
@@ -160,6 +213,18 @@ def register_library(library):
     library.LLVMSetDisasmOptions.argtypes = [Disassembler, c_uint64]
     library.LLVMSetDisasmOptions.restype = c_int
 
+def _get_disasm_instruction(library):
+    """Obtain a prototype of LLVMDisasmInstruction taking plain addresses.
+
+    Passing integers rather than ctypes pointer objects lets disassemble()
+    avoid creating a pointer for each instruction.
+    """
+    function = library['LLVMDisasmInstruction']
+    function.argtypes = [c_object_p, c_void_p, c_uint64, c_uint64, c_void_p,
+                         c_size_t]
+    function.restype = c_size_t
+    return function
+
 
 callbacks['op_info'] = CFUNCTYPE(c_int, c_void_p, c_uint64, c_uint64, c_uint64,
                                  c_int, c_void_p)
@@ -168,3 +233,4 @@ callbacks['symbol_lookup'] = CFUNCTYPE(c_char_p, c_void_p, c_uint64,
                                        POINTER(c_char_p))
 
 register_library(lib)
+_disasm_instruction = _get_disasm_instruction(lib)
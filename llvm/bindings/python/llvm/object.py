@@ -22,8 +22,9 @@ Usage
 -----
 
 The only way to use this module is to start by creating an ObjectFile. You can
-create an ObjectFile by loading a file (specified by its path) or by creating a
-llvm.core.MemoryBuffer and loading that.
+create an ObjectFile by loading a file (specified by its path), from the bytes
+of an object file already in memory, or by creating a llvm.core.MemoryBuffer
+and loading that.
 
 Once you have an object file, you can inspect its sections and symbols directly
 by calling get_sections() and get_symbols() respectively. To inspect
@@ -75,8 +76,30 @@ Here are some examples on how to perform iteration:
     for symbol in symbols:
         print symbol.name # OK
 
+Bulk Extraction
+---------------
+
+Walking a large binary through Section, Symbol and Relocation instances costs a
+Python object and a ctypes call per property per item. When only the names,
+addresses and sizes are needed, get_tables() instead walks the sections,
+symbols and relocations once and returns them as an ObjectTables instance of
+columns: compact arrays of addresses and sizes, with names stored once in a
+shared NameTable and referred to by index.
+
+    tables = obj.get_tables()
+    for name, address, size in tables.symbols:
+        print name, address, size
+
+    # Columns can also be used directly.
+    text = tables.names.index('.text')
+    total = sum(size for index, size in zip(tables.sections.name_indices,
+                                            tables.sections.sizes)
+                if index == text)
+
 """
 
+from array import array
+
 from ctypes import c_char_p
 from ctypes import c_char
 from ctypes import POINTER
@@ -91,12 +114,22 @@ from .core import MemoryBuffer
 
 __all__ = [
     "lib",
+    "NameTable",
     "ObjectFile",
+    "ObjectTables",
     "Relocation",
     "Section",
     "Symbol",
 ]
 
+# Type code for arrays of 64-bit addresses and sizes. Python 2 has no 'Q', but
+# its 'L' is 64 bits wide on LP64 platforms.
+try:
+    array('Q')
+    _uint64_type = 'Q'
+except ValueError:
+    _uint64_type = 'L'
+
 class ObjectFile(LLVMObject):
     """Represents an object/binary file."""
 
@@ -105,10 +138,11 @@ class ObjectFile(LLVMObject):
 
         filename must be a path to a file that can be opened with open().
         contents can be either a native Python buffer type (like str) or a
-        llvm.core.MemoryBuffer instance.
+        llvm.core.MemoryBuffer instance. Buffers are wrapped in a MemoryBuffer
+        without being copied, see llvm.core.MemoryBuffer.
         """
-        if contents:
-            assert isinstance(contents, MemoryBuffer)
+        if contents is not None and not isinstance(contents, MemoryBuffer):
+            contents = MemoryBuffer(contents=contents)
 
         if filename is not None:
             contents = MemoryBuffer(filename=filename)
@@ -176,6 +210,199 @@ class ObjectFile(LLVMObject):
 
         lib.LLVMDisposeSymbolIterator(symbols)
 
+    def get_tables(self, relocations=True):
+        """Obtain the sections, symbols and relocations of this object file.
+
+        This walks each of them once and returns an ObjectTables instance
+        holding their properties as columns. No Section, Symbol or Relocation
+        instances are created. Relocations are skipped if relocations is
+        False.
+        """
+        tables = ObjectTables()
+        intern = tables.names.intern
+
+        sections = lib.LLVMGetSections(self)
+        try:
+            section_index = 0
+            while not lib.LLVMIsSectionIteratorAtEnd(self, sections):
+                tables.sections.append(intern(lib.LLVMGetSectionName(sections)),
+                                       lib.LLVMGetSectionAddress(sections),
+                                       lib.LLVMGetSectionSize(sections))
+                if relocations:
+                    self._get_relocation_rows(sections, section_index, tables)
+                section_index += 1
+                lib.LLVMMoveToNextSection(sections)
+        finally:
+            lib.LLVMDisposeSectionIterator(sections)
+
+        symbols = lib.LLVMGetSymbols(self)
+        try:
+            while not lib.LLVMIsSymbolIteratorAtEnd(self, symbols):
+                tables.symbols.append(intern(_get_symbol_name(symbols)),
+                                      _get_symbol_address(symbols),
+                                      _get_symbol_size(symbols))
+                lib.LLVMMoveToNextSymbol(symbols)
+        finally:
+            lib.LLVMDisposeSymbolIterator(symbols)
+
+        return tables
+
+    def _get_relocation_rows(self, sections, section_index, tables):
+        """Add the relocations of the current section to tables."""
+        intern = tables.names.intern
+        relocations = lib.LLVMGetRelocations(sections)
+        try:
+            while not lib.LLVMIsRelocationIteratorAtEnd(sections, relocations):
+                symbol = lib.LLVMGetRelocationSymbol(relocations)
+                try:
+                    if lib.LLVMIsSymbolIteratorAtEnd(self, symbol):
+                        symbol_index = -1
+                    else:
+                        symbol_index = intern(_get_symbol_name(symbol))
+                finally:
+                    lib.LLVMDisposeSymbolIterator(symbol)
+
+                tables.relocations.append(
+                    section_index,
+                    lib.LLVMGetRelocationOffset(relocations),
+                    lib.LLVMGetRelocationType(relocations),
+                    intern(lib.LLVMGetRelocationTypeName(relocations)),
+                    symbol_index)
+                lib.LLVMMoveToNextRelocation(relocations)
+        finally:
+            lib.LLVMDisposeRelocationIterator(relocations)
+
+class NameTable(object):
+    """Strings shared by the columns of an ObjectTables instance.
+
+    Each distinct name is stored once and referred to by its index.
+    """
+
+    def __init__(self):
+        self.names = []
+        self._indices = {}
+
+    def intern(self, name):
+        """Obtain the index of a name, adding it if it is new."""
+        index = self._indices.get(name)
+        if index is None:
+            index = len(self.names)
+            self._indices[name] = index
+            self.names.append(name)
+
+        return index
+
+    def index(self, name):
+        """Obtain the index of a name, raising ValueError if it is absent."""
+        try:
+            return self._indices[name]
+        except KeyError:
+            raise ValueError('%r is not in the name table.' % name)
+
+    def __getitem__(self, index):
+        return self.names[index]
+
+    def __len__(self):
+        return len(self.names)
+
+class _AddressTable(object):
+    """Columns of names, addresses and sizes.
+
+    Iterating yields (name, address, size) tuples.
+    """
+
+    def __init__(self, names):
+        self.names = names
+        self.name_indices = array('l')
+        self.addresses = array(_uint64_type)
+        self.sizes = array(_uint64_type)
+
+    def append(self, name_index, address, size):
+        self.name_indices.append(name_index)
+        self.addresses.append(address)
+        self.sizes.append(size)
+
+    def __len__(self):
+        return len(self.name_indices)
+
+    def __getitem__(self, index):
+        return (self.names[self.name_indices[index]], self.addresses[index],
+                self.sizes[index])
+
+    def __iter__(self):
+        names = self.names.names
+        for name_index, address, size in zip(self.name_indices,
+                                             self.addresses, self.sizes):
+            yield (names[name_index], address, size)
+
+class SectionTable(_AddressTable):
+    """The sections of an object file, as columns."""
+
+class SymbolTable(_AddressTable):
+    """The symbols of an object file, as columns."""
+
+class RelocationTable(object):
+    """The relocations of an object file, as columns.
+
+    Iterating yields (section_index, offset, type_number, type_name,
+    symbol_name) tuples, where section_index indexes the SectionTable of the
+    same ObjectTables instance and symbol_name is None for relocations without
+    a symbol.
+    """
+
+    def __init__(self, names):
+        self.names = names
+        self.section_indices = array('l')
+        self.offsets = array(_uint64_type)
+        self.type_numbers = array(_uint64_type)
+        self.type_name_indices = array('l')
+        # Index of the symbol name in the NameTable, or -1 if there is none.
+        self.symbol_indices = array('l')
+
+    def append(self, section_index, offset, type_number, type_name_index,
+               symbol_index):
+        self.section_indices.append(section_index)
+        self.offsets.append(offset)
+        self.type_numbers.append(type_number)
+        self.type_name_indices.append(type_name_index)
+        self.symbol_indices.append(symbol_index)
+
+    def __len__(self):
+        return len(self.section_indices)
+
+    def _row(self, names, section_index, offset, type_number, type_name_index,
+             symbol_index):
+        symbol_name = None
+        if symbol_index >= 0:
+            symbol_name = names[symbol_index]
+        return (section_index, offset, type_number, names[type_name_index],
+                symbol_name)
+
+    def __getitem__(self, index):
+        return self._row(self.names.names, self.section_indices[index],
+                         self.offsets[index], self.type_numbers[index],
+                         self.type_name_indices[index],
+                         self.symbol_indices[index])
+
+    def __iter__(self):
+        names = self.names.names
+        for row in zip(self.section_indices, self.offsets, self.type_numbers,
+                       self.type_name_indices, self.symbol_indices):
+            yield self._row(names, *row)
+
+class ObjectTables(object):
+    """The sections, symbols and relocations of an object file, as columns.
+
+    Instances are obtained from ObjectFile.get_tables(). They hold no
+    references into the object file and remain valid after it is disposed.
+    """
+
+    def __init__(self):
+        self.names = NameTable()
+        self.sections = SectionTable(self.names)
+        self.symbols = SymbolTable(self.names)
+        self.relocations = RelocationTable(self.names)
+
 class Section(LLVMObject):
     """Represents a section in an object file."""
 
@@ -505,5 +732,22 @@ def register_library(library):
     library.LLVMGetRelocationValueString.argtypes = [c_object_p]
     library.LLVMGetRelocationValueString.restype = c_char_p
 
+def _get_iterator_function(library, name, restype):
+    """Obtain a separate prototype of a function, taking a raw iterator.
+
+    The Symbol accessors are declared to take Symbol instances. Bulk
+    extraction calls them with symbol iterators instead, without creating a
+    Symbol for each.
+    """
+    function = library[name]
+    function.argtypes = [c_object_p]
+    function.restype = restype
+    return function
+
 lib = get_library()
 register_library(lib)
+
+_get_symbol_name = _get_iterator_function(lib, 'LLVMGetSymbolName', c_char_p)
+_get_symbol_address = _get_iterator_function(lib, 'LLVMGetSymbolAddress',
+                                             c_uint64)
+_get_symbol_size = _get_iterator_function(lib, 'LLVMGetSymbolSize', c_uint64)
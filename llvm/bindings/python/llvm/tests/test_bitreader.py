@@ -13,3 +13,10 @@ class TestBitReader(TestBase):
         m = parse_bitcode(MemoryBuffer(filename=source))
         print m.target
         print m.datalayout
+
+    def test_parse_bitcode_from_contents(self):
+        with open(self.get_test_bc(), 'rb') as f:
+            data = f.read()
+        m = parse_bitcode(bytearray(data))
+        expected = parse_bitcode(MemoryBuffer(filename=self.get_test_bc()))
+        self.assertEqual(m.target, expected.target)
@@ -1,10 +1,14 @@
+import mmap
+
 from .base import TestBase
+from ..common import get_buffer
 from ..core import MemoryBuffer
 from ..core import PassRegistry
 from ..core import Context
 from ..core import Module
 from ..core import Enums
 from ..core import OpCode
+from ..core import TypeKind
 from ..bit_reader import parse_bitcode
 
 class TestCore(TestBase):
@@ -40,6 +44,49 @@ class TestCore(TestBase):
         m = MemoryBuffer(filename=source)
         self.assertEqual(len(m), 50)
 
+    def test_memory_buffer_create_from_contents(self):
+        with open(self.get_test_file(), 'rb') as f:
+            data = f.read()
+
+        for contents in (data, bytearray(data), memoryview(bytearray(data))):
+            m = MemoryBuffer(contents=contents)
+            self.assertEqual(len(m), 50)
+
+    def test_memory_buffer_create_from_mmap(self):
+        with open(self.get_test_file(), 'rb') as f:
+            contents = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        m = MemoryBuffer(contents=contents)
+        self.assertEqual(len(m), 50)
+        del m
+        contents.close()
+
+    def test_get_buffer_in_place(self):
+        data = bytearray(b'0123456789')
+        address, length, keepalive = get_buffer(data)
+        self.assertEqual(length, 10)
+
+        view_address, length, keepalive = get_buffer(memoryview(data))
+        self.assertEqual(view_address, address)
+        self.assertEqual(length, 10)
+
+        view_address, length, keepalive = get_buffer(memoryview(data)[2:5])
+        self.assertEqual(view_address, address + 2)
+        self.assertEqual(length, 3)
+
+        with open(self.get_test_file(), 'rb') as f:
+            contents = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        address, length, keepalive = get_buffer(contents)
+        self.assertEqual(length, 50)
+        self.assertNotEqual(address, 0)
+        del keepalive
+        contents.close()
+
+    def test_memory_buffer_requires_one_source(self):
+        with self.assertRaises(Exception):
+            MemoryBuffer()
+        with self.assertRaises(Exception):
+            MemoryBuffer(filename=self.get_test_file(), contents='')
+
     def test_create_passregistry(self):
         PassRegistry()
 
@@ -138,3 +185,62 @@ class TestCore(TestBase):
             self.assertEqual(inst.name, inst_list[i][0])
             self.assertEqual(inst.opcode, inst_list[i][1])
             inst.dump()
+
+    def test_bulk_iteration(self):
+        m = parse_bitcode(MemoryBuffer(filename=self.get_test_bc()))
+
+        functions = m.get_functions()
+        self.assertEqual([f.name for f in functions], [f.name for f in m])
+
+        f = functions[0]
+        self.assertEqual([bb.name for bb in f.get_basic_blocks()],
+                         [bb.name for bb in f])
+        self.assertEqual([inst.opcode for inst in f.get_instructions()],
+                         [inst.opcode for bb in f for inst in bb])
+
+        inst = m.first.first.first
+        self.assertEqual([o.name for o in inst.get_operands()],
+                         [inst.get_operand(i).name for i in range(len(inst))])
+
+    def test_wrapper_identity(self):
+        m = parse_bitcode(MemoryBuffer(filename=self.get_test_bc()))
+
+        # Live wrappers are reused for the same IR object.
+        f = m.first
+        self.assertIs(m.first, f)
+        self.assertIs(m.get_functions()[0], f)
+        self.assertIs(f.next.prev, f)
+        self.assertIs(f.first.first, f.get_instructions()[0])
+
+        with self.assertRaises(AttributeError):
+            f.attribute = None
+
+    def test_instruction_successors(self):
+        m = parse_bitcode(MemoryBuffer(filename=self.get_test_bc()))
+
+        f = m.first
+        while f.name != "f6":
+            f = f.next
+        b1, b2, end = f.get_basic_blocks()
+
+        # br i1 undef, label %end, label %b2
+        self.assertEqual(b1.last.get_successors(), [b2, end])
+        self.assertIs(b1.last.get_successors()[0], b2)
+        self.assertEqual(b2.last.get_successors(), [end])
+        self.assertEqual(end.last.get_successors(), [])
+
+    def test_value_types_and_constants(self):
+        m = parse_bitcode(MemoryBuffer(filename=self.get_test_bc()))
+
+        # %1 = call i32 @f2([0 x i8] %arg2, i32 5, i32 42)
+        call = m.first.first.first.next.next
+        self.assertEqual(call.opcode, OpCode.Call)
+        self.assertEqual(call.type_kind, TypeKind.Integer)
+        self.assertEqual(call.int_width, 32)
+        self.assertIsNone(call.constant_int)
+
+        operands = call.get_operands()
+        self.assertEqual(operands[0].type_kind, TypeKind.Array)
+        self.assertIsNone(operands[0].int_width)
+        self.assertIsNone(operands[0].constant_int)
+        self.assertEqual([o.constant_int for o in operands[1:3]], [5, 42])
@@ -1,3 +1,6 @@
+import mmap
+import tempfile
+
 from .base import TestBase
 
 from ..disassembler import Disassembler, Option_UseMarkup
@@ -31,6 +34,37 @@ class TestDisassembler(TestBase):
         self.assertEqual(instructions[0], (0, 3, '\tjcxz\t-127'))
         self.assertEqual(instructions[1], (3, 2, '\taddl\t%eax, %edi'))
 
+    def test_disassemble(self):
+        sequence = '\x67\xe3\x81\x01\xc7' # jcxz -127; addl %eax, %edi
+
+        disassembler = Disassembler('i686-apple-darwin9')
+
+        expected = [(0, 3, '\tjcxz\t-127'), (3, 2, '\taddl\t%eax, %edi')]
+        self.assertEqual(disassembler.disassemble(sequence), expected)
+        self.assertEqual(disassembler.disassemble(bytearray(sequence)),
+                         expected)
+        self.assertEqual(disassembler.disassemble(memoryview(sequence)),
+                         expected)
+        self.assertEqual(disassembler.disassemble(''), [])
+
+        with tempfile.TemporaryFile() as f:
+            f.write(sequence)
+            f.flush()
+            contents = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.assertEqual(disassembler.disassemble(contents), expected)
+            contents.close()
+
+    def test_disassemble_invalid(self):
+        sequence = '\x01\xc7\xff\xff\x01\xc7' # addl %eax, %edi; ??; addl
+
+        disassembler = Disassembler('i686-apple-darwin9')
+
+        instructions = disassembler.disassemble(sequence)
+        self.assertEqual(instructions, [(0, 2, '\taddl\t%eax, %edi')])
+
+        instructions = disassembler.disassemble(sequence, skip_invalid=True)
+        self.assertEqual(instructions[1], (2, 1, None))
+
     def test_set_options(self):
         sequence = '\x10\x40\x2d\xe9'
         triple = 'arm-linux-android'
@@ -1,5 +1,6 @@
 from .base import TestBase
 from ..object import ObjectFile
+from ..object import ObjectTables
 from ..object import Relocation
 from ..object import Section
 from ..object import Symbol
@@ -65,3 +66,29 @@ class TestObjectFile(TestBase):
                 assert isinstance(relocation.type_number, long)
                 assert isinstance(relocation.type_name, str)
                 assert isinstance(relocation.value_string, str)
+
+    def test_get_tables(self):
+        o = self.get_object_file()
+        tables = o.get_tables()
+        assert isinstance(tables, ObjectTables)
+
+        sections = [(s.name, s.address, s.size) for s in o.get_sections()]
+        self.assertEqual(list(tables.sections), sections)
+
+        symbols = [(s.name, s.address, s.size) for s in o.get_symbols()]
+        self.assertEqual(list(tables.symbols), symbols)
+        self.assertEqual(tables.symbols[0], symbols[0])
+
+        # Each name is only stored once.
+        self.assertEqual(len(set(tables.names.names)), len(tables.names))
+
+        for section_index, offset, type_number, type_name, symbol_name in \
+                tables.relocations:
+            assert 0 <= section_index < len(tables.sections)
+            assert isinstance(type_name, str)
+
+    def test_get_tables_without_relocations(self):
+        o = self.get_object_file()
+        tables = o.get_tables(relocations=False)
+        self.assertEqual(len(tables.relocations), 0)
+        self.assertGreater(len(tables.sections), 0)
@@ -39,13 +39,25 @@
 #       funcname3 [2/XX]: skipped: same content
 #       funcname4 [3/XX]: failed: './link_test' exitcode != 0
 #       ...
+#
+# With --bisect the files or functions are not tried one at a time. Instead
+# the set of differing files (or functions) is split in halves which are
+# swapped in all at once, narrowing down a minimal failing set in a number of
+# rounds logarithmic in the number of candidates (delta debugging). With
+# -j N the candidates of a round are tested in up to N link_test processes at
+# the same time, so link_test must not write to fixed paths in that case.
+#    > ./abtest.py --bisect -j 4
+#    > ./abtest.py --bisect -j 4 file.s
 from fnmatch import filter
 from sys import stderr
 import argparse
 import filecmp
+import multiprocessing.pool
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 
 LINKTEST="./link_test"
 ESCAPE="\033[%sm"
@@ -89,6 +101,9 @@ def extract_functions(file):
     return functions
 
 def replace_function(file, function, replacement, dest):
+    replace_functions(file, {function: replacement}, dest)
+
+def replace_functions(file, replacements, dest):
     out = open(dest, "w")
     skip = False
     found = False
@@ -99,8 +114,8 @@ def replace_function(file, function, replacement, dest):
                 warn("Missing end of function %s" % (in_function,))
             funcname = line[12:-1]
             in_function = funcname
-            if in_function == function:
-                out.write(replacement)
+            if in_function in replacements:
+                out.write(replacements[in_function])
                 skip = True
         elif line.startswith("# -- End  "):
             function_name = line[10:-1]
@@ -112,6 +127,7 @@ def replace_function(file, function, replacement, dest):
                 continue
         if not skip:
             out.write(line)
+    out.close()
 
 def announce_test(name):
     stderr.write("%s%s%s: " % (BOLD, name, NORMAL))
@@ -195,10 +211,168 @@ def check_functions_in_file(base, goodfile, badfile):
 
         testrun(testfiles)
 
+def quiet_testrun(job):
+    """Run link_test on the files make_testfiles writes for a subset, in a
+    temporary directory of its own. Returns True if link_test succeeded."""
+    make_testfiles, subset = job
+    workdir = tempfile.mkdtemp(prefix="abtest")
+    try:
+        files = make_testfiles(subset, workdir)
+        linkline="%s %s" % (LINKTEST, " ".join(files),)
+        return subprocess.call(linkline, shell=True) == 0
+    finally:
+        shutil.rmtree(workdir)
+
+def split(items, n):
+    """Split items into n chunks of nearly equal size."""
+    chunks = []
+    start = 0
+    for i in range(n):
+        end = start + (len(items) - start) // (n - i)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+def bisect(candidates, make_testfiles):
+    """Find a minimal set of candidates which fails when taken from the bad
+    side, with the ddmin algorithm. The subsets tested in one round are
+    independent, so up to config.jobs of them are run in parallel."""
+    pool = multiprocessing.pool.ThreadPool(max(config.jobs, 1))
+    rounds = [0]
+    runs = [0]
+
+    def first_failing(subsets, kind):
+        rounds[0] += 1
+        announce_test("round %d" % rounds[0])
+        stderr.write("%d %s of %d candidates\n" % (len(subsets), kind,
+                                                   len(candidates)))
+        stderr.flush()
+        # Run config.jobs subsets at a time, and stop after the batch that
+        # finds a failing one. With a single job this tests the subsets one
+        # by one, like plain ddmin.
+        jobs = max(config.jobs, 1)
+        for start in range(0, len(subsets), jobs):
+            batch = subsets[start:start + jobs]
+            results = pool.map(quiet_testrun,
+                               [(make_testfiles, subset) for subset in batch],
+                               chunksize=1)
+            runs[0] += len(batch)
+            for subset, ok in zip(batch, results):
+                if not ok:
+                    return subset
+        return None
+
+    try:
+        if first_failing([candidates], "set") is None:
+            announce_result(FAILED, "taking all %d candidates from %s "
+                            "works" % (len(candidates), baddir))
+            return None
+
+        n = 2
+        while len(candidates) >= 2:
+            chunks = split(candidates, n)
+            subset = first_failing(chunks, "subsets")
+            if subset is not None:
+                candidates = subset
+                n = 2
+                continue
+            if n > 2:
+                complements = [[c for c in candidates if c not in chunk]
+                               for chunk in chunks]
+                subset = first_failing(complements, "complements")
+                if subset is not None:
+                    candidates = subset
+                    n = max(n - 1, 2)
+                    continue
+            if n >= len(candidates):
+                break
+            n = min(2 * n, len(candidates))
+    finally:
+        pool.terminate()
+
+    announce_test("bisect")
+    announce_result("done", "%d rounds, %d link_test runs" % (rounds[0],
+                                                                runs[0]))
+    for c in candidates:
+        stderr.write("%s%s%s: %s\n" % (BOLD, c, NORMAL, FAILED))
+    return candidates
+
+def bisect_files():
+    """Bisect files mode"""
+    candidates = []
+    for f in NO_PREFIX:
+        b=baddir+"/"+f
+        if b not in BAD_FILES:
+            warn("There is no corresponding file to '%s' in %s" \
+                 % (gooddir+"/"+f, baddir))
+            continue
+        if not filecmp.cmp(gooddir+"/"+f, b):
+            candidates.append(f)
+    if not candidates:
+        warn("All files in %s and %s have the same content" % (gooddir,
+                                                                baddir))
+        return
+
+    bisect(candidates, make_bisect_files_testfiles)
+
+def make_bisect_files_testfiles(subset, workdir):
+    return [(baddir if c in subset else gooddir) + "/" + c
+            for c in NO_PREFIX]
+
+def bisect_functions_in_file(base, goodfile, badfile):
+    functions = extract_functions(goodfile)
+    if len(functions) == 0:
+        warn("Couldn't find any function in %s, missing annotations?" % (goodfile,))
+        return
+    badfunctions = dict(extract_functions(badfile))
+    if len(badfunctions) == 0:
+        warn("Couldn't find any function in %s, missing annotations?" % (badfile,))
+        return
+
+    candidates = []
+    for (func,func_text) in functions:
+        if func not in badfunctions:
+            warn("Function '%s' missing from bad file" % func)
+        elif badfunctions[func] != func_text:
+            candidates.append(func)
+    if not candidates:
+        warn("All functions in %s and %s have the same content" % (goodfile,
+                                                                    badfile))
+        return
+
+    bisect(candidates, BisectFunctionsTestfiles(base, goodfile, badfunctions))
+
+class BisectFunctionsTestfiles(object):
+    """Write the good file with a subset of the functions taken from the bad
+    file, and return the files to link with it."""
+
+    def __init__(self, base, goodfile, badfunctions):
+        self.base = base
+        self.goodfile = goodfile
+        self.badfunctions = badfunctions
+
+    def __call__(self, subset, workdir):
+        combined = workdir + "/" + os.path.basename(self.base)
+        replace_functions(self.goodfile,
+                          dict((func, self.badfunctions[func])
+                               for func in subset), combined)
+        testfiles=[]
+        for c in NO_PREFIX:
+            if c == self.base:
+                testfiles.append(combined)
+                continue
+            testfiles.append(gooddir + "/" + c)
+        return testfiles
+
 parser = argparse.ArgumentParser()
 parser.add_argument('--a', dest='dir_a', default='before')
 parser.add_argument('--b', dest='dir_b', default='after')
 parser.add_argument('--insane', help='Skip sanity check', action='store_true')
+parser.add_argument('--bisect', action='store_true',
+                    help='Search for a minimal set of failing files or '
+                         'functions by bisection')
+parser.add_argument('-j', '--jobs', type=int, default=1,
+                    help='Number of link_test runs at once while bisecting')
 parser.add_argument('file', metavar='file', nargs='?')
 config = parser.parse_args()
 
@@ -228,7 +402,13 @@ if config.file is not None:
     # File exchange mode
     goodfile = gooddir+"/"+config.file
     badfile = baddir+"/"+config.file
-    check_functions_in_file(config.file, goodfile, badfile)
+    if config.bisect:
+        bisect_functions_in_file(config.file, goodfile, badfile)
+    else:
+        check_functions_in_file(config.file, goodfile, badfile)
 else:
     # Function exchange mode
-    check_files()
+    if config.bisect:
+        bisect_files()
+    else:
+        check_files()
@@ -47,6 +47,16 @@ class LitConfig(object):
         self.numErrors = 0
         self.numWarnings = 0
 
+        # The lit.discovery.DiscoveryCache used while discovering tests, if any.
+        self.discovery_cache = None
+
+        # The lit.ResultCache.ResultCache of passing tests, if any.
+        self.result_cache = None
+
+        # Whether to record the CPU time and peak memory of each test's
+        # processes as metrics of its result.
+        self.track_resources = False
+
         self.valgrindArgs = []
         if self.useValgrind:
             self.valgrindArgs = ['valgrind', '-q', '--run-libc-freeres=no',
@@ -98,6 +108,15 @@ class LitConfig(object):
         config.load_from_path(path, self)
         return config
 
+    def listDirectory(self, ts, path_in_suite):
+        """listDirectory(ts, path_in_suite) -> (files, dirs)
+
+        List a source directory of a test suite, going through the discovery
+        cache if one is in use."""
+        if self.discovery_cache is not None:
+            return self.discovery_cache.listDirectory(ts, path_in_suite)
+        return lit.util.listdir_entries(ts.getSourcePath(path_in_suite))
+
     def getBashPath(self):
         """getBashPath - Get the path to 'bash'"""
         if self.bashPath is not None:
@@ -0,0 +1,146 @@
+"""
+A cache of passing test results, keyed on the inputs of each test.
+"""
+
+from __future__ import absolute_import
+import hashlib
+import json
+import os
+
+import lit.ShUtil as ShUtil
+import lit.Test
+import lit.util
+
+class ResultCache(object):
+    """
+    ResultCache - Remember which tests passed with which inputs.
+
+    The key of a test hashes the test file, its RUN lines after substitution,
+    the configuration deciding whether it is expected to fail and the
+    contents of every file its commands name: the tools they run and any
+    existing input files. Files under the test's temporary directory are
+    outputs and are left out. A test whose key matches the one recorded for
+    its last PASS is not run again.
+    """
+
+    version = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.keys = {}
+        self._file_hashes = {}
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get('version') == self.version:
+                self.keys = data['tests']
+        except (IOError, OSError, ValueError, KeyError):
+            pass
+
+    def _hashFile(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamp = (st.st_size, st.st_mtime)
+        cached = self._file_hashes.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        h = hashlib.sha1()
+        try:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+        except (IOError, OSError):
+            return None
+        self._file_hashes[path] = (stamp, h.hexdigest())
+        return h.hexdigest()
+
+    def _namedFiles(self, cmd, cwd, path):
+        """Yield the files named by the commands in the parsed script cmd."""
+        if isinstance(cmd, ShUtil.Seq):
+            for name in self._namedFiles(cmd.lhs, cwd, path):
+                yield name
+            for name in self._namedFiles(cmd.rhs, cwd, path):
+                yield name
+            return
+        if isinstance(cmd, ShUtil.Pipeline):
+            for command in cmd.commands:
+                for name in self._namedFiles(command, cwd, path):
+                    yield name
+            return
+
+        if cmd.args:
+            tool = cmd.args[0]
+            if not os.path.dirname(tool):
+                tool = lit.util.which(tool, path)
+            if tool:
+                yield os.path.join(cwd, tool)
+        for arg in cmd.args[1:]:
+            yield os.path.join(cwd, arg)
+            # Also pick up files passed as '-option=file'.
+            if arg.startswith('-') and '=' in arg:
+                yield os.path.join(cwd, arg.split('=', 1)[1])
+        for op, filename in cmd.redirects:
+            if op[0] == '<':
+                yield os.path.join(cwd, filename)
+
+    def getKey(self, test, litConfig, script, tmpDir):
+        """
+        getKey(test, litConfig, script, tmpDir) -> key or None
+
+        Compute the key of a test with the given substituted script, or None
+        if its commands cannot be parsed.
+        """
+        h = hashlib.sha1()
+        def add(text):
+            if not isinstance(text, bytes):
+                text = lit.util.to_bytes(text)
+            h.update(text + b'\0')
+
+        add(self._hashFile(test.getSourcePath()) or '')
+        add(getattr(test.suite.config, 'target_triple', None) or '')
+        for feature in sorted(test.config.available_features):
+            add(feature)
+
+        cwd = os.path.dirname(test.getExecPath())
+        path = test.config.environment.get('PATH', '')
+        tmpDir = os.path.join(tmpDir, '')
+        seen = set()
+        for ln in script:
+            add(ln)
+            try:
+                cmd = ShUtil.ShParser(ln, litConfig.isWindows,
+                                      test.config.pipefail).parse()
+            except:
+                return None
+            for name in self._namedFiles(cmd, cwd, path):
+                name = os.path.normpath(name)
+                if name in seen or name.startswith(tmpDir):
+                    continue
+                seen.add(name)
+                if os.path.isfile(name):
+                    add(name)
+                    add(self._hashFile(name) or '')
+        return h.hexdigest()
+
+    def isCached(self, test, key):
+        return key is not None and self.keys.get(test.getFullName()) == key
+
+    def update(self, tests):
+        """update(tests) - Record the keys of the tests that passed."""
+        for test in tests:
+            if test.result is None:
+                continue
+            name = test.getFullName()
+            key = test.result.cache_key
+            if test.result.code == lit.Test.PASS and key is not None:
+                self.keys[name] = key
+            else:
+                self.keys.pop(name, None)
+
+    def save(self):
+        with open(self.path, 'w') as f:
+            json.dump({'version': self.version, 'tests': self.keys}, f,
+                      indent=2, sort_keys=True)
@@ -133,6 +133,8 @@ class Result(object):
         self.elapsed = elapsed
         # The metrics reported by this test.
         self.metrics = {}
+        # The key of the inputs the test ran with, if results are cached.
+        self.cache_key = None
 
     def addMetric(self, name, value):
         """
@@ -1,7 +1,9 @@
 from __future__ import absolute_import
+import mmap
 import os, signal, subprocess, sys
 import re
 import platform
+import shutil
 import tempfile
 import threading
 
@@ -110,6 +112,201 @@ class TimeoutHelper(object):
             self._procs = [] # Python2 doesn't have list.clear()
             self._doneKillPass = True
 
+class InProcessCommand(object):
+    """
+        Stand-in for the subprocess.Popen object of a pipeline stage that
+        _executeShCmd() ran as a builtin, without creating a process.
+    """
+    def __init__(self, exitCode, out, err):
+        self.stdout = None
+        self.stderr = None
+        self.returncode = exitCode
+        self._out = out
+        self._err = err
+
+    def communicate(self):
+        return self._out, self._err
+
+    def wait(self):
+        return self.returncode
+
+def _toBytes(s):
+    if isinstance(s, bytes):
+        return s
+    return to_bytes(s)
+
+def _splitFlags(args, allowed):
+    """
+        Split the leading single-dash flags of args into a set of letters,
+        returning (flags, operands), or None if a flag outside allowed is
+        used, in which case the external command should be run instead.
+    """
+    flags = set()
+    for i, arg in enumerate(args):
+        if arg == '--':
+            return flags, args[i + 1:]
+        if not arg.startswith('-') or arg == '-':
+            return flags, args[i:]
+        if not set(arg[1:]) <= set(allowed):
+            return None
+        flags.update(arg[1:])
+    return flags, []
+
+def _builtinEcho(args, cwd, readStdin):
+    parsed = _splitFlags(args[1:], 'n')
+    if parsed is None:
+        return None
+    flags, operands = parsed
+    out = _toBytes(' '.join(operands))
+    if 'n' not in flags:
+        out += b'\n'
+    return 0, out, b''
+
+def _builtinMkdir(args, cwd, readStdin):
+    parsed = _splitFlags(args[1:], 'p')
+    if parsed is None:
+        return None
+    flags, operands = parsed
+    err = b''
+    exitCode = 0
+    for dir in operands:
+        dir = os.path.join(cwd, dir)
+        try:
+            if 'p' in flags:
+                lit.util.mkdir_p(dir)
+            else:
+                os.mkdir(dir)
+        except OSError as e:
+            err += _toBytes("mkdir: cannot create directory '%s': %s\n" %
+                            (dir, e.strerror))
+            exitCode = 1
+    return exitCode, b'', err
+
+def _builtinRm(args, cwd, readStdin):
+    parsed = _splitFlags(args[1:], 'frR')
+    if parsed is None:
+        return None
+    flags, operands = parsed
+    force = 'f' in flags
+    recursive = 'r' in flags or 'R' in flags
+    err = b''
+    exitCode = 0
+    for path in operands:
+        path = os.path.join(cwd, path)
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                if not recursive:
+                    err += _toBytes("rm: cannot remove '%s': Is a directory\n"
+                                    % path)
+                    exitCode = 1
+                    continue
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+        except OSError as e:
+            if force and not os.path.lexists(path):
+                continue
+            err += _toBytes("rm: cannot remove '%s': %s\n" % (path, e.strerror))
+            exitCode = 1
+    return exitCode, b'', err
+
+def _builtinCat(args, cwd, readStdin):
+    if any(arg.startswith('-') and arg != '-' for arg in args[1:]):
+        return None
+    out = b''
+    err = b''
+    exitCode = 0
+    for filename in args[1:] or ['-']:
+        if filename == '-':
+            out += readStdin()
+            continue
+        try:
+            with open(os.path.join(cwd, filename), 'rb') as f:
+                out += f.read()
+        except IOError as e:
+            err += _toBytes('cat: %s: %s\n' % (filename, e.strerror))
+            exitCode = 1
+    return exitCode, out, err
+
+def _builtinDiff(args, cwd, readStdin):
+    # Only the common case of two identical files is answered here. Anything
+    # else runs the real diff, so that its output and exit code are exactly
+    # those of the tool.
+    if len(args) != 3 or any(arg.startswith('-') for arg in args[1:]):
+        return None
+    contents = []
+    for filename in args[1:]:
+        path = os.path.join(cwd, filename)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                contents.append(f.read())
+        except IOError:
+            return None
+    if contents[0] != contents[1]:
+        return None
+    return 0, b'', b''
+
+# Commands run inside the internal shell rather than as processes. Each takes
+# (args, cwd, readStdin) and returns (exit code, stdout, stderr) as bytes, or
+# None if it does not support the given arguments.
+kShBuiltins = {
+    'cat' : _builtinCat,
+    'diff' : _builtinDiff,
+    'echo' : _builtinEcho,
+    'mkdir' : _builtinMkdir,
+    'rm' : _builtinRm,
+}
+
+def _executeBuiltin(args, redirects, input, shenv, opened_files):
+    """
+        Run a pipeline stage with arguments args as a builtin, with the
+        redirections parsed by _executeShCmd(). Returns an InProcessCommand and the file to feed to
+        the next stage, or None if the builtin does not support args.
+    """
+    def readStdin():
+        r = redirects[0]
+        if r == (0,):
+            if input == subprocess.PIPE:
+                return b''
+            return input.read()
+        with open(os.path.join(shenv.cwd, r[0]), 'rb') as f:
+            return f.read()
+
+    res = kShBuiltins[args[0]](args, shenv.cwd, readStdin)
+    if res is None:
+        return None
+    exitCode, out, err = res
+
+    def write(r, data):
+        if r[0] == '/dev/null':
+            return
+        if r[2] is None:
+            r[2] = open(os.path.join(shenv.cwd, r[0]), r[1] + 'b')
+            opened_files.append(r[2])
+        r[2].write(data)
+
+    # Route stdout, then stderr, which may be sent after it with 2>&1.
+    if redirects[1] != (1,):
+        write(redirects[1], out)
+        out = b''
+    if redirects[2] == (1,):
+        out += err
+        err = b''
+    elif redirects[2] != (2,):
+        write(redirects[2], err)
+        err = b''
+
+    # Hand the output to the next stage in a temporary file.
+    stdout = None
+    if redirects[1] == (1,):
+        stdout = tempfile.TemporaryFile(mode='w+b')
+        stdout.write(out)
+        stdout.seek(0)
+        opened_files.append(stdout)
+    return InProcessCommand(exitCode, out, err), stdout
+
 def executeShCmd(cmd, shenv, results, timeout=0):
     """
         Wrapper around _executeShCmd that handles
@@ -177,6 +374,7 @@ def _executeShCmd(cmd, shenv, results, timeoutHelper):
         return 0
 
     procs = []
+    negations = []
     input = subprocess.PIPE
     stderrTempFiles = []
     opened_files = []
@@ -202,6 +400,14 @@ def _executeShCmd(cmd, shenv, results, timeoutHelper):
                 cmd_shenv.env[key] = val
             j.args = j.args[arg_idx+1:]
 
+        # Run 'not' in the shell itself, by inverting the exit code of the
+        # command it wraps. 'not --crash' is left to the real tool.
+        args = list(j.args)
+        negations.append(0)
+        while len(args) > 1 and args[0] == 'not' and args[1] != '--crash':
+            args = args[1:]
+            negations[-1] += 1
+
         # Apply the redirections, we use (N,) as a sentinel to indicate stdin,
         # stdout, stderr for N equal to 0, 1, or 2 respectively. Redirects to or
         # from a file are represented with a list [file, mode, file-object]
@@ -225,6 +431,16 @@ def _executeShCmd(cmd, shenv, results, timeoutHelper):
             else:
                 raise InternalShellError(j,"Unsupported redirect: %r" % (r,))
 
+        # Run builtins without creating a process.
+        if args[0] in kShBuiltins:
+            builtin = _executeBuiltin(args, redirects, input, cmd_shenv,
+                                      opened_files)
+            if builtin is not None:
+                proc, output = builtin
+                procs.append(proc)
+                input = output or subprocess.PIPE
+                continue
+
         # Map from the final redirections to something subprocess can handle.
         final_redirects = []
         for index,r in enumerate(redirects):
@@ -281,7 +497,6 @@ def _executeShCmd(cmd, shenv, results, timeoutHelper):
                 stderrTempFiles.append((i, stderr))
 
         # Resolve the executable path ourselves.
-        args = list(j.args)
         executable = None
         # For paths relative to cwd, use the cwd of the shell environment.
         if args[0].startswith('.'):
@@ -337,9 +552,15 @@ def _executeShCmd(cmd, shenv, results, timeoutHelper):
 
     # FIXME: There is probably still deadlock potential here. Yawn.
     procData = [None] * len(procs)
-    procData[-1] = procs[-1].communicate()
+    if isinstance(procs[-1], InProcessCommand):
+        procData[-1] = procs[-1].communicate()
+    else:
+        procData[-1] = lit.util.readOutput(procs[-1])
 
     for i in range(len(procs) - 1):
+        if isinstance(procs[i], InProcessCommand):
+            procData[i] = procs[i].communicate()
+            continue
         if procs[i].stdout is not None:
             out = procs[i].stdout.read()
         else:
@@ -362,10 +583,14 @@ def _executeShCmd(cmd, shenv, results, timeoutHelper):
 
     exitCode = None
     for i,(out,err) in enumerate(procData):
-        res = procs[i].wait()
+        res = lit.util.trackedWait(procs[i])
         # Detect Ctrl-C in subprocess.
         if res == -signal.SIGINT:
             raise KeyboardInterrupt
+        # Apply any 'not' run in the shell: it fails if the command succeeded
+        # or crashed.
+        for _ in range(negations[i]):
+            res = int(res <= 0)
 
         # Ensure the resulting output is always of string type.
         try:
@@ -476,57 +701,104 @@ def executeScript(test, litConfig, tmpBase, commands, cwd):
     except lit.util.ExecuteCommandTimeoutException as e:
         return (e.out, e.err, e.exitCode, e.msg)
 
-def parseIntegratedTestScriptCommands(source_path, keywords):
+def _countLines(data, start, end):
+    """Return the number of newlines in data[start:end], without copying it."""
+    newline = to_bytes('\n')
+    if isinstance(data, bytes):
+        return data.count(newline, start, end)
+    # mmap objects have no count(). They are only scanned with a cutoff, which
+    # keeps the gaps between commands short.
+    count = 0
+    pos = data.find(newline, start, end)
+    while pos >= 0:
+        count += 1
+        pos = data.find(newline, pos + 1, end)
+    return count
+
+def _skipLines(data, pos, count):
+    """Return the position count lines after pos in data."""
+    for i in range(count):
+        pos = data.find(to_bytes('\n'), pos)
+        if pos < 0:
+            return len(data)
+        pos += 1
+    return pos
+
+def _scanIntegratedTestScript(data, keywords, scan_lines):
+    keywords_re = re.compile(
+        to_bytes("(%s)(.*)(?:\n|\Z)" % ("|".join(k for k in keywords),)))
+
+    line_number = 1
+    pos = 0
+    last_match_position = 0
+    while True:
+        # Only look for the next command within scan_lines lines of the last
+        # one, if requested.
+        end = len(data)
+        if scan_lines is not None:
+            end = _skipLines(data, pos, scan_lines)
+        match = keywords_re.search(data, pos, end)
+        if match is None:
+            break
+        pos = match.end()
+
+        # Compute the updated line number by counting the intervening
+        # newlines.
+        match_position = match.start()
+        line_number += _countLines(data, last_match_position, match_position)
+        last_match_position = match_position
+
+        # Convert the keyword and line to UTF-8 strings and yield the
+        # command. Note that we take care to return regular strings in
+        # Python 2, to avoid other code having to differentiate between the
+        # str and unicode types.
+        keyword,ln = match.groups()
+        yield (line_number, to_string(keyword[:-1].decode('utf-8')),
+               to_string(ln.decode('utf-8')))
+
+def parseIntegratedTestScriptCommands(source_path, keywords, scan_lines=None):
     """
-    parseIntegratedTestScriptCommands(source_path) -> commands
+    parseIntegratedTestScriptCommands(source_path, keywords, [scan_lines])
+      -> commands
 
     Parse the commands in an integrated test script file into a list of
     (line_number, command_type, line).
+
+    If scan_lines is not None, the rest of the file is ignored once scan_lines
+    lines in a row hold no command, so that large inputs with their commands
+    at the top are not read in full.
     """
 
     # This code is carefully written to be dual compatible with Python 2.5+ and
     # Python 3 without requiring input files to always have valid codings. The
-    # trick we use is to open the file in binary mode and use the regular
-    # expression library to find the commands, with it scanning strings in
-    # Python2 and bytes in Python3.
+    # trick we use is to read or map the file in binary mode and use the
+    # regular expression library to find the commands, with it scanning
+    # strings in Python2 and bytes in Python3.
     #
     # Once we find a match, we do require each script line to be decodable to
     # UTF-8, so we convert the outputs to UTF-8 before returning. This way the
     # remaining code can work with "strings" agnostic of the executing Python
     # version.
 
-    keywords_re = re.compile(
-        to_bytes("(%s)(.*)\n" % ("|".join(k for k in keywords),)))
-
+    commands = []
     f = open(source_path, 'rb')
     try:
-        # Read the entire file contents.
-        data = f.read()
-
-        # Ensure the data ends with a newline.
-        if not data.endswith(to_bytes('\n')):
-            data = data + to_bytes('\n')
-
-        # Iterate over the matches.
-        line_number = 1
-        last_match_position = 0
-        for match in keywords_re.finditer(data):
-            # Compute the updated line number by counting the intervening
-            # newlines.
-            match_position = match.start()
-            line_number += data.count(to_bytes('\n'), last_match_position,
-                                      match_position)
-            last_match_position = match_position
-
-            # Convert the keyword and line to UTF-8 strings and yield the
-            # command. Note that we take care to return regular strings in
-            # Python 2, to avoid other code having to differentiate between the
-            # str and unicode types.
-            keyword,ln = match.groups()
-            yield (line_number, to_string(keyword[:-1].decode('utf-8')),
-                   to_string(ln.decode('utf-8')))
+        if scan_lines is None:
+            # The whole file is scanned, so read it at once and let
+            # _countLines() count in C.
+            commands = list(_scanIntegratedTestScript(f.read(), keywords,
+                                                      scan_lines))
+        elif os.fstat(f.fileno()).st_size:
+            # Empty files cannot be mapped, and have no commands.
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                commands = list(_scanIntegratedTestScript(data, keywords,
+                                                          scan_lines))
+            finally:
+                data.close()
     finally:
         f.close()
+    return iter(commands)
 
 def getTempPaths(test):
     """Get the temporary location, this is always relative to the test suite
@@ -600,8 +872,12 @@ def parseIntegratedTestScript(test, require_script=True):
     requires = []
     unsupported = []
     keywords = ['RUN:', 'XFAIL:', 'REQUIRES:', 'UNSUPPORTED:', 'END.']
+    scan_lines = None
+    if hasattr(test.config, 'test_script_scan_lines'):
+        scan_lines = test.config.test_script_scan_lines
     for line_number, command_type, ln in \
-            parseIntegratedTestScriptCommands(sourcepath, keywords):
+            parseIntegratedTestScriptCommands(sourcepath, keywords,
+                                              scan_lines):
         if command_type == 'RUN':
             # Trim trailing whitespace.
             ln = ln.rstrip()
@@ -730,6 +1006,16 @@ def executeShTest(test, litConfig, useExternalSh,
                                              normalize_slashes=useExternalSh)
     script = applySubstitutions(script, substitutions)
 
+    # Skip the test if it passed last time with the same inputs.
+    cache_key = None
+    if litConfig.result_cache is not None:
+        cache_key = litConfig.result_cache.getKey(test, litConfig, script,
+                                                  tmpDir)
+        if litConfig.result_cache.isCached(test, cache_key):
+            res = lit.Test.Result(Test.PASS, 'Result reused from the cache.\n')
+            res.cache_key = cache_key
+            return res
+
     # Re-run failed tests up to test_retry_attempts times.
     attempts = 1
     if hasattr(test.config, 'test_retry_attempts'):
@@ -742,4 +1028,5 @@ def executeShTest(test, litConfig, useExternalSh,
     # will be printed separately in the test summary.
     if i > 0 and res.code == Test.PASS:
         res.code = Test.FLAKYPASS
+    res.cache_key = cache_key
     return res
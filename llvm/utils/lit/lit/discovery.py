@@ -3,13 +3,102 @@ Test discovery functions.
 """
 
 import copy
+import json
 import os
 import sys
+import time
 
 import lit.run
+import lit.util
 from lit.TestingConfig import TestingConfig
 from lit import LitConfig, Test
 
+class DiscoveryCache(object):
+    """
+    An on-disk cache of the directory listings made during test discovery.
+
+    The listings of a test suite's source directories are kept in
+    <exec_root>/Output/lit-discovery-cache.json and reused for as long as the
+    mtime of the directory is unchanged, which holds until an entry is added,
+    removed or renamed. Configuration files are still loaded on every run, so
+    everything they decide, including the suffixes and excludes applied to
+    the listings, is always current.
+    """
+
+    version = 1
+    filename = 'lit-discovery-cache.json'
+
+    # Listings of directories modified this recently are not saved, since a
+    # later change within the same mtime tick would go unnoticed.
+    racy_window = 2.0
+
+    def __init__(self, rebuild=False):
+        self.rebuild = rebuild
+        self.start_time = time.time()
+        # Map of exec root to [{source root: {key: entry}}, dirty].
+        self.files = {}
+
+    def getPath(self, exec_root):
+        return os.path.join(exec_root, 'Output', self.filename)
+
+    def getEntries(self, ts):
+        data = self.files.get(ts.exec_root)
+        if data is None:
+            roots = {}
+            if not self.rebuild:
+                try:
+                    with open(self.getPath(ts.exec_root)) as f:
+                        contents = json.load(f)
+                    if contents.get('version') == self.version:
+                        roots = contents['roots']
+                except (IOError, OSError, ValueError, KeyError):
+                    pass
+            data = self.files[ts.exec_root] = [roots, False]
+        return data[0].setdefault(ts.source_root, {}), data
+
+    def listDirectory(self, ts, path_in_suite):
+        """listDirectory(ts, path_in_suite) -> (files, dirs)"""
+        entries, data = self.getEntries(ts)
+        source_path = ts.getSourcePath(path_in_suite)
+        key = '/'.join(path_in_suite)
+        mtime = os.stat(source_path).st_mtime
+
+        entry = entries.get(key)
+        if entry is not None and entry[0] == mtime:
+            # The json module reads the names back as unicode on Python 2.
+            return ([lit.util.to_string(name) for name in entry[1]],
+                    [lit.util.to_string(name) for name in entry[2]])
+
+        files, dirs = lit.util.listdir_entries(source_path)
+        if mtime < self.start_time - self.racy_window:
+            entries[key] = [mtime, files, dirs]
+            data[1] = True
+        elif entry is not None:
+            del entries[key]
+            data[1] = True
+        return files, dirs
+
+    def save(self):
+        """save() - Write back the listings of every test suite that changed.
+
+        Failures are ignored, an unwritable exec root just goes uncached."""
+        for exec_root, (roots, dirty) in self.files.items():
+            if not dirty:
+                continue
+            path = self.getPath(exec_root)
+            temp = '%s.%d' % (path, os.getpid())
+            try:
+                lit.util.mkdir_p(os.path.dirname(path))
+                with open(temp, 'w') as f:
+                    json.dump({'version': self.version, 'roots': roots}, f)
+                # Replace the cache atomically, in case another lit is
+                # discovering the same suite.
+                if os.name == 'nt' and os.path.exists(path):
+                    os.remove(path)
+                os.rename(temp, path)
+            except (IOError, OSError, ValueError):
+                pass
+
 def dirContainsTestSuite(path, lit_config):
     cfgpath = os.path.join(path, lit_config.site_config_name)
     if os.path.exists(cfgpath):
@@ -145,15 +234,13 @@ def getTestsInSuite(ts, path_in_suite, litConfig,
             yield res
 
     # Search subdirectories.
-    for filename in os.listdir(source_path):
+    _,subdirs = litConfig.listDirectory(ts, path_in_suite)
+    for filename in subdirs:
         # FIXME: This doesn't belong here?
         if filename in ('Output', '.svn', '.git') or filename in lc.excludes:
             continue
 
-        # Ignore non-directories.
         file_sourcepath = os.path.join(source_path, filename)
-        if not os.path.isdir(file_sourcepath):
-            continue
 
         # Check for nested test suites, first in the execpath in case there is a
         # site configuration and then in the source path.
@@ -189,12 +276,13 @@ def getTestsInSuite(ts, path_in_suite, litConfig,
         if sub_ts and not N:
             litConfig.warning('test suite %r contained no tests' % sub_ts.name)
 
-def find_tests_for_inputs(lit_config, inputs):
+def find_tests_for_inputs(lit_config, inputs, discovery_cache=None):
     """
-    find_tests_for_inputs(lit_config, inputs) -> [Test]
+    find_tests_for_inputs(lit_config, inputs, [discovery_cache]) -> [Test]
 
     Given a configuration object and a list of input specifiers, find all the
-    tests to execute.
+    tests to execute. If a DiscoveryCache is given, directory listings go
+    through it and it is saved once discovery finishes.
     """
 
     # Expand '@...' form in inputs.
@@ -216,12 +304,18 @@ def find_tests_for_inputs(lit_config, inputs):
     tests = []
     test_suite_cache = {}
     local_config_cache = {}
-    for input in actual_inputs:
-        prev = len(tests)
-        tests.extend(getTests(input, lit_config,
-                              test_suite_cache, local_config_cache)[1])
-        if prev == len(tests):
-            lit_config.warning('input %r contained no tests' % input)
+    lit_config.discovery_cache = discovery_cache
+    try:
+        for input in actual_inputs:
+            prev = len(tests)
+            tests.extend(getTests(input, lit_config,
+                                  test_suite_cache, local_config_cache)[1])
+            if prev == len(tests):
+                lit_config.warning('input %r contained no tests' % input)
+    finally:
+        lit_config.discovery_cache = None
+    if discovery_cache is not None and not lit_config.numErrors:
+        discovery_cache.save()
 
     # If there were any errors during test discovery, exit now.
     if lit_config.numErrors:
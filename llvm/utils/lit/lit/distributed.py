@@ -0,0 +1,271 @@
+"""
+Sharded and distributed test execution.
+
+A coordinator hands out the tests of a run, one at a time, to workers that
+connect to it over TCP, and merges their results back into the run. Each
+worker discovers the same test suites itself and runs the tests it is sent
+by their full name. Messages are single lines of JSON in both directions:
+the coordinator sends {"test": name} or {"done": true}, and the worker
+answers each test with {"result": ...}. A test is handed out again if its
+worker disconnects or answers with a malformed message, up to
+Coordinator.max_attempts times in all.
+
+The protocol has no authentication, so coordinators should only listen on
+trusted networks.
+"""
+
+from __future__ import absolute_import
+import collections
+import hashlib
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import lit.Test
+import lit.util
+
+def select_shard(tests, num_shards, run_shard):
+    """
+    select_shard(tests, num_shards, run_shard) -> [Test]
+
+    Return the tests in shard run_shard, counting from 1, of num_shards. Each
+    test is assigned to a shard by a hash of its full name, so the shards do
+    not depend on which other tests were selected or on their order.
+    """
+    selected = []
+    for test in tests:
+        name = lit.util.to_bytes(test.getFullName())
+        if int(hashlib.md5(name).hexdigest(), 16) % num_shards == run_shard - 1:
+            selected.append(test)
+    return selected
+
+def parse_address(address):
+    """parse_address('host:port') -> (host, port)"""
+    host, _, port = address.rpartition(':')
+    return host or 'localhost', int(port)
+
+def encode_result(result):
+    metrics = dict((name, value.todata())
+                   for name, value in result.metrics.items())
+    output = result.output
+    if isinstance(output, bytes):
+        # Python 2 output is not guaranteed to be valid UTF-8.
+        output = output.decode('utf-8', 'replace')
+    return {'code': result.code.name,
+            'is_failure': result.code.isFailure,
+            'output': output,
+            'elapsed': result.elapsed,
+            'metrics': metrics,
+            'cache_key': result.cache_key}
+
+def decode_result(data):
+    # The json module reads strings back as unicode on Python 2.
+    code = lit.Test.ResultCode(lit.util.to_string(data['code']),
+                               data['is_failure'])
+    result = lit.Test.Result(code, lit.util.to_string(data['output']),
+                             data['elapsed'])
+    for name, value in data['metrics'].items():
+        result.addMetric(name, lit.Test.toMetricValue(value))
+    if data.get('cache_key') is not None:
+        result.cache_key = lit.util.to_string(data['cache_key'])
+    return result
+
+def send_message(sock, message):
+    sock.sendall(lit.util.to_bytes(json.dumps(message) + '\n'))
+
+def read_message(reader):
+    line = reader.readline()
+    if not line:
+        return None
+    return json.loads(lit.util.convert_string(line))
+
+class Coordinator(object):
+    """
+    Coordinator - Serve the tests of a run to remote workers.
+
+    Tests are handed out in the run order. A test whose worker disconnects
+    before answering, or answers with a malformed message, is handed out
+    again, unless it has been handed out max_attempts times already. It is
+    then given an UNRESOLVED result, so that a test which crashes every
+    worker it is sent to cannot keep the run going forever.
+    """
+
+    max_attempts = 3
+
+    def __init__(self, run, display, address):
+        self.run = run
+        self.display = display
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(address)
+        self.server.listen(16)
+        self.address = self.server.getsockname()
+
+        self.cond = threading.Condition()
+        self.pending = collections.deque(range(len(run.tests)))
+        self.attempts = [0] * len(run.tests)
+        self.remaining = len(run.tests)
+
+    def take(self):
+        """Wait for a test to hand out, or return None once all are done."""
+        with self.cond:
+            while not self.pending and self.remaining:
+                self.cond.wait()
+            if not self.remaining:
+                return None
+            index = self.pending.popleft()
+            self.attempts[index] += 1
+            return index
+
+    def requeue(self, index):
+        with self.cond:
+            attempts = self.attempts[index]
+            if attempts < self.max_attempts:
+                self.pending.appendleft(index)
+                self.cond.notify()
+                return
+        self.complete(index, lit.Test.Result(
+                lit.Test.UNRESOLVED,
+                'The test was handed out %d times without a worker '
+                'answering.\n' % attempts, 0.0))
+
+    def complete(self, index, result):
+        with self.cond:
+            test = self.run.tests[index]
+            if test.result is not None or not self.remaining:
+                return
+            test.result = result
+            self.display.update(test)
+            self.remaining -= 1
+            if not self.remaining:
+                self.cond.notify_all()
+
+    def handle(self, conn):
+        reader = conn.makefile('rb')
+        try:
+            while True:
+                index = self.take()
+                if index is None:
+                    send_message(conn, {'done': True})
+                    break
+                try:
+                    send_message(conn, {'test':
+                                        self.run.tests[index].getFullName()})
+                    result = decode_result(read_message(reader)['result'])
+                except (socket.error, ValueError, KeyError, TypeError,
+                        AttributeError):
+                    # Lost, or not a worker this coordinator understands.
+                    self.requeue(index)
+                    break
+                self.complete(index, result)
+        except socket.error:
+            pass
+        finally:
+            reader.close()
+            conn.close()
+
+    def accept(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except socket.error:
+                # The server socket was closed.
+                break
+            t = threading.Thread(target=self.handle, args=(conn,))
+            t.daemon = True
+            t.start()
+
+    def serve(self, max_time=None, workers=[]):
+        """
+        serve([max_time], [workers])
+
+        Hand out tests until each has a result, max_time seconds have passed
+        or all of the given worker processes have exited. Tests left without
+        a result are given an UNRESOLVED result.
+        """
+        acceptor = threading.Thread(target=self.accept)
+        acceptor.daemon = True
+        acceptor.start()
+
+        deadline = None
+        if max_time:
+            deadline = time.time() + max_time
+        with self.cond:
+            while self.remaining:
+                if workers and all(w.poll() is not None for w in workers):
+                    break
+                timeout = 0.1
+                if deadline is not None:
+                    timeout = min(timeout, deadline - time.time())
+                    if timeout <= 0:
+                        break
+                self.cond.wait(timeout)
+            # Stop handing out tests.
+            self.remaining = 0
+            self.cond.notify_all()
+        self.server.close()
+
+        for test in self.run.tests:
+            if test.result is None:
+                test.setResult(lit.Test.Result(lit.Test.UNRESOLVED, '', 0.0))
+
+def run_worker_connection(run, tests, address):
+    try:
+        sock = socket.create_connection(address)
+    except socket.error as e:
+        run.lit_config.warning('unable to connect to the coordinator at '
+                               '%s:%d: %s' % (address[0], address[1], e))
+        return
+    reader = sock.makefile('rb')
+    try:
+        while True:
+            message = read_message(reader)
+            if message is None or message.get('done'):
+                break
+            name = message['test']
+            test = tests.get(name)
+            if test is None:
+                result = lit.Test.Result(lit.Test.UNRESOLVED,
+                                         'Test %r was not found by the worker '
+                                         'that was sent it.\n' % name, 0.0)
+            else:
+                # A test may be sent again after a connection is lost.
+                test.result = None
+                run.execute_test(test)
+                result = test.result
+            send_message(sock, {'result': encode_result(result)})
+    except socket.error:
+        # The coordinator stopped, for example after reaching --max-time.
+        pass
+    finally:
+        reader.close()
+        sock.close()
+
+def run_worker(run, address, jobs):
+    """
+    run_worker(run, address, jobs)
+
+    Run tests sent by the coordinator at address over jobs connections, until
+    it has none left.
+    """
+    tests = dict((test.getFullName(), test) for test in run.tests)
+    threads = [threading.Thread(target=run_worker_connection,
+                                args=(run, tests, address))
+               for i in range(jobs)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+def start_local_workers(count, address, args):
+    """
+    start_local_workers(count, address, args) -> [Popen]
+
+    Start count lit processes on this machine working for the coordinator at
+    address, passing them the extra arguments args.
+    """
+    command = [sys.executable, sys.argv[0], '--worker=%s:%d' % address]
+    return [subprocess.Popen(command + list(args)) for i in range(count)]
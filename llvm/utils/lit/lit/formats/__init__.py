@@ -2,3 +2,4 @@ from __future__ import absolute_import
 from lit.formats.base import TestFormat, FileBasedTest, OneCommandPerFileTest
 from lit.formats.googletest import GoogleTest
 from lit.formats.shtest import ShTest
+from lit.formats.vscpu import VSCPUTest
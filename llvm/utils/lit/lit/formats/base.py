@@ -13,19 +13,17 @@ class TestFormat(object):
 class FileBasedTest(TestFormat):
     def getTestsInDirectory(self, testSuite, path_in_suite,
                             litConfig, localConfig):
-        source_path = testSuite.getSourcePath(path_in_suite)
-        for filename in os.listdir(source_path):
+        files,_ = litConfig.listDirectory(testSuite, path_in_suite)
+        for filename in files:
             # Ignore dot files and excluded tests.
             if (filename.startswith('.') or
                 filename in localConfig.excludes):
                 continue
 
-            filepath = os.path.join(source_path, filename)
-            if not os.path.isdir(filepath):
-                base,ext = os.path.splitext(filename)
-                if ext in localConfig.suffixes:
-                    yield lit.Test.Test(testSuite, path_in_suite + (filename,),
-                                        localConfig)
+            base,ext = os.path.splitext(filename)
+            if ext in localConfig.suffixes:
+                yield lit.Test.Test(testSuite, path_in_suite + (filename,),
+                                    localConfig)
 
 ###
 
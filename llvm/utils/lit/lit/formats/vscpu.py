@@ -0,0 +1,195 @@
+from __future__ import absolute_import
+import json
+import os
+import sys
+import threading
+import time
+
+import lit.Test
+import lit.TestRunner
+import lit.util
+from .base import FileBasedTest
+
+class _Log(object):
+    """Collect what the VSCPU tools print, to report it in the result."""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, text):
+        self.parts.append(text)
+
+    def getvalue(self):
+        return ''.join(self.parts)
+
+class VSCPUTest(FileBasedTest):
+    """
+    Test format for the VerySimpleCPU end-to-end suite.
+
+    Each source file is compiled to Sparc assembly with clang and llc, turned
+    into VSCPU code by cleaner.py and run on the vscpu.py simulator. The
+    cleaner and the simulator are imported from tools_dir and run in-process.
+    The final memory is checked against a find.json-style expectations file,
+    a list of {"name": ..., "match": [...], "no_match": [...]} entries where
+    the base name of "name" selects the test.
+
+    If asm_dir is given, precompiled assembly <asm_dir>/<test>.s is used
+    instead of invoking clang and llc.
+    """
+
+    # cleaner.py keeps its label tables in module globals.
+    _clean_lock = threading.Lock()
+
+    def __init__(self, tools_dir, expectations=None, asm_dir=None,
+                 clang='clang', llc='llc', max_steps=1000000):
+        self.tools_dir = str(tools_dir)
+        self.expectations = expectations
+        self.asm_dir = asm_dir
+        self.clang = clang
+        self.llc = llc
+        self.max_steps = max_steps
+        self._modules = None
+        self._cases = None
+
+    def getModules(self):
+        if self._modules is None:
+            if self.tools_dir not in sys.path:
+                sys.path.insert(0, self.tools_dir)
+            import cleaner
+            import check_outs
+            import vscpu
+            self._modules = (cleaner, check_outs, vscpu)
+        return self._modules
+
+    def getExpectations(self, name):
+        if self.expectations is None:
+            return None
+        if self._cases is None:
+            with open(self.expectations) as f:
+                cases = json.load(f)
+            self._cases = {}
+            for case in cases:
+                base = os.path.basename(case['name'])
+                self._cases[os.path.splitext(base)[0]] = case
+        return self._cases.get(name)
+
+    def compile(self, test, tmpBase, litConfig):
+        """compile(test, tmpBase, litConfig) -> (path to assembly, error)"""
+        name = os.path.splitext(os.path.basename(test.getSourcePath()))[0]
+        if self.asm_dir is not None:
+            return os.path.join(self.asm_dir, name + '.s'), None
+
+        ll = tmpBase + '.ll'
+        asm = tmpBase + '.s'
+        for cmd in ([self.clang, '-S', '-emit-llvm', test.getSourcePath(),
+                     '-o', ll],
+                    [self.llc, ll, '-march=sparc', '-o', asm]):
+            out, err, exitCode = lit.util.executeCommand(
+                cmd, env=test.config.environment,
+                timeout=litConfig.maxIndividualTestTime)
+            if exitCode:
+                return None, 'Command: %s\n%s%s' % (' '.join(cmd), out, err)
+        return asm, None
+
+    def simulate(self, vscpu, asm, tmpBase, litConfig):
+        """simulate(...) -> (cpu, None), or (None, error) if asm is invalid"""
+        memin = tmpBase + '.in'
+        log = _Log()
+        try:
+            vscpu.memgen(asm, memin, log)
+        except SystemExit:
+            return None, log.getvalue()
+        cpu = vscpu.CpuState()
+        cpu.quiet = True
+        cpu.timing = vscpu.TimingModel()
+        cpu.readmem(memin)
+
+        deadline = None
+        if litConfig.maxIndividualTestTime > 0:
+            deadline = time.time() + litConfig.maxIndividualTestTime
+        while not cpu.pause:
+            if cpu.steps >= self.max_steps:
+                break
+            if deadline is not None and cpu.steps % 1024 == 0 and \
+                    time.time() > deadline:
+                break
+            cpu.execute()
+        return cpu, None
+
+    def execute(self, test, litConfig):
+        if test.config.unsupported:
+            return lit.Test.UNSUPPORTED, 'Test is unsupported'
+        if litConfig.noExecute:
+            return lit.Test.PASS, ''
+
+        try:
+            cleaner, check_outs, vscpu = self.getModules()
+        except SyntaxError as e:
+            return (lit.Test.UNRESOLVED,
+                    'Unable to import the VSCPU tools from %r with this '
+                    'Python: %s' % (self.tools_dir, e))
+
+        tmpDir, tmpBase = lit.TestRunner.getTempPaths(test)
+        lit.util.mkdir_p(tmpDir)
+        name = os.path.splitext(os.path.basename(test.getSourcePath()))[0]
+
+        try:
+            asm, error = self.compile(test, tmpBase, litConfig)
+        except lit.util.ExecuteCommandTimeoutException:
+            return (lit.Test.TIMEOUT,
+                    'Reached timeout of {} seconds'.format(
+                        litConfig.maxIndividualTestTime))
+        if error is not None:
+            return lit.Test.FAIL, error
+
+        with open(asm) as f:
+            lines = f.read().splitlines()
+        with self._clean_lock:
+            lines = cleaner.clean(lines)
+        program = tmpBase + '.asm'
+        with open(program, 'w') as f:
+            for line in lines:
+                f.write(line + '\n')
+
+        try:
+            cpu, error = self.simulate(vscpu, program, tmpBase, litConfig)
+        except (SystemExit, IndexError) as e:
+            return (lit.Test.FAIL,
+                    'Simulation of %s failed: %r\n' % (program, e))
+        if error is not None:
+            return (lit.Test.FAIL,
+                    'Unable to load %s into memory:\n%s' % (program, error))
+        if not cpu.pause:
+            if cpu.steps >= self.max_steps:
+                return (lit.Test.FAIL,
+                        'Program did not halt within %d steps\n' %
+                        self.max_steps)
+            return (lit.Test.TIMEOUT,
+                    'Reached timeout of {} seconds'.format(
+                        litConfig.maxIndividualTestTime))
+
+        memory = ['%d: %d' % (idx, cpu.mem[idx])
+                  for idx in range(vscpu.MEMSIZE) if cpu.modified[idx]]
+        output = ''
+        code = lit.Test.PASS
+        case = self.getExpectations(name)
+        if case is not None:
+            case = {'match': case.get('match', []),
+                    'no_match': case.get('no_match', [])}
+            stack = check_outs.get_memory(memory)
+            case = check_outs.find_matches(case, stack)
+            case = check_outs.find_unmatches(case, stack)
+            for found in case['found']:
+                for value, ok in found.items():
+                    if ok != '1':
+                        code = lit.Test.FAIL
+                        output += 'Expectation failed for %s\n' % value
+            if code == lit.Test.FAIL:
+                output += 'Stack:\n%s\n' % '\n'.join(stack)
+
+        result = lit.Test.Result(code, output)
+        result.addMetric('instructions', lit.Test.IntMetricValue(cpu.steps))
+        result.addMetric('cycles', lit.Test.IntMetricValue(cpu.timing.cycles))
+        result.addMetric('program_size',
+                         lit.Test.IntMetricValue(len(lines)))
+        return result
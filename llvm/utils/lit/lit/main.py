@@ -11,18 +11,22 @@ import math, os, platform, random, re, sys, time
 
 import lit.ProgressBar
 import lit.LitConfig
+import lit.reports
+import lit.ResultCache
 import lit.Test
 import lit.run
 import lit.util
 import lit.discovery
+import lit.distributed
 
 class TestingProgressDisplay(object):
-    def __init__(self, opts, numTests, progressBar=None):
+    def __init__(self, opts, numTests, progressBar=None, writers=[]):
         self.opts = opts
         self.numTests = numTests
         self.current = None
         self.progressBar = progressBar
         self.completed = 0
+        self.writers = list(writers)
 
     def finish(self):
         if self.progressBar:
@@ -35,6 +39,18 @@ class TestingProgressDisplay(object):
     def update(self, test):
         self.completed += 1
 
+        for writer in self.writers:
+            writer.update(test)
+
+        self.show(test)
+
+        # Once the output of a passing test is shown and written, only keep
+        # what was asked for.
+        if not test.result.code.isFailure:
+            test.result.output = lit.reports.truncate_output(
+                test.result.output, self.opts.maxPassingOutput)
+
+    def show(self, test):
         if self.opts.incremental:
             update_incremental_cache(test)
 
@@ -77,44 +93,26 @@ class TestingProgressDisplay(object):
         # Ensure the output is flushed.
         sys.stdout.flush()
 
-def write_test_results(run, lit_config, testing_time, output_path):
-    try:
-        import json
-    except ImportError:
-        lit_config.fatal('test output unsupported with Python 2.5')
-
-    # Construct the data we will write.
-    data = {}
-    # Encode the current lit version as a schema version.
-    data['__version__'] = lit.__versioninfo__
-    data['elapsed'] = testing_time
-    # FIXME: Record some information on the lit configuration used?
-    # FIXME: Record information from the individual test suites?
-
-    # Encode the tests.
-    data['tests'] = tests_data = []
-    for test in run.tests:
-        test_data = {
-            'name' : test.getFullName(),
-            'code' : test.result.code.name,
-            'output' : test.result.output,
-            'elapsed' : test.result.elapsed }
-
-        # Add test metrics, if present.
-        if test.result.metrics:
-            test_data['metrics'] = metrics_data = {}
-            for key, value in test.result.metrics.items():
-                metrics_data[key] = value.todata()
-
-        tests_data.append(test_data)
-
-    # Write the output.
-    f = open(output_path, 'w')
-    try:
-        json.dump(data, f, indent=2, sort_keys=True)
-        f.write('\n')
-    finally:
-        f.close()
+def print_resource_histograms(tests):
+    cpu_times = []
+    peak_memory = []
+    for test in tests:
+        metrics = test.result.metrics
+        if 'cpu_user_time' not in metrics:
+            continue
+        cpu_times.append((test.getFullName(),
+                          metrics['cpu_user_time'].value +
+                          metrics['cpu_sys_time'].value))
+        peak_memory.append((test.getFullName(),
+                            metrics['peak_rss_kb'].value / 1024.0))
+
+    # The histograms cannot be scaled to a maximum of zero.
+    if any(value for _, value in cpu_times):
+        lit.util.printHistogram(cpu_times, title='Tests', quantity='CPU Times')
+    if any(value for _, value in peak_memory):
+        lit.util.printHistogram(peak_memory, title='Tests',
+                                quantity='Peak Memory', units='MB',
+                                ranking='Largest')
 
 def update_incremental_cache(test):
     if not test.result.code.isFailure:
@@ -131,6 +129,132 @@ def sort_by_incremental_cache(run):
             return 0
     run.tests.sort(key = lambda t: sortIndex(t))
 
+def load_test_times(path):
+    """
+    load_test_times(path) -> {test name: elapsed}
+
+    Read the elapsed times of a previous run, either from a file written by
+    update_test_times or from the output of -o.
+    """
+    import json
+    try:
+        f = open(path)
+    except IOError:
+        return {}
+    try:
+        data = json.load(f)
+    except ValueError:
+        return {}
+    finally:
+        f.close()
+    times = {}
+    for test_data in data.get('tests', []):
+        if test_data.get('elapsed') is not None:
+            times[test_data['name']] = test_data['elapsed']
+    return times
+
+def is_test_times_file(path):
+    """
+    is_test_times_file(path) -> bool
+
+    Whether update_test_times may write path: it is missing, empty or was
+    written by update_test_times, and so not, say, the output of -o.
+    """
+    import json
+    try:
+        f = open(path)
+    except IOError:
+        return not os.path.exists(path)
+    try:
+        text = f.read()
+    finally:
+        f.close()
+    if not text.strip():
+        return True
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return False
+    return (isinstance(data, dict) and list(data.keys()) == ['tests'] and
+            all(isinstance(test_data, dict) and
+                sorted(test_data.keys()) == ['elapsed', 'name']
+                for test_data in data['tests']))
+
+def update_test_times(run, times, path):
+    import json
+    times = dict(times)
+    for test in run.tests:
+        if test.result.elapsed is not None:
+            times[test.getFullName()] = test.result.elapsed
+    data = {'tests' : [{'name' : name, 'elapsed' : elapsed}
+                       for name, elapsed in sorted(times.items())]}
+    f = open(path, 'w')
+    try:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+    finally:
+        f.close()
+
+def expected_test_times(run, times):
+    """
+    expected_test_times(run, times) -> [expected elapsed]
+
+    Tests without a recorded time are expected to take as long as the
+    slowest known test, so that they are started early.
+    """
+    longest = max(list(times.values()) + [0.0])
+    return [times.get(test.getFullName(), longest) for test in run.tests]
+
+def sort_by_test_times(run, times):
+    # Longest expected first, which keeps the workers evenly loaded at the
+    # end of the run.
+    expected = dict(zip(run.tests, expected_test_times(run, times)))
+    run.tests.sort(key = lambda t: (not t.isEarlyTest(), -expected[t],
+                                    t.getFullName()))
+
+def predict_testing_time(run, times, jobs):
+    """
+    predict_testing_time(run, times, jobs) -> seconds
+
+    Simulate the workers taking tests from the queue in order.
+    """
+    import heapq
+    workers = [0.0] * max(jobs, 1)
+    for elapsed in expected_test_times(run, times):
+        heapq.heappush(workers, heapq.heappop(workers) + elapsed)
+    return max(workers)
+
+def coordinate_tests(run, display, opts, inputs):
+    """
+    coordinate_tests(run, display, opts, inputs)
+
+    Hand the tests of the run out to workers instead of running them,
+    starting opts.localWorkers workers on this machine.
+    """
+    coordinator = lit.distributed.Coordinator(
+        run, display, lit.distributed.parse_address(opts.coordinator))
+    run.lit_config.note('coordinating %d tests on %s:%d' % (
+            (len(run.tests),) + tuple(coordinator.address)))
+
+    # Local workers discover the same tests as this process.
+    args = ['-j', str(opts.numThreads)]
+    if opts.configPrefix is not None:
+        args.extend(['--config-prefix', opts.configPrefix])
+    for entry in opts.userParameters:
+        args.extend(['--param', entry])
+    for path in opts.path:
+        args.extend(['--path', path])
+    if opts.maxIndividualTestTime is not None:
+        args.extend(['--timeout', str(opts.maxIndividualTestTime)])
+    if opts.result_cache_path is not None:
+        args.extend(['--result-cache', opts.result_cache_path])
+    workers = lit.distributed.start_local_workers(
+        opts.localWorkers, coordinator.address, args + inputs)
+
+    coordinator.serve(opts.maxTime, workers)
+    for worker in workers:
+        worker.wait()
+
 def main(builtinParameters = {}):
     # Use processes by default on Unix platforms.
     isWindows = platform.system() == 'Windows'
@@ -172,6 +296,11 @@ def main(builtinParameters = {}):
     group.add_option("-o", "--output", dest="output_path",
                      help="Write test results to the provided path",
                      action="store", type=str, metavar="PATH")
+    group.add_option("", "--max-passing-output", dest="maxPassingOutput",
+                     metavar="N",
+                     help=("Keep at most N characters of the output of "
+                           "passing tests once it has been shown"),
+                     action="store", type=int, default=None)
     group.add_option("", "--no-progress-bar", dest="useProgressBar",
                      help="Do not use curses based progress bar",
                      action="store_false", default=True)
@@ -199,12 +328,29 @@ def main(builtinParameters = {}):
     group.add_option("", "--time-tests", dest="timeTests",
                      help="Track elapsed wall time for each test",
                      action="store_true", default=False)
+    group.add_option("", "--track-resources", dest="trackResources",
+                     help=("Track the CPU time and peak memory of the "
+                           "processes run by each test"),
+                     action="store_true", default=False)
     group.add_option("", "--no-execute", dest="noExecute",
                      help="Don't execute any tests (assume PASS)",
                      action="store_true", default=False)
     group.add_option("", "--xunit-xml-output", dest="xunit_output_file",
                       help=("Write XUnit-compatible XML test reports to the"
                             " specified file"), default=None)
+    group.add_option("", "--test-times", dest="test_times_path",
+                     help=("Run the tests expected to take longest first, "
+                           "using the elapsed times recorded in PATH (or the "
+                           "output of -o), and record the new times there "
+                           "unless it holds something else"),
+                     action="store", type=str, metavar="PATH", default=None)
+    group.add_option("", "--result-cache", dest="result_cache_path",
+                     help=("Report tests that passed with the same inputs in "
+                           "an earlier run as passing without running them, "
+                           "using the cache in PATH. Workers of a "
+                           "--coordinator need the option too, and the "
+                           "coordinator records their results"),
+                     action="store", type=str, metavar="PATH", default=None)
     group.add_option("", "--timeout", dest="maxIndividualTestTime",
                      help="Maximum time to spend running a single test (in seconds)."
                      "0 means no time limit. [Default: 0]",
@@ -225,12 +371,36 @@ def main(builtinParameters = {}):
                      help="Run modified and failing tests first (updates "
                      "mtimes)",
                      action="store_true", default=False)
+    group.add_option("", "--num-shards", dest="numShards", metavar="M",
+                     help=("Split the selected tests into M shards by a hash "
+                           "of their names (requires --run-shard)"),
+                     action="store", type=int, default=None)
+    group.add_option("", "--run-shard", dest="runShard", metavar="N",
+                     help="Run only shard N (1 <= N <= M) of --num-shards",
+                     action="store", type=int, default=None)
     group.add_option("", "--filter", dest="filter", metavar="REGEX",
                      help=("Only run tests with paths matching the given "
                            "regular expression"),
                      action="store", default=None)
     parser.add_option_group(group)
 
+    group = OptionGroup(parser, "Distributed Execution")
+    group.add_option("", "--coordinator", dest="coordinator",
+                     metavar="HOST:PORT",
+                     help=("Hand the selected tests out to workers connecting "
+                           "to HOST:PORT instead of running them, and report "
+                           "their results (port 0 picks a free port)"),
+                     action="store", type=str, default=None)
+    group.add_option("", "--local-workers", dest="localWorkers", metavar="N",
+                     help=("With --coordinator, also start N workers on this "
+                           "machine"),
+                     action="store", type=int, default=0)
+    group.add_option("", "--worker", dest="worker", metavar="HOST:PORT",
+                     help=("Run the tests sent by the coordinator at "
+                           "HOST:PORT, using -j connections"),
+                     action="store", type=str, default=None)
+    parser.add_option_group(group)
+
     group = OptionGroup(parser, "Debug and Experimental Options")
     group.add_option("", "--debug", dest="debug",
                       help="Enable debugging (for 'lit' development)",
@@ -247,6 +417,16 @@ def main(builtinParameters = {}):
     group.add_option("", "--use-threads", dest="useProcesses",
                       help="Run tests in parallel with threads (not processes)",
                       action="store_false", default=useProcessesIsDefault)
+    group.add_option("", "--rebuild-discovery-cache",
+                      dest="rebuildDiscoveryCache",
+                      help=("Ignore the cached directory listings of the test "
+                            "suites and rediscover them from scratch"),
+                      action="store_true", default=False)
+    group.add_option("", "--batch-size", dest="batchSize", metavar="N",
+                      help=("Hand tests to worker processes in batches of N, "
+                            "letting idle workers steal from busy ones "
+                            "(0 queues tests one at a time) [Default: 0]"),
+                      type=int, action="store", default=0)
     parser.add_option_group(group)
 
     (opts, args) = parser.parse_args()
@@ -258,6 +438,25 @@ def main(builtinParameters = {}):
     if not args:
         parser.error('No inputs specified')
 
+    if (opts.numShards is None) != (opts.runShard is None):
+        parser.error('--num-shards and --run-shard must be used together')
+    if opts.numShards is not None:
+        if opts.numShards <= 0:
+            parser.error('--num-shards must be positive')
+        if not 1 <= opts.runShard <= opts.numShards:
+            parser.error('--run-shard must be between 1 and --num-shards')
+    if (opts.test_times_path is not None and opts.output_path is not None and
+            os.path.abspath(opts.test_times_path) ==
+            os.path.abspath(opts.output_path)):
+        parser.error('--test-times and -o must not name the same file')
+    for address in (opts.coordinator, opts.worker):
+        if address is not None:
+            try:
+                lit.distributed.parse_address(address)
+            except ValueError:
+                parser.error('invalid address %r, expected HOST:PORT' %
+                             address)
+
     if opts.numThreads is None:
 # Python <2.5 has a race condition causing lit to always fail with numThreads>1
 # http://bugs.python.org/issue1731717
@@ -301,10 +500,13 @@ def main(builtinParameters = {}):
         params = userParams,
         config_prefix = opts.configPrefix,
         maxIndividualTestTime = maxIndividualTestTime)
+    litConfig.track_resources = opts.trackResources
 
     # Perform test discovery.
+    discoveryCache = lit.discovery.DiscoveryCache(opts.rebuildDiscoveryCache)
     run = lit.run.Run(litConfig,
-                      lit.discovery.find_tests_for_inputs(litConfig, inputs))
+                      lit.discovery.find_tests_for_inputs(litConfig, inputs,
+                                                          discoveryCache))
 
     # After test discovery the configuration might have changed
     # the maxIndividualTestTime. If we explicitly set this on the
@@ -348,6 +550,17 @@ def main(builtinParameters = {}):
         # Exit.
         sys.exit(0)
 
+    # Workers run whatever the coordinator sends them.
+    if opts.worker is not None:
+        # The cache is only read here. The coordinator records the keys the
+        # workers send back with their results.
+        if opts.result_cache_path is not None:
+            litConfig.result_cache = lit.ResultCache.ResultCache(
+                opts.result_cache_path)
+        lit.distributed.run_worker(
+            run, lit.distributed.parse_address(opts.worker), opts.numThreads)
+        sys.exit(0)
+
     # Select and order the tests.
     numTotalTests = len(run.tests)
 
@@ -361,11 +574,22 @@ def main(builtinParameters = {}):
         run.tests = [result_test for result_test in run.tests
                      if rex.search(result_test.getFullName())]
 
+    # Keep only this run's shard.
+    if opts.numShards is not None:
+        run.tests = lit.distributed.select_shard(run.tests, opts.numShards,
+                                                 opts.runShard)
+
     # Then select the order.
+    test_times = None
+    if opts.test_times_path is not None:
+        test_times = load_test_times(opts.test_times_path)
+
     if opts.shuffle:
         random.shuffle(run.tests)
     elif opts.incremental:
         sort_by_incremental_cache(run)
+    elif test_times is not None:
+        sort_by_test_times(run, test_times)
     else:
         run.tests.sort(key = lambda t: (not t.isEarlyTest(), t.getFullName()))
 
@@ -415,11 +639,32 @@ def main(builtinParameters = {}):
         else:
             print(header)
 
+    if opts.result_cache_path is not None:
+        litConfig.result_cache = lit.ResultCache.ResultCache(
+            opts.result_cache_path)
+
+    predicted_time = None
+    if test_times:
+        predicted_time = predict_testing_time(run, test_times,
+                                              opts.numThreads)
+
     startTime = time.time()
-    display = TestingProgressDisplay(opts, len(run.tests), progressBar)
+    # Write the results out as the tests complete, if requested.
+    writers = []
+    if opts.output_path is not None:
+        writers.append(lit.reports.JSONResultsWriter(opts.output_path,
+                                                     opts.maxPassingOutput))
+    if opts.xunit_output_file:
+        writers.append(lit.reports.XunitResultsWriter(opts.xunit_output_file))
+
+    display = TestingProgressDisplay(opts, len(run.tests), progressBar,
+                                     writers)
     try:
-        run.execute_tests(display, opts.numThreads, opts.maxTime,
-                          opts.useProcesses)
+        if opts.coordinator is not None:
+            coordinate_tests(run, display, opts, inputs)
+        else:
+            run.execute_tests(display, opts.numThreads, opts.maxTime,
+                              opts.useProcesses, opts.batchSize)
     except KeyboardInterrupt:
         sys.exit(2)
     display.finish()
@@ -427,10 +672,23 @@ def main(builtinParameters = {}):
     testing_time = time.time() - startTime
     if not opts.quiet:
         print('Testing Time: %.2fs' % (testing_time,))
+        if predicted_time is not None:
+            print('Predicted Testing Time: %.2fs' % (predicted_time,))
 
-    # Write out the test data, if requested.
-    if opts.output_path is not None:
-        write_test_results(run, litConfig, testing_time, opts.output_path)
+    if test_times is not None:
+        if is_test_times_file(opts.test_times_path):
+            update_test_times(run, test_times, opts.test_times_path)
+        else:
+            litConfig.warning('not recording test times in %r, which is not '
+                              'a test times file' % opts.test_times_path)
+
+    if litConfig.result_cache is not None:
+        litConfig.result_cache.update(run.tests)
+        litConfig.result_cache.save()
+
+    # Finish writing the test data, if requested.
+    for writer in writers:
+        writer.finish(run, testing_time)
 
     # List test results organized by kind.
     hasFailures = False
@@ -467,6 +725,9 @@ def main(builtinParameters = {}):
                       for test in run.tests]
         lit.util.printHistogram(test_times, title='Tests')
 
+    if opts.trackResources:
+        print_resource_histograms(run.tests)
+
     for name,code in (('Expected Passes    ', lit.Test.PASS),
                       ('Passes With Retry  ', lit.Test.FLAKYPASS),
                       ('Expected Failures  ', lit.Test.XFAIL),
@@ -481,37 +742,6 @@ def main(builtinParameters = {}):
         if N:
             print('  %s: %d' % (name,N))
 
-    if opts.xunit_output_file:
-        # Collect the tests, indexed by test suite
-        by_suite = {}
-        for result_test in run.tests:
-            suite = result_test.suite.config.name
-            if suite not in by_suite:
-                by_suite[suite] = {
-                                   'passes'   : 0,
-                                   'failures' : 0,
-                                   'tests'    : [] }
-            by_suite[suite]['tests'].append(result_test)
-            if result_test.result.code.isFailure:
-                by_suite[suite]['failures'] += 1
-            else:
-                by_suite[suite]['passes'] += 1
-        xunit_output_file = open(opts.xunit_output_file, "w")
-        xunit_output_file.write("<?xml version=\"1.0\" encoding=\"UTF-8\" ?>\n")
-        xunit_output_file.write("<testsuites>\n")
-        for suite_name, suite in by_suite.items():
-            safe_suite_name = suite_name.replace(".", "-")
-            xunit_output_file.write("<testsuite name='" + safe_suite_name + "'")
-            xunit_output_file.write(" tests='" + str(suite['passes'] + 
-              suite['failures']) + "'")
-            xunit_output_file.write(" failures='" + str(suite['failures']) + 
-              "'>\n")
-            for result_test in suite['tests']:
-                xunit_output_file.write(result_test.getJUnitXML() + "\n")
-            xunit_output_file.write("</testsuite>\n")
-        xunit_output_file.write("</testsuites>")
-        xunit_output_file.close()
-
     # If we encountered any additional errors, exit abnormally.
     if litConfig.numErrors:
         sys.stderr.write('\n%d error(s), exiting.\n' % litConfig.numErrors)
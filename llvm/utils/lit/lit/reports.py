@@ -0,0 +1,156 @@
+"""
+Test result files written incrementally as tests complete.
+
+Each writer appends every result to '<path>.partial' as soon as the test
+finishes, one JSON object per line, so that the results of a run that is
+interrupted are not lost. Once the run is over, finish() turns the partial
+file into the final report at <path> and removes it. Neither step holds more
+than one test's output in memory.
+"""
+
+from __future__ import absolute_import
+import json
+import os
+
+import lit
+import lit.util
+
+def truncate_output(output, limit):
+    """
+    truncate_output(output, limit) -> str
+
+    Keep at most limit characters of output.
+    """
+    if limit is None or len(output) <= limit:
+        return output
+    return '%s\n[%d characters truncated]\n' % (output[:limit],
+                                                len(output) - limit)
+
+class ResultsWriter(object):
+    def __init__(self, path):
+        self.path = path
+        self.partial_path = path + '.partial'
+        self.partial = open(self.partial_path, 'w')
+        self.written = set()
+
+    def encode(self, test):
+        """encode(test) -> JSON-serializable data to append for test"""
+        raise NotImplementedError
+
+    def update(self, test):
+        self.written.add(id(test))
+        self.partial.write(json.dumps(self.encode(test), sort_keys=True))
+        self.partial.write('\n')
+        self.partial.flush()
+
+    def read_partial(self):
+        f = open(self.partial_path)
+        try:
+            for line in f:
+                yield json.loads(line)
+        finally:
+            f.close()
+
+    def finish(self, run, testing_time):
+        """
+        finish(run, testing_time)
+
+        Write the final report, including the tests of the run that were
+        never reported with update(), such as those skipped by --max-time.
+        """
+        for test in run.tests:
+            if id(test) not in self.written:
+                self.update(test)
+        self.partial.close()
+
+        f = open(self.path, 'w')
+        try:
+            self.write_report(f, testing_time)
+        finally:
+            f.close()
+        os.remove(self.partial_path)
+
+def _dump(value, depth):
+    # Match json.dump(..., indent=2) for a value nested depth levels deep.
+    text = json.dumps(value, indent=2, sort_keys=True, separators=(',', ': '))
+    return text.replace('\n', '\n' + '  ' * depth)
+
+class JSONResultsWriter(ResultsWriter):
+    """
+    JSONResultsWriter - The -o report: one JSON document with the lit version,
+    the testing time and the tests in the order they completed.
+    """
+
+    def __init__(self, path, max_passing_output=None):
+        super(JSONResultsWriter, self).__init__(path)
+        self.max_passing_output = max_passing_output
+
+    def encode(self, test):
+        output = test.result.output
+        if not test.result.code.isFailure:
+            output = truncate_output(output, self.max_passing_output)
+        test_data = {
+            'name' : test.getFullName(),
+            'code' : test.result.code.name,
+            'output' : output,
+            'elapsed' : test.result.elapsed }
+
+        # Add test metrics, if present.
+        if test.result.metrics:
+            test_data['metrics'] = metrics_data = {}
+            for key, value in test.result.metrics.items():
+                metrics_data[key] = value.todata()
+        return test_data
+
+    def write_report(self, f, testing_time):
+        f.write('{\n')
+        # Encode the current lit version as a schema version.
+        f.write('  "__version__": %s,\n' % _dump(lit.__versioninfo__, 1))
+        f.write('  "elapsed": %s,\n' % _dump(testing_time, 1))
+        f.write('  "tests": [')
+        separator = '\n'
+        for test_data in self.read_partial():
+            f.write(separator + '    ' + _dump(test_data, 2))
+            separator = ',\n'
+        if separator == '\n':
+            f.write(']\n')
+        else:
+            f.write('\n  ]\n')
+        f.write('}\n')
+
+class XunitResultsWriter(ResultsWriter):
+    """
+    XunitResultsWriter - The --xunit-xml-output report, with one testsuite
+    element per lit test suite.
+    """
+
+    def __init__(self, path):
+        super(XunitResultsWriter, self).__init__(path)
+        # Map of suite name to [passes, failures], in order of appearance.
+        self.suites = {}
+        self.suite_order = []
+
+    def encode(self, test):
+        suite = test.suite.config.name
+        if suite not in self.suites:
+            self.suites[suite] = [0, 0]
+            self.suite_order.append(suite)
+        self.suites[suite][test.result.code.isFailure] += 1
+        return {'suite': suite, 'xml': test.getJUnitXML()}
+
+    def write_report(self, f, testing_time):
+        f.write("<?xml version=\"1.0\" encoding=\"UTF-8\" ?>\n")
+        f.write("<testsuites>\n")
+        for suite_name in self.suite_order:
+            passes, failures = self.suites[suite_name]
+            safe_suite_name = suite_name.replace(".", "-")
+            f.write("<testsuite name='" + safe_suite_name + "'")
+            f.write(" tests='" + str(passes + failures) + "'")
+            f.write(" failures='" + str(failures) + "'>\n")
+            # Rescan the partial results for each suite, rather than keeping
+            # their test cases in memory.
+            for data in self.read_partial():
+                if data['suite'] == suite_name:
+                    f.write(lit.util.to_string(data['xml']) + "\n")
+            f.write("</testsuite>\n")
+        f.write("</testsuites>")
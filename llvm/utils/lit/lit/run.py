@@ -18,6 +18,7 @@ except ImportError:
     multiprocessing = None
 
 import lit.Test
+import lit.util
 
 ###
 # Test Execution Implementation
@@ -67,6 +68,62 @@ class TestProvider(object):
         # Otherwise take the next test.
         return self.queue.get()
 
+class BatchProvider(object):
+    """
+    Provides batches of test indices to a fixed set of workers.
+
+    The tests are dealt round-robin into one contiguous range of a shared
+    array per worker, so each worker sees them in the run order. A worker
+    takes batches from the front of its own range, and once that is empty
+    it steals the back half of the largest remaining range.
+    """
+
+    def __init__(self, num_tests, num_jobs, batch_size, canceled_flag):
+        self.canceled_flag = canceled_flag
+        self.batch_size = batch_size
+        self.num_jobs = num_jobs
+        self.lock = multiprocessing.Lock()
+
+        order = []
+        heads = []
+        tails = []
+        for worker in range(num_jobs):
+            heads.append(len(order))
+            order.extend(range(worker, num_tests, num_jobs))
+            tails.append(len(order))
+        self.order = multiprocessing.Array('i', order, lock=False)
+        self.heads = multiprocessing.Array('i', heads, lock=False)
+        self.tails = multiprocessing.Array('i', tails, lock=False)
+
+    def cancel(self):
+        self.canceled_flag.value = 1
+
+    def get_batch(self, worker):
+        # Check if we are canceled.
+        if self.canceled_flag.value:
+            return None
+
+        self.lock.acquire()
+        try:
+            if self.heads[worker] == self.tails[worker]:
+                victim = max(range(self.num_jobs),
+                             key=lambda w: self.tails[w] - self.heads[w])
+                remaining = self.tails[victim] - self.heads[victim]
+                if not remaining:
+                    return None
+                # Take over the back half of the victim's range.
+                split = self.tails[victim] - (remaining + 1) // 2
+                self.heads[worker] = split
+                self.tails[worker] = self.tails[victim]
+                self.tails[victim] = split
+
+            head = self.heads[worker]
+            end = min(head + self.batch_size, self.tails[worker])
+            self.heads[worker] = end
+            return self.order[head:end]
+        finally:
+            self.lock.release()
+
 class Tester(object):
     def __init__(self, run_instance, provider, consumer):
         self.run_instance = run_instance
@@ -81,7 +138,7 @@ class Tester(object):
             self.run_test(item)
         self.consumer.task_finished()
 
-    def run_test(self, test_index):
+    def execute(self, test_index):
         test = self.run_instance.tests[test_index]
         try:
             self.run_instance.execute_test(test)
@@ -90,8 +147,30 @@ class Tester(object):
             # bonkers with ctrl-c and we start forking merrily.
             print('\nCtrl-C detected, goodbye.')
             os.kill(0,9)
+        return test
+
+    def run_test(self, test_index):
+        test = self.execute(test_index)
         self.consumer.update(test_index, test)
 
+class BatchTester(Tester):
+    def __init__(self, run_instance, provider, consumer, worker):
+        super(BatchTester, self).__init__(run_instance, provider, consumer)
+        self.worker = worker
+
+    def run(self):
+        while True:
+            batch = self.provider.get_batch(self.worker)
+            if batch is None:
+                break
+            results = []
+            for test_index in batch:
+                if self.provider.canceled_flag.value:
+                    break
+                results.append((test_index, self.execute(test_index)))
+            self.consumer.update_batch(results)
+        self.consumer.task_finished()
+
 class ThreadResultsConsumer(object):
     def __init__(self, display):
         self.display = display
@@ -122,6 +201,11 @@ class MultiprocessResultsConsumer(object):
         # results to the actual display implementation via an output queue.
         self.queue.put((test_index, test.result))
 
+    def update_batch(self, results):
+        # Like update(), but sends the results of a whole batch at once.
+        self.queue.put([(test_index, test.result)
+                        for test_index, test in results])
+
     def task_finished(self):
         # This method is called in the child processes, and communicates that
         # individual tasks are complete.
@@ -139,17 +223,23 @@ class MultiprocessResultsConsumer(object):
                 completed += 1
                 continue
 
-            # Update the test result in the parent process.
-            index,result = item
-            test = self.run.tests[index]
-            test.result = result
+            if not isinstance(item, list):
+                item = [item]
+            for index,result in item:
+                # Update the test result in the parent process.
+                test = self.run.tests[index]
+                test.result = result
 
-            self.display.update(test)
+                self.display.update(test)
 
 def run_one_tester(run, provider, display):
     tester = Tester(run, provider, display)
     tester.run()
 
+def run_one_batch_tester(run, provider, display, worker):
+    tester = BatchTester(run, provider, display, worker)
+    tester.run()
+
 ###
 
 class Run(object):
@@ -163,6 +253,10 @@ class Run(object):
 
     def execute_test(self, test):
         result = None
+        usage = None
+        if self.lit_config.track_resources:
+            usage = lit.util.ResourceUsage()
+            lit.util.setTrackedResourceUsage(usage)
         start_time = time.time()
         try:
             result = test.config.test_format.execute(test, self.lit_config)
@@ -185,12 +279,23 @@ class Run(object):
             result = lit.Test.Result(lit.Test.UNRESOLVED, output)
         result.elapsed = time.time() - start_time
 
+        if usage is not None:
+            lit.util.setTrackedResourceUsage(None)
+            if usage.processes:
+                result.addMetric('cpu_user_time',
+                                 lit.Test.RealMetricValue(usage.user_time))
+                result.addMetric('cpu_sys_time',
+                                 lit.Test.RealMetricValue(usage.sys_time))
+                result.addMetric('peak_rss_kb',
+                                 lit.Test.IntMetricValue(usage.max_rss))
+
         test.setResult(result)
 
     def execute_tests(self, display, jobs, max_time=None,
-                      use_processes=False):
+                      use_processes=False, batch_size=0):
         """
-        execute_tests(display, jobs, [max_time])
+        execute_tests(display, jobs, [max_time], [use_processes],
+                      [batch_size])
 
         Execute each of the tests in the run, using up to jobs number of
         parallel tasks, and inform the display of each individual result. The
@@ -200,6 +305,10 @@ class Run(object):
         If max_time is non-None, it should be a time in seconds after which to
         stop executing tests.
 
+        If batch_size is non-zero and the tests are run in processes, each
+        worker takes batches of batch_size tests and reports their results
+        together, stealing work from the other workers when it runs out.
+
         The display object will have its update method called with each test as
         it is completed. The calls are guaranteed to be locked with respect to
         one another, but are *not* guaranteed to be called on the same thread as
@@ -212,18 +321,23 @@ class Run(object):
 
         # Choose the appropriate parallel execution implementation.
         consumer = None
+        provider = None
         if jobs != 1 and use_processes and multiprocessing:
             try:
                 task_impl = multiprocessing.Process
                 queue_impl = multiprocessing.Queue
                 canceled_flag =  multiprocessing.Value('i', 0)
                 consumer = MultiprocessResultsConsumer(self, display, jobs)
+                if batch_size:
+                    provider = BatchProvider(len(self.tests), jobs,
+                                             batch_size, canceled_flag)
             except:
                 # multiprocessing fails to initialize with certain OpenBSD and
                 # FreeBSD Python versions: http://bugs.python.org/issue3770
                 # Unfortunately the error raised also varies by platform.
                 self.lit_config.note('failed to initialize multiprocessing')
                 consumer = None
+                provider = None
         if not consumer:
             task_impl = threading.Thread
             queue_impl = queue.Queue
@@ -231,15 +345,18 @@ class Run(object):
             consumer = ThreadResultsConsumer(display)
 
         # Create the test provider.
-        provider = TestProvider(queue_impl, canceled_flag)
-
-        # Queue the tests outside the main thread because we can't guarantee
-        # that we can put() all the tests without blocking:
-        # https://docs.python.org/2/library/multiprocessing.html
-        # e.g: On Mac OS X, we will hang if we put 2^15 elements in the queue
-        # without taking any out.
-        queuer = task_impl(target=provider.queue_tests, args=(self.tests, jobs))
-        queuer.start()
+        queuer = None
+        if provider is None:
+            provider = TestProvider(queue_impl, canceled_flag)
+
+            # Queue the tests outside the main thread because we can't
+            # guarantee that we can put() all the tests without blocking:
+            # https://docs.python.org/2/library/multiprocessing.html
+            # e.g: On Mac OS X, we will hang if we put 2^15 elements in the
+            # queue without taking any out.
+            queuer = task_impl(target=provider.queue_tests,
+                               args=(self.tests, jobs))
+            queuer.start()
 
         # Install a console-control signal handler on Windows.
         if win32api is not None:
@@ -262,7 +379,8 @@ class Run(object):
             # Otherwise, execute the tests in parallel
             self._execute_tests_in_parallel(task_impl, provider, consumer, jobs)
 
-        queuer.join()
+        if queuer is not None:
+            queuer.join()
 
         # Cancel the timeout handler.
         if max_time is not None:
@@ -275,9 +393,14 @@ class Run(object):
 
     def _execute_tests_in_parallel(self, task_impl, provider, consumer, jobs):
         # Start all of the tasks.
-        tasks = [task_impl(target=run_one_tester,
-                           args=(self, provider, consumer))
-                 for i in range(jobs)]
+        if isinstance(provider, BatchProvider):
+            tasks = [task_impl(target=run_one_batch_tester,
+                               args=(self, provider, consumer, i))
+                     for i in range(jobs)]
+        else:
+            tasks = [task_impl(target=run_one_tester,
+                               args=(self, provider, consumer))
+                     for i in range(jobs)]
         for t in tasks:
             t.start()
 
@@ -63,6 +63,20 @@ def mkdir_p(path):
         if e.errno != errno.EEXIST:
             raise
 
+def listdir_entries(path):
+    """listdir_entries(path) -> (files, dirs)
+
+    List the entries of the "path" directory, split into the names of
+    directories and of everything else."""
+    files = []
+    dirs = []
+    for filename in os.listdir(path):
+        if os.path.isdir(os.path.join(path, filename)):
+            dirs.append(filename)
+        else:
+            files.append(filename)
+    return files, dirs
+
 def capture(args, env=None):
     """capture(command) - Run the given command (or argv list) in a shell and
     return the standard output."""
@@ -114,7 +128,8 @@ def whichTools(tools, paths):
             return path
     return None
 
-def printHistogram(items, title = 'Items'):
+def printHistogram(items, title = 'Items', quantity = 'Times', units = 's',
+                   ranking = 'Slowest'):
     items.sort(key = lambda item: item[1])
 
     maxValue = max([v for _,v in items])
@@ -136,11 +151,11 @@ def printHistogram(items, title = 'Items'):
 
     barW = 40
     hr = '-' * (barW + 34)
-    print('\nSlowest %s:' % title)
+    print('\n%s %s:' % (ranking, title))
     print(hr)
     for name,value in items[-20:]:
-        print('%.2fs: %s' % (value, name))
-    print('\n%s Times:' % title)
+        print('%.2f%s: %s' % (value, units, name))
+    print('\n%s %s:' % (title, quantity))
     print(hr)
     pDigits = int(math.ceil(math.log(maxValue, 10)))
     pfDigits = max(0, 3-pDigits)
@@ -154,10 +169,122 @@ def printHistogram(items, title = 'Items'):
     for i,row in enumerate(histo):
         pct = float(len(row)) / len(items)
         w = int(barW * pct)
-        print("[%*.*fs,%*.*fs) :: [%s%s] :: [%*d/%*d]" % (
-            pDigits, pfDigits, i*barH, pDigits, pfDigits, (i+1)*barH,
+        print("[%*.*f%s,%*.*f%s) :: [%s%s] :: [%*d/%*d]" % (
+            pDigits, pfDigits, i*barH, units, pDigits, pfDigits, (i+1)*barH,
+            units,
             '*'*w, ' '*(barW-w), cDigits, len(row), cDigits, len(items)))
 
+class ResourceUsage(object):
+    """
+    ResourceUsage - The CPU time and peak memory of the processes started for
+    a test, as reported by os.wait4 when each of them is reaped. The figures
+    of a process include those of the children it waited for.
+    """
+
+    def __init__(self):
+        self.processes = 0
+        self.user_time = 0.0
+        self.sys_time = 0.0
+        # Peak resident set size of any one process, in kilobytes.
+        self.max_rss = 0
+
+    def add(self, rusage):
+        max_rss = rusage.ru_maxrss
+        if platform.system() == 'Darwin':
+            # Darwin reports bytes rather than kilobytes.
+            max_rss //= 1024
+        self.processes += 1
+        self.user_time += rusage.ru_utime
+        self.sys_time += rusage.ru_stime
+        self.max_rss = max(self.max_rss, max_rss)
+
+_tracked_usage = threading.local()
+
+def setTrackedResourceUsage(usage):
+    """
+    setTrackedResourceUsage(usage)
+
+    Record the resource usage of the processes that this thread waits for
+    with trackedWait in the ResourceUsage usage, or stop recording it if
+    usage is None.
+    """
+    _tracked_usage.usage = usage
+
+def _trackedUsage():
+    """Return the ResourceUsage tracked by this thread, or None."""
+    if not hasattr(os, 'wait4'):
+        return None
+    return getattr(_tracked_usage, 'usage', None)
+
+def readOutput(p, input=None):
+    """
+    readOutput(p, [input]) -> (out, err)
+
+    Send input to the process p and read its piped output until it is closed.
+    If this thread tracks a ResourceUsage, this does not wait for p, so that
+    the caller can reap it with trackedWait(). Otherwise it is just
+    p.communicate().
+    """
+    if _trackedUsage() is None:
+        return p.communicate(input)
+
+    output = {}
+    def read(name, f):
+        output[name] = f.read()
+        f.close()
+
+    readers = []
+    for name in ('stdout', 'stderr'):
+        f = getattr(p, name)
+        if f is not None:
+            t = threading.Thread(target=read, args=(name, f))
+            t.daemon = True
+            t.start()
+            readers.append(t)
+
+    if p.stdin is not None:
+        try:
+            if input:
+                p.stdin.write(input)
+            p.stdin.close()
+        except (IOError, OSError) as e:
+            # The process exited without reading all of its input.
+            if e.errno not in (errno.EPIPE, errno.EINVAL):
+                raise
+    for t in readers:
+        t.join()
+    return output.get('stdout'), output.get('stderr')
+
+def trackedWait(p):
+    """
+    trackedWait(p) -> exit code
+
+    Wait for the process p like p.wait(). If this thread tracks a
+    ResourceUsage, p is reaped with os.wait4 and its resource usage is added
+    to it.
+    """
+    usage = _trackedUsage()
+    if usage is None or not isinstance(p, subprocess.Popen) or \
+            p.returncode is not None:
+        return p.wait()
+    while True:
+        try:
+            pid, sts, rusage = os.wait4(p.pid, 0)
+            break
+        except OSError as e:
+            if e.errno == errno.EINTR:
+                continue
+            if e.errno != errno.ECHILD:
+                raise
+            # Reaped elsewhere, so its resource usage is unknown.
+            return p.wait()
+    usage.add(rusage)
+    if os.WIFSIGNALED(sts):
+        p.returncode = -os.WTERMSIG(sts)
+    else:
+        p.returncode = os.WEXITSTATUS(sts)
+    return p.returncode
+
 class ExecuteCommandTimeoutException(Exception):
     def __init__(self, msg, out, err, exitCode):
         assert isinstance(msg, str)
@@ -213,8 +340,8 @@ def executeCommand(command, cwd=None, env=None, input=None, timeout=0):
             timerObject = threading.Timer(timeout, killProcess)
             timerObject.start()
 
-        out,err = p.communicate(input=input)
-        exitCode = p.wait()
+        out,err = readOutput(p, input=input)
+        exitCode = trackedWait(p)
     finally:
         if timerObject != None:
             timerObject.cancel()
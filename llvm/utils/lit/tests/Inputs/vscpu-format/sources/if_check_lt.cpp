@@ -0,0 +1,6 @@
+int main() {
+	int x = 4;
+	int y = 5;
+	int z = 6;
+	if(x<y) z = x + y;
+}
\ No newline at end of file
@@ -0,0 +1,3 @@
+int main(){
+	int x = 13+4;
+}
\ No newline at end of file
@@ -0,0 +1,12 @@
+# Check that batched dispatch runs every test exactly once, both when workers
+# have to steal and when a single batch covers a worker's whole range.
+#
+# RUN: %{lit} -j 3 --use-processes --batch-size=1 %{inputs}/test-times > %t.1.out
+# RUN: FileCheck < %t.1.out %s
+# RUN: %{lit} -j 2 --use-processes --batch-size=64 %{inputs}/test-times > %t.64.out
+# RUN: FileCheck < %t.64.out %s
+#
+# END.
+
+# CHECK: -- Testing: 4 tests
+# CHECK: Expected Passes{{ *}}: 4
@@ -0,0 +1,39 @@
+# Check that directory listings are reused while the directory's mtime is
+# unchanged, and that --rebuild-discovery-cache ignores them.
+#
+# RUN: rm -rf %t && mkdir -p %t
+# RUN: cp -r %{inputs}/discovery-cache %t/suite
+# RUN: %{python} -c "import os, sys; [os.utime(d, (0, 1000000)) for d, _, _ in os.walk(sys.argv[1])]" %t/suite
+# RUN: %{lit} --show-tests %t/suite > %t.first.out
+# RUN: FileCheck --check-prefix=CHECK-FIRST < %t.first.out %s
+#
+# A test added without changing the mtime of its directory is not seen.
+# RUN: echo "# RUN: true" > %t/suite/subdir/test-hidden.txt
+# RUN: %{python} -c "import os, sys; [os.utime(d, (0, 1000000)) for d, _, _ in os.walk(sys.argv[1])]" %t/suite
+# RUN: %{lit} --show-tests %t/suite > %t.cached.out
+# RUN: FileCheck --check-prefix=CHECK-FIRST < %t.cached.out %s
+# RUN: %{lit} --show-tests --rebuild-discovery-cache %t/suite > %t.rebuilt.out
+# RUN: FileCheck --check-prefix=CHECK-HIDDEN < %t.rebuilt.out %s
+#
+# A test added normally is seen.
+# RUN: echo "# RUN: true" > %t/suite/test-new.txt
+# RUN: %{lit} --show-tests %t/suite > %t.new.out
+# RUN: FileCheck --check-prefix=CHECK-NEW < %t.new.out %s
+#
+# END.
+
+# CHECK-FIRST: -- Available Tests --
+# CHECK-FIRST-NEXT: discovery-cache :: subdir/test-two.txt
+# CHECK-FIRST-NEXT: discovery-cache :: test-one.txt
+# CHECK-FIRST-NOT: discovery-cache ::
+
+# CHECK-HIDDEN: -- Available Tests --
+# CHECK-HIDDEN-NEXT: discovery-cache :: subdir/test-hidden.txt
+# CHECK-HIDDEN-NEXT: discovery-cache :: subdir/test-two.txt
+# CHECK-HIDDEN-NEXT: discovery-cache :: test-one.txt
+
+# CHECK-NEW: -- Available Tests --
+# CHECK-NEW-NEXT: discovery-cache :: subdir/test-hidden.txt
+# CHECK-NEW-NEXT: discovery-cache :: subdir/test-two.txt
+# CHECK-NEW-NEXT: discovery-cache :: test-new.txt
+# CHECK-NEW-NEXT: discovery-cache :: test-one.txt
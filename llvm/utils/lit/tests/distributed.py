@@ -0,0 +1,56 @@
+# Check that --num-shards/--run-shard split the tests by the hash of their
+# names.
+#
+# RUN: %{lit} -j 1 -v --num-shards 2 --run-shard 1 %{inputs}/test-times > %t.shard1.out
+# RUN: FileCheck --check-prefix=CHECK-SHARD1 < %t.shard1.out %s
+# RUN: %{lit} -j 1 -v --num-shards 2 --run-shard 2 %{inputs}/test-times > %t.shard2.out
+# RUN: FileCheck --check-prefix=CHECK-SHARD2 < %t.shard2.out %s
+# RUN: not %{lit} --run-shard 1 %{inputs}/test-times 2> %t.shard-error.out
+# RUN: FileCheck --check-prefix=CHECK-SHARD-ERROR < %t.shard-error.out %s
+#
+# CHECK-SHARD1: -- Testing: 2 of 4 tests
+# CHECK-SHARD1-DAG: PASS: test-times :: b.txt
+# CHECK-SHARD1-DAG: PASS: test-times :: d.txt
+# CHECK-SHARD1: Expected Passes{{ *}}: 2
+#
+# CHECK-SHARD2: -- Testing: 2 of 4 tests
+# CHECK-SHARD2-DAG: PASS: test-times :: a.txt
+# CHECK-SHARD2-DAG: PASS: test-times :: c.txt
+# CHECK-SHARD2: Expected Passes{{ *}}: 2
+#
+# CHECK-SHARD-ERROR: --num-shards and --run-shard must be used together
+
+# Check that a coordinator merges the results of its workers.
+#
+# RUN: %{lit} -v --coordinator=localhost:0 --local-workers=2 -o %t.json %{inputs}/test-times > %t.coordinator.out
+# RUN: FileCheck --check-prefix=CHECK-COORDINATOR < %t.coordinator.out %s
+# RUN: FileCheck --check-prefix=CHECK-JSON < %t.json %s
+#
+# Check that the results of the workers are recorded in the result cache.
+#
+# RUN: rm -rf %t.cache && mkdir -p %t.cache
+# RUN: cp -r %{inputs}/result-cache %t.cache/suite
+# RUN: not %{lit} -a --coordinator=localhost:0 --local-workers=2 --result-cache %t.cache/cache.json %t.cache/suite > %t.cache.first.out
+# RUN: FileCheck --check-prefix=CHECK-CACHE-RUN < %t.cache.first.out %s
+# RUN: not %{lit} -a --coordinator=localhost:0 --local-workers=2 --result-cache %t.cache/cache.json %t.cache/suite > %t.cache.cached.out
+# RUN: FileCheck --check-prefix=CHECK-CACHE-CACHED < %t.cache.cached.out %s
+#
+# END.
+#
+# CHECK-COORDINATOR: -- Testing: 4 tests
+# CHECK-COORDINATOR-DAG: PASS: test-times :: a.txt
+# CHECK-COORDINATOR-DAG: PASS: test-times :: b.txt
+# CHECK-COORDINATOR-DAG: PASS: test-times :: c.txt
+# CHECK-COORDINATOR-DAG: PASS: test-times :: d.txt
+# CHECK-COORDINATOR: Expected Passes{{ *}}: 4
+#
+# CHECK-JSON-DAG: "name": "test-times :: a.txt"
+# CHECK-JSON-DAG: "name": "test-times :: b.txt"
+# CHECK-JSON-DAG: "name": "test-times :: c.txt"
+# CHECK-JSON-DAG: "name": "test-times :: d.txt"
+#
+# CHECK-CACHE-RUN: PASS: result-cache :: pass.txt
+# CHECK-CACHE-RUN-NEXT: Script:
+#
+# CHECK-CACHE-CACHED: PASS: result-cache :: pass.txt
+# CHECK-CACHE-CACHED-NEXT: Result reused from the cache.
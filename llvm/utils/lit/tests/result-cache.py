@@ -0,0 +1,24 @@
+# Check that --result-cache reuses the results of tests that passed with the
+# same inputs, and reruns them once an input file changes.
+#
+# RUN: rm -rf %t && mkdir -p %t
+# RUN: cp -r %{inputs}/result-cache %t/suite
+# RUN: not %{lit} -j 1 -a --result-cache %t/cache.json %t/suite > %t.first.out
+# RUN: FileCheck --check-prefix=CHECK-RUN < %t.first.out %s
+# RUN: not %{lit} -j 1 -a --result-cache %t/cache.json %t/suite > %t.cached.out
+# RUN: FileCheck --check-prefix=CHECK-CACHED < %t.cached.out %s
+# RUN: echo changed > %t/suite/input.dat
+# RUN: not %{lit} -j 1 -a --result-cache %t/cache.json %t/suite > %t.changed.out
+# RUN: FileCheck --check-prefix=CHECK-RUN < %t.changed.out %s
+#
+# END.
+
+# CHECK-RUN: FAIL: result-cache :: fail.txt
+# CHECK-RUN: Exit Code: 1
+# CHECK-RUN: PASS: result-cache :: pass.txt
+# CHECK-RUN-NEXT: Script:
+
+# CHECK-CACHED: FAIL: result-cache :: fail.txt
+# CHECK-CACHED: Exit Code: 1
+# CHECK-CACHED: PASS: result-cache :: pass.txt
+# CHECK-CACHED-NEXT: Result reused from the cache.
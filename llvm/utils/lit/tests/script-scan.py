@@ -0,0 +1,12 @@
+# Check that the search for RUN lines stops after test_script_scan_lines lines
+# without one.
+#
+# RUN: not %{lit} -j 1 -v %{inputs}/script-scan > %t.out
+# RUN: FileCheck < %t.out %s
+#
+# CHECK: PASS: script-scan :: commands-at-top.txt
+# CHECK: UNRESOLVED: script-scan :: commands-too-late.txt
+# CHECK: Test has no run line!
+# CHECK: PASS: script-scan :: no-trailing-newline.txt
+# CHECK: Expected Passes    : 2
+# CHECK: Unresolved Tests   : 1
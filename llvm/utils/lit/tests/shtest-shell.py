@@ -7,6 +7,8 @@
 
 # CHECK: -- Testing:
 
+# CHECK: PASS: shtest-shell :: builtins.txt
+
 # CHECK: FAIL: shtest-shell :: error-0.txt
 # CHECK: *** TEST 'shtest-shell :: error-0.txt' FAILED ***
 # CHECK: Command 0: "not-a-real-command"
@@ -17,3 +17,12 @@
 # CHECK-NEXT:   }
 # CHECK-NEXT: ]
 # CHECK-NEXT: }
+
+# Check that the partial results are removed once the report is written, and
+# that the output of passing tests can be truncated.
+#
+# RUN: not ls %t.results.out.partial
+# RUN: %{lit} -j 1 %{inputs}/test-data --max-passing-output 4 --output %t.truncated.out
+# RUN: FileCheck --check-prefix=CHECK-TRUNCATED < %t.truncated.out %s
+#
+# CHECK-TRUNCATED: "output": "Test\n[8 characters truncated]\n"
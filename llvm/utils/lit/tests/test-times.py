@@ -0,0 +1,37 @@
+# Check that --test-times runs the tests expected to take longest first and
+# records the new times.
+#
+# RUN: cp %{inputs}/test-times/times.json %t.json
+# RUN: %{lit} -j 1 -v --test-times %t.json %{inputs}/test-times > %t.out
+# RUN: FileCheck < %t.out %s
+# RUN: FileCheck --check-prefix=CHECK-TIMES < %t.json %s
+#
+# The output of -o can be read, but is not overwritten.
+# RUN: not %{lit} --test-times %t.results.json -o %t.results.json \
+# RUN:     %{inputs}/test-times 2> %t.err
+# RUN: FileCheck --check-prefix=CHECK-CLASH < %t.err %s
+# RUN: %{lit} -j 1 -o %t.results.json %{inputs}/test-times
+# RUN: cp %t.results.json %t.results.orig
+# RUN: %{lit} -j 1 --test-times %t.results.json %{inputs}/test-times 2> %t.err
+# RUN: FileCheck --check-prefix=CHECK-KEEP < %t.err %s
+# RUN: diff %t.results.orig %t.results.json
+#
+# END.
+
+# A test without a recorded time is expected to take as long as the slowest.
+# CHECK: -- Testing: 4 tests, 1 threads --
+# CHECK-NEXT: PASS: test-times :: c.txt
+# CHECK-NEXT: PASS: test-times :: d.txt
+# CHECK-NEXT: PASS: test-times :: a.txt
+# CHECK-NEXT: PASS: test-times :: b.txt
+# CHECK: Testing Time:
+# CHECK-NEXT: Predicted Testing Time: 9.00s
+
+# CHECK-TIMES: "name": "test-times :: a.txt"
+# CHECK-TIMES: "name": "test-times :: b.txt"
+# CHECK-TIMES: "name": "test-times :: c.txt"
+# CHECK-TIMES: "name": "test-times :: d.txt"
+
+# CHECK-CLASH: --test-times and -o must not name the same file
+
+# CHECK-KEEP: warning: not recording test times in {{.*}}, which is not a test times file
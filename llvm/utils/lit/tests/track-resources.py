@@ -0,0 +1,22 @@
+# Check the CPU time and peak memory recorded with --track-resources.
+#
+# RUN: %{lit} -j 1 -v --track-resources %{inputs}/track-resources > %t.out
+# RUN: FileCheck < %t.out %s
+#
+# CHECK: PASS: track-resources :: allocate.txt
+# CHECK-NEXT: {{\*+}} TEST 'track-resources :: allocate.txt' RESULTS {{\*+}}
+# CHECK-NEXT: cpu_sys_time: {{[0-9.]+}}
+# CHECK-NEXT: cpu_user_time: {{[0-9.]+}}
+# CHECK-NEXT: peak_rss_kb: {{[1-9][0-9][0-9][0-9][0-9][0-9]+}}
+# CHECK-NEXT: {{\*+}}
+#
+# CHECK: PASS: track-resources :: builtin.txt
+# CHECK-NOT: RESULTS
+#
+# CHECK: Slowest Tests:
+# CHECK-NOT: builtin.txt
+# CHECK: Tests CPU Times:
+# CHECK: Largest Tests:
+# CHECK-NEXT: ---
+# CHECK-NEXT: {{[0-9.]+}}MB: track-resources :: allocate.txt
+# CHECK: Tests Peak Memory:
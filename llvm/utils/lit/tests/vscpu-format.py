@@ -0,0 +1,26 @@
+# Check the VSCPU end-to-end test format. The simulator is Python 2 only.
+#
+# REQUIRES: python2.7
+# RUN: not %{lit} -j 1 -v -o %t.json %{inputs}/vscpu-format > %t.out
+# RUN: FileCheck < %t.out %s
+# RUN: FileCheck --check-prefix=CHECK-JSON < %t.json %s
+#
+# END.
+
+# CHECK: -- Testing:
+# CHECK: PASS: vscpu-format :: if_check_lt.cpp
+# CHECK: FAIL: vscpu-format :: parse_error.cpp
+# CHECK-NEXT: *** TEST 'vscpu-format :: parse_error.cpp' FAILED ***
+# CHECK-NEXT: Unable to load {{.*}}parse_error.cpp.asm into memory:
+# CHECK-NEXT: parse error at line 7
+# CHECK-NEXT: "5: sethi 4 %hi(x)"
+# CHECK: PASS: vscpu-format :: summation.cpp
+# CHECK: FAIL: vscpu-format :: wrong_expectation.cpp
+# CHECK-NEXT: *** TEST 'vscpu-format :: wrong_expectation.cpp' FAILED ***
+# CHECK-NEXT: Expectation failed for 10
+# CHECK: Expected Passes    : 2
+# CHECK: Unexpected Failures: 2
+
+# CHECK-JSON: "cycles":
+# CHECK-JSON: "instructions":
+# CHECK-JSON: "program_size":
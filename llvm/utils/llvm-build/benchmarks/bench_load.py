@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+#===- bench_load.py - LLVMBuild.txt Loading Benchmark --------*- python -*--===#
+#
+#                     The LLVM Compiler Infrastructure
+#
+# This file is distributed under the University of Illinois Open Source
+# License. See LICENSE.TXT for details.
+#
+#===------------------------------------------------------------------------===#
+
+"""Time loading the LLVMBuild.txt files of a source tree.
+
+Usage: bench_load.py [options] [<directory>]
+
+The files under <directory>, llvm/lib by default, are loaded serially and
+then with each number of jobs given by --jobs. Every parallel load is checked
+to produce the components in the same order as the serial one.
+"""
+
+from __future__ import print_function
+
+import optparse
+import os
+import sys
+import time
+
+llvm_build_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              os.pardir)
+sys.path.insert(0, llvm_build_dir)
+
+from llvmbuild.main import LLVMProjectInfo
+
+def load(root, jobs):
+    infos = LLVMProjectInfo.load_infos_from_path(root, jobs=jobs)
+    return [(ci.subpath, ci.name) for ci in infos]
+
+def run(label, root, jobs, repeat):
+    start = time.time()
+    for i in range(repeat):
+        components = load(root, jobs)
+    elapsed = time.time() - start
+    print('%-10s %8.3fs %8.1fms per load' % (label, elapsed,
+                                             1000 * elapsed / repeat))
+    return components
+
+def main():
+    parser = optparse.OptionParser(usage=__doc__.split('\n\n')[1])
+    parser.add_option('--jobs', default='2,4,8',
+                      help='Comma separated numbers of jobs [%default]')
+    parser.add_option('--repeat', type=int, default=10,
+                      help='Number of times to load the tree [%default]')
+    opts, args = parser.parse_args()
+    if len(args) > 1:
+        parser.error('expected at most one directory')
+
+    if args:
+        root = os.path.abspath(args[0])
+    else:
+        root = os.path.abspath(os.path.join(llvm_build_dir, os.pardir,
+                                            os.pardir, 'lib'))
+
+    expected = run('serial', root, 1, opts.repeat)
+    print('%d components' % len(expected))
+    for jobs in [int(n) for n in opts.jobs.split(',')]:
+        components = run('-j %d' % jobs, root, jobs, opts.repeat)
+        if components != expected:
+            print('error: components differ with %d jobs' % jobs)
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
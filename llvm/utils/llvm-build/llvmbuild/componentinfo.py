@@ -7,6 +7,12 @@ try:
     import configparser
 except:
     import ConfigParser as configparser
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+import json
+import os
 import sys
 
 from llvmbuild.util import fatal, warning
@@ -422,35 +428,139 @@ _component_type_map = dict(
               LibraryComponentInfo, LibraryGroupComponentInfo,
               ToolComponentInfo, BuildToolComponentInfo,
               TargetGroupComponentInfo, OptionalLibraryComponentInfo))
-def load_from_path(path, subpath):
-    # Load the LLVMBuild.txt file as an .ini format file.
+
+class ParseCache(object):
+    """
+    ParseCache - The parsed sections of LLVMBuild.txt files, kept in a JSON
+    file between runs. A file is parsed again when its modification time or
+    size changes.
+    """
+
+    version = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.used = set()
+        self.modified = False
+        try:
+            f = open(path)
+            try:
+                data = json.load(f)
+            finally:
+                f.close()
+            if data.get('version') == self.version:
+                self.entries = data['files']
+        except (IOError, OSError, ValueError, KeyError):
+            pass
+
+    def _stamp(self, path):
+        st = os.stat(path)
+        return [st.st_mtime, st.st_size]
+
+    def get(self, path):
+        """get(path) -> sections or None"""
+        self.used.add(path)
+        entry = self.entries.get(path)
+        if entry is None or entry['stamp'] != self._stamp(path):
+            return None
+        return entry['sections']
+
+    def set(self, path, sections):
+        self.used.add(path)
+        self.entries[path] = { 'stamp' : self._stamp(path),
+                               'sections' : sections }
+        self.modified = True
+
+    def save(self):
+        """save() - Write the cache, dropping the files that were not used."""
+        for path in list(self.entries):
+            if path not in self.used:
+                del self.entries[path]
+                self.modified = True
+        if not self.modified:
+            return
+
+        f = open(self.path + '.new', 'w')
+        try:
+            json.dump({ 'version' : self.version, 'files' : self.entries }, f)
+        finally:
+            f.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        os.rename(self.path + '.new', self.path)
+        self.modified = False
+
+def _get_sections(parser):
+    return [(section, parser.items(section))
+            for section in parser.sections()]
+
+def _read_sections(path):
+    """
+    _read_sections(path) -> [(section, [(key, value), ...]), ...]
+
+    Parse the LLVMBuild.txt file at path as an .ini format file.
+    """
     parser = configparser.RawConfigParser()
     parser.read(path)
+    return _get_sections(parser)
 
-    # Extract the common section.
-    if parser.has_section("common"):
-        common = IniFormatParser(parser.items("common"))
-        parser.remove_section("common")
-    else:
-        common = IniFormatParser({})
-
-    return common, _read_components_from_parser(parser, path, subpath)
+def parse_sections(job):
+    """
+    parse_sections((path, text)) -> [(section, [(key, value), ...]), ...]
 
-def _read_components_from_parser(parser, path, subpath):
+    Parse the already read contents of the LLVMBuild.txt file at path. This
+    takes a single argument, to be usable with Pool.map().
+    """
+    path, text = job
+    parser = configparser.RawConfigParser()
+    if hasattr(parser, 'read_string'):
+        parser.read_string(text, path)
+    else:
+        parser.readfp(StringIO(text), path)
+    return _get_sections(parser)
+
+def get_common(sections):
+    """get_common(sections) -> IniFormatParser for the common section"""
+    for section, items in sections:
+        if section == "common":
+            return IniFormatParser(items)
+    return IniFormatParser({})
+
+def load_from_path(path, subpath, cache = None):
+    sections = None
+    if cache is not None:
+        sections = cache.get(path)
+    if sections is None:
+        sections = _read_sections(path)
+        if cache is not None:
+            cache.set(path, sections)
+
+    return load_from_sections(sections, path, subpath)
+
+def load_from_sections(sections, path, subpath):
+    components = [(section, items)
+                  for section, items in sections
+                  if section != "common"]
+    return (get_common(sections),
+            _read_components_from_sections(components, path, subpath))
+
+def _read_components_from_sections(sections, path, subpath):
     # We load each section which starts with 'component' as a distinct component
     # description (so multiple components can be described in one file).
-    for section in parser.sections():
+    for section, items in sections:
         if not section.startswith('component'):
             # We don't expect arbitrary sections currently, warn the user.
             warning("ignoring unknown section %r in %r" % (section, path))
             continue
 
         # Determine the type of the component to instantiate.
-        if not parser.has_option(section, 'type'):
+        items = IniFormatParser(items)
+        if 'type' not in items:
             fatal("invalid component %r in %r: %s" % (
                     section, path, "no component type"))
 
-        type_name = parser.get(section, 'type')
+        type_name = items['type']
         type_class = _component_type_map.get(type_name)
         if type_class is None:
             fatal("invalid component %r in %r: %s" % (
@@ -458,8 +568,7 @@ def _read_components_from_parser(parser, path, subpath):
 
         # Instantiate the component based on the remaining values.
         try:
-            info = type_class.parse(subpath,
-                                    IniFormatParser(parser.items(section)))
+            info = type_class.parse(subpath, items)
         except TypeError:
             print >>sys.stderr, "error: invalid component %r in %r: %s" % (
                 section, path, "unable to instantiate: %r" % type_name)
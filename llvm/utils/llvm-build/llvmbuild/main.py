@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 import filecmp
+import multiprocessing
+import multiprocessing.pool
 import os
 import sys
 
@@ -64,17 +66,104 @@ def make_install_dir(path):
 
 class LLVMProjectInfo(object):
     @staticmethod
-    def load_infos_from_path(llvmbuild_source_root):
+    def read_sections_in_parallel(llvmbuild_source_root, cache = None,
+                                  jobs = 2):
+        """
+        read_sections_in_parallel(llvmbuild_source_root, [cache], [jobs])
+            -> {subpath: sections}
+
+        Parse all the LLVMBuild.txt files of the project. The tree is walked
+        one level of subdirectories at a time: the files of a level are read
+        by a pool of threads and parsed by a pool of worker processes.
+        """
+
+        def read_file(path):
+            if not os.path.exists(path):
+                return None
+            f = open(path)
+            try:
+                return f.read()
+            finally:
+                f.close()
+
+        sections_map = {}
+        threads = multiprocessing.pool.ThreadPool(jobs)
+        processes = None
+        try:
+            level = ["/"]
+            while level:
+                paths = [os.path.join(llvmbuild_source_root + subpath,
+                                      'LLVMBuild.txt')
+                         for subpath in level]
+
+                # Only read and parse the files that are not cached.
+                sections = [None] * len(paths)
+                if cache is not None:
+                    sections = [os.path.exists(path) and cache.get(path) or None
+                                for path in paths]
+                missing = [i for i,s in enumerate(sections) if s is None]
+                texts = threads.map(read_file, [paths[i] for i in missing])
+                for i,text in zip(missing, texts):
+                    if text is None:
+                        fatal("missing LLVMBuild.txt file at: %r" % (
+                                paths[i],))
+
+                jobs_to_parse = [(paths[i], text)
+                                 for i,text in zip(missing, texts)]
+                if len(jobs_to_parse) > 1:
+                    if processes is None:
+                        processes = multiprocessing.Pool(jobs)
+                    parsed = processes.map(componentinfo.parse_sections,
+                                           jobs_to_parse)
+                else:
+                    parsed = [componentinfo.parse_sections(job)
+                              for job in jobs_to_parse]
+                for i,result in zip(missing, parsed):
+                    sections[i] = result
+                    if cache is not None:
+                        cache.set(paths[i], result)
+
+                next_level = []
+                for subpath,result in zip(level, sections):
+                    sections_map[subpath] = result
+                    for subdir in componentinfo.get_common(result).get_list(
+                            "subdirectories"):
+                        child = os.path.join(subpath, subdir)
+                        if child not in sections_map:
+                            next_level.append(child)
+                level = next_level
+        finally:
+            threads.terminate()
+            if processes is not None:
+                processes.terminate()
+
+        return sections_map
+
+    @staticmethod
+    def load_infos_from_path(llvmbuild_source_root, cache = None, jobs = 1):
+        # With multiple jobs, parse all the files up front. The components are
+        # still produced by the walk below, so their order does not depend on
+        # the number of jobs.
+        sections_map = None
+        if jobs > 1:
+            sections_map = LLVMProjectInfo.read_sections_in_parallel(
+                llvmbuild_source_root, cache, jobs)
+
         def recurse(subpath):
             # Load the LLVMBuild file.
             llvmbuild_path = os.path.join(llvmbuild_source_root + subpath,
                                           'LLVMBuild.txt')
-            if not os.path.exists(llvmbuild_path):
-                fatal("missing LLVMBuild.txt file at: %r" % (llvmbuild_path,))
 
             # Parse the components from it.
-            common,info_iter = componentinfo.load_from_path(llvmbuild_path,
-                                                            subpath)
+            if sections_map is not None:
+                common,info_iter = componentinfo.load_from_sections(
+                    sections_map[subpath], llvmbuild_path, subpath)
+            else:
+                if not os.path.exists(llvmbuild_path):
+                    fatal("missing LLVMBuild.txt file at: %r" % (
+                            llvmbuild_path,))
+                common,info_iter = componentinfo.load_from_path(
+                    llvmbuild_path, subpath, cache)
             for info in info_iter:
                 yield info
 
@@ -86,9 +175,11 @@ class LLVMProjectInfo(object):
         return recurse("/")
 
     @staticmethod
-    def load_from_path(source_root, llvmbuild_source_root):
+    def load_from_path(source_root, llvmbuild_source_root, cache = None,
+                       jobs = 1):
         infos = list(
-            LLVMProjectInfo.load_infos_from_path(llvmbuild_source_root))
+            LLVMProjectInfo.load_infos_from_path(llvmbuild_source_root, cache,
+                                                 jobs))
 
         return LLVMProjectInfo(source_root, infos)
 
@@ -99,6 +190,11 @@ class LLVMProjectInfo(object):
         self.component_info_map = None
         self.ordered_component_infos = None
 
+        # The memoized results of get_required_libraries_for_component() and
+        # get_fragment_dependencies().
+        self._required_libraries = {}
+        self._fragment_dependencies = None
+
     def validate_components(self):
         """validate_components() -> None
 
@@ -193,6 +289,9 @@ class LLVMProjectInfo(object):
         for c in self.ordered_component_infos:
             c.children.sort(key = lambda c: c.name)
 
+        # The dependency graph may have changed.
+        self._required_libraries = {}
+
     def print_tree(self):
         def visit(node, depth = 0):
             print('%s%-40s (%s)' % ('  '*depth, node.name, node.type_name))
@@ -441,28 +540,40 @@ subdirectories = %s
         of the directly required libraries for linking with this component. If
         traverse_groups is True, then library and target groups will be
         traversed to include their required libraries.
+
+        The result for each component is computed once, from the memoized
+        results of the groups it requires.
         """
 
         assert ci.type_name in ('Library', 'OptionalLibrary', 'LibraryGroup', 'TargetGroup')
 
+        key = (ci.name, traverse_groups)
+        required = self._required_libraries.get(key)
+        if required is not None:
+            return iter(required)
+
+        required = []
         for name in ci.required_libraries:
             # Get the dependency info.
             dep = self.component_info_map[name]
 
-            # If it is a library, yield it.
+            # If it is a library, add it.
             if dep.type_name == 'Library' or dep.type_name == 'OptionalLibrary':
-                yield dep
+                required.append(dep)
                 continue
 
-            # Otherwise if it is a group, yield or traverse depending on what
-            # was requested.
+            # Otherwise if it is a group, add it or traverse it depending on
+            # what was requested.
             if dep.type_name in ('LibraryGroup', 'TargetGroup'):
                 if not traverse_groups:
-                    yield dep
+                    required.append(dep)
                     continue
 
-                for res in self.get_required_libraries_for_component(dep, True):
-                    yield res
+                required.extend(
+                    self.get_required_libraries_for_component(dep, True))
+
+        self._required_libraries[key] = required
+        return iter(required)
 
     def get_fragment_dependencies(self):
         """
@@ -470,9 +581,15 @@ subdirectories = %s
 
         Compute the list of files (as absolute paths) on which the output
         fragments depend (i.e., files for which a modification should trigger a
-        rebuild of the fragment).
+        rebuild of the fragment). The list is computed once.
         """
 
+        if self._fragment_dependencies is None:
+            self._fragment_dependencies = list(
+                self._compute_fragment_dependencies())
+        return iter(self._fragment_dependencies)
+
+    def _compute_fragment_dependencies(self):
         # Construct a list of all the dependencies of the Makefile fragment
         # itself. These include all the LLVMBuild files themselves, as well as
         # all of our own sources.
@@ -856,6 +973,14 @@ def main():
     group.add_option("", "--build-root", dest="build_root", metavar="PATH",
                       help="Path to the build directory (if needed) [%default]",
                       action="store", default=None)
+    group.add_option("", "--parse-cache", dest="parse_cache", metavar="PATH",
+                     help=("Reuse the parsed LLVMBuild.txt files stored in "
+                           "PATH, for files which have not changed"),
+                     action="store", default=None)
+    group.add_option("-j", "--jobs", dest="jobs", metavar="N", type=int,
+                     help=("Number of threads and processes to load the "
+                           "LLVMBuild.txt files with [%default]"),
+                     action="store", default=1)
     parser.add_option_group(group)
 
     group = OptionGroup(parser, "Output Options")
@@ -928,8 +1053,13 @@ given by --build-root) at the same SUBPATH""",
 
     # Construct the LLVM project information.
     llvmbuild_source_root = opts.llvmbuild_source_root or source_root
+    cache = None
+    if opts.parse_cache:
+        cache = componentinfo.ParseCache(opts.parse_cache)
     project_info = LLVMProjectInfo.load_from_path(
-        source_root, llvmbuild_source_root)
+        source_root, llvmbuild_source_root, cache, opts.jobs)
+    if cache is not None:
+        cache.save()
 
     # Add the magic target based components.
     add_magic_target_components(parser, project_info, opts)
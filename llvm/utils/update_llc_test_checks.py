@@ -2,13 +2,16 @@
 
 """A test case update script.
 
-This script is a utility to update LLVM X86 'llc' based test cases with new
-FileCheck patterns. It can either update all of the tests in the file or
-a single test function.
+This script is a utility to update LLVM X86 and Sparc 'llc' based test cases
+with new FileCheck patterns. It can either update all of the tests in the file
+or a single test function.
 """
 
 import argparse
+import distutils.spawn
+import hashlib
 import itertools
+import multiprocessing
 import os         # Used to advertise this file's name ("autogenerated_note").
 import string
 import subprocess
@@ -26,6 +29,54 @@ def llc(args, cmd_args, ir):
   return stdout
 
 
+def hash_file(path):
+  h = hashlib.sha1()
+  with open(path, 'rb') as f:
+    for chunk in iter(lambda: f.read(1 << 20), b''):
+      h.update(chunk)
+  return h.hexdigest()
+
+
+def find_llc_binary(llc_binary):
+  if os.path.dirname(llc_binary):
+    return llc_binary
+  return distutils.spawn.find_executable(llc_binary)
+
+
+def hash_ir(input_lines):
+  # Comment lines, such as the CHECK lines this script rewrites, do not change
+  # the output of llc.
+  h = hashlib.sha1()
+  for l in input_lines:
+    if not l.lstrip().startswith(';'):
+      h.update(l + '\n')
+  return h.hexdigest()
+
+
+# Invoke llc through the output cache, if there is one. Outputs are keyed on
+# the contents of the llc binary, its arguments and the IR of the test.
+def cached_llc(args, cmd_args, ir, ir_hash):
+  if not args.cache_dir or not args.llc_hash:
+    return llc(args, cmd_args, ir)
+
+  key = hashlib.sha1('\0'.join([args.llc_hash, cmd_args, ir_hash]))
+  path = os.path.join(args.cache_dir, key.hexdigest())
+  try:
+    with open(path, 'rb') as f:
+      return f.read()
+  except IOError:
+    pass
+
+  stdout = llc(args, cmd_args, ir)
+  # Write to a temporary file first, so that concurrent runs never see a
+  # partial output.
+  fd, tmp = tempfile.mkstemp(dir=args.cache_dir)
+  with os.fdopen(fd, 'wb') as f:
+    f.write(stdout)
+  os.rename(tmp, path)
+  return stdout
+
+
 # RegEx: this is where the magic happens.
 
 SCRUB_WHITESPACE_RE = re.compile(r'(?!^(|  \w))[ \t]+', flags=re.M)
@@ -38,18 +89,45 @@ SCRUB_X86_SP_RE = re.compile(r'\d+\(%(esp|rsp)\)')
 SCRUB_X86_RIP_RE = re.compile(r'[.\w]+\(%rip\)')
 SCRUB_KILL_COMMENT_RE = re.compile(r'^ *#+ +kill:.*\n')
 
+# Sparc output, as printed by the VSCPU backend. The running instruction
+# numbers and temporary labels depend on the functions before, so they are
+# matched generically. This is a single regex, so that the body is scrubbed
+# in one pass.
+SCRUB_SPARC_RE = re.compile(
+    r'(?P<index>^\d+:)'
+    r'|(?P<tmp>\.Ltmp\d+)'
+    r'|(?P<trailing>[ \t]+$)'
+    r'|(?P<indent>^[ \t]+)'
+    r'|(?P<space>[ \t]+)',
+    flags=re.M)
+SCRUB_SPARC_REPLACEMENTS = {
+    'index': '{{[0-9]+}}:',
+    'tmp': '{{\\.Ltmp[0-9]+}}',
+    'trailing': '',
+    'indent': '  ',
+    'space': ' ',
+}
+
 RUN_LINE_RE = re.compile('^\s*;\s*RUN:\s*(.*)$')
 IR_FUNCTION_RE = re.compile('^\s*define\s+(?:internal\s+)?[^@]*@(\w+)\s*\(')
-ASM_FUNCTION_RE = re.compile(
+IR_TRIPLE_RE = re.compile(r'^\s*target\s+triple\s*=\s*"([^"]+)"')
+ASM_FUNCTION_X86_RE = re.compile(
     r'^_?(?P<func>[^:]+):[ \t]*#+[ \t]*@(?P=func)\n[^:]*?'
     r'(?P<body>^##?[ \t]+[^:]+:.*?)\s*'
     r'^\s*(?:[^:\n]+?:\s*\n\s*\.size|\.cfi_endproc|\.globl|\.comm|\.(?:sub)?section)',
     flags=(re.M | re.S))
+ASM_FUNCTION_SPARC_RE = re.compile(
+    r'^(?P<func>[^:\s]+):[ \t]*!+[ \t]*@(?P=func)\n[^:]*?'
+    r'(?P<body>^![ \t]+[^:]+:.*?)\s*'
+    r'^\.Lfunc_end\d+:\n',
+    flags=(re.M | re.S))
 CHECK_PREFIX_RE = re.compile('--check-prefix=(\S+)')
 CHECK_RE = re.compile(r'^\s*;\s*([^:]+?)(?:-NEXT|-NOT|-DAG|-LABEL)?:')
+MARCH_ARG_RE = re.compile(r'-march[= ](\S+)')
+TRIPLE_ARG_RE = re.compile(r'-mtriple[= ](\S+)')
 
 
-def scrub_asm(asm):
+def scrub_asm_x86(asm):
   # Scrub runs of whitespace out of the assembly, but leave the leading
   # whitespace in place.
   asm = SCRUB_WHITESPACE_RE.sub(r' ', asm)
@@ -68,9 +146,39 @@ def scrub_asm(asm):
   return asm
 
 
+def scrub_asm_sparc(asm):
+  return SCRUB_SPARC_RE.sub(
+      lambda m: SCRUB_SPARC_REPLACEMENTS[m.lastgroup], asm)
+
+
+# The function body regex and the scrubber for the output of each target.
+ASM_SCRUBBERS = {
+    'x86': (ASM_FUNCTION_X86_RE, scrub_asm_x86),
+    'sparc': (ASM_FUNCTION_SPARC_RE, scrub_asm_sparc),
+}
+
+
+# Pick the scrubber for a RUN line from its -march or -mtriple, or else from
+# the triple of the IR. Tests for other targets are scrubbed as x86 output.
+def get_run_target(llc_args, ir_triple):
+  m = MARCH_ARG_RE.search(llc_args) or TRIPLE_ARG_RE.search(llc_args)
+  arch = m.group(1) if m else ir_triple
+  if not arch:
+    return 'x86'
+  arch = arch.split('-')[0]
+  if arch.startswith('sparc'):
+    return 'sparc'
+  if arch not in ('x86', 'x86_64', 'i386', 'i486', 'i586', 'i686'):
+    print >>sys.stderr, ('WARNING: No scrubber for %s, using the x86 one'
+                         % (arch,))
+  return 'x86'
+
+
 # Build up a dictionary of all the function bodies.
-def build_function_body_dictionary(raw_tool_output, prefixes, func_dict, verbose):
-  for m in ASM_FUNCTION_RE.finditer(raw_tool_output):
+def build_function_body_dictionary(raw_tool_output, target, prefixes, func_dict,
+                                   verbose):
+  function_re, scrub_asm = ASM_SCRUBBERS[target]
+  for m in function_re.finditer(raw_tool_output):
     if not m:
       continue
     func = m.group('func')
@@ -132,120 +240,179 @@ def should_add_line_to_output(input_line, prefix_set):
   return True
 
 
-def main():
-  parser = argparse.ArgumentParser(description=__doc__)
-  parser.add_argument('-v', '--verbose', action='store_true',
-                      help='Show verbose output')
-  parser.add_argument('--llc-binary', default='llc',
-                      help='The "llc" binary to use to generate the test case')
-  parser.add_argument(
-      '--function', help='The function in the test file to update')
-  parser.add_argument('tests', nargs='+')
-  args = parser.parse_args()
-
+def update_test(args, test):
   autogenerated_note = ('; NOTE: Assertions have been autogenerated by '
                         + os.path.basename(__file__))
 
-  for test in args.tests:
-    if args.verbose:
-      print >>sys.stderr, 'Scanning for RUN lines in test file: %s' % (test,)
-    with open(test) as f:
-      input_lines = [l.rstrip() for l in f]
-
-    run_lines = [m.group(1)
-                 for m in [RUN_LINE_RE.match(l) for l in input_lines] if m]
-    if args.verbose:
-      print >>sys.stderr, 'Found %d RUN lines:' % (len(run_lines),)
-      for l in run_lines:
-        print >>sys.stderr, '  RUN: ' + l
+  if args.verbose:
+    print >>sys.stderr, 'Scanning for RUN lines in test file: %s' % (test,)
+  with open(test) as f:
+    input_lines = [l.rstrip() for l in f]
 
-    prefix_list = []
+  run_lines = [m.group(1)
+               for m in [RUN_LINE_RE.match(l) for l in input_lines] if m]
+  if args.verbose:
+    print >>sys.stderr, 'Found %d RUN lines:' % (len(run_lines),)
     for l in run_lines:
-      (llc_cmd, filecheck_cmd) = tuple([cmd.strip() for cmd in l.split('|', 1)])
-      if not llc_cmd.startswith('llc '):
-        print >>sys.stderr, 'WARNING: Skipping non-llc RUN line: ' + l
-        continue
+      print >>sys.stderr, '  RUN: ' + l
 
-      if not filecheck_cmd.startswith('FileCheck '):
-        print >>sys.stderr, 'WARNING: Skipping non-FileChecked RUN line: ' + l
-        continue
+  prefix_list = []
+  for l in run_lines:
+    (llc_cmd, filecheck_cmd) = tuple([cmd.strip() for cmd in l.split('|', 1)])
+    if not llc_cmd.startswith('llc '):
+      print >>sys.stderr, 'WARNING: Skipping non-llc RUN line: ' + l
+      continue
 
-      llc_cmd_args = llc_cmd[len('llc'):].strip()
-      llc_cmd_args = llc_cmd_args.replace('< %s', '').replace('%s', '').strip()
-
-      check_prefixes = [m.group(1)
-                        for m in CHECK_PREFIX_RE.finditer(filecheck_cmd)]
-      if not check_prefixes:
-        check_prefixes = ['CHECK']
-
-      # FIXME: We should use multiple check prefixes to common check lines. For
-      # now, we just ignore all but the last.
-      prefix_list.append((check_prefixes, llc_cmd_args))
-
-    func_dict = {}
-    for prefixes, _ in prefix_list:
-      for prefix in prefixes:
-        func_dict.update({prefix: dict()})
-    for prefixes, llc_args in prefix_list:
-      if args.verbose:
-        print >>sys.stderr, 'Extracted LLC cmd: llc ' + llc_args
-        print >>sys.stderr, 'Extracted FileCheck prefixes: ' + str(prefixes)
-
-      raw_tool_output = llc(args, llc_args, test)
-      build_function_body_dictionary(raw_tool_output, prefixes, func_dict, args.verbose)
-
-    is_in_function = False
-    is_in_function_start = False
-    prefix_set = set([prefix for prefixes, _ in prefix_list for prefix in prefixes])
-    if args.verbose:
-      print >>sys.stderr, 'Rewriting FileCheck prefixes: %s' % (prefix_set,)
-    output_lines = []
-    output_lines.append(autogenerated_note)
+    if not filecheck_cmd.startswith('FileCheck '):
+      print >>sys.stderr, 'WARNING: Skipping non-FileChecked RUN line: ' + l
+      continue
 
-    for input_line in input_lines:
-      if is_in_function_start:
-        if input_line == '':
-          continue
-        if input_line.lstrip().startswith(';'):
-          m = CHECK_RE.match(input_line)
-          if not m or m.group(1) not in prefix_set:
-            output_lines.append(input_line)
-            continue
-
-        # Print out the various check lines here.
-        output_lines = add_checks(output_lines, prefix_list, func_dict, name)
-        is_in_function_start = False
-
-      if is_in_function:
-        if should_add_line_to_output(input_line, prefix_set) == True:
-          # This input line of the function body will go as-is into the output.
+    llc_cmd_args = llc_cmd[len('llc'):].strip()
+    llc_cmd_args = llc_cmd_args.replace('< %s', '').replace('%s', '').strip()
+
+    check_prefixes = [m.group(1)
+                      for m in CHECK_PREFIX_RE.finditer(filecheck_cmd)]
+    if not check_prefixes:
+      check_prefixes = ['CHECK']
+
+    # FIXME: We should use multiple check prefixes to common check lines. For
+    # now, we just ignore all but the last.
+    prefix_list.append((check_prefixes, llc_cmd_args))
+
+  func_dict = {}
+  for prefixes, _ in prefix_list:
+    for prefix in prefixes:
+      func_dict.update({prefix: dict()})
+  # RUN lines differing only in their FileCheck prefixes share one llc run.
+  raw_tool_outputs = {}
+  ir_hash = hash_ir(input_lines)
+  ir_triple = None
+  for l in input_lines:
+    m = IR_TRIPLE_RE.match(l)
+    if m:
+      ir_triple = m.group(1)
+      break
+  for prefixes, llc_args in prefix_list:
+    if args.verbose:
+      print >>sys.stderr, 'Extracted LLC cmd: llc ' + llc_args
+      print >>sys.stderr, 'Extracted FileCheck prefixes: ' + str(prefixes)
+
+    if llc_args not in raw_tool_outputs:
+      raw_tool_outputs[llc_args] = cached_llc(args, llc_args, test, ir_hash)
+    raw_tool_output = raw_tool_outputs[llc_args]
+    target = get_run_target(llc_args, ir_triple)
+    build_function_body_dictionary(raw_tool_output, target, prefixes,
+                                   func_dict, args.verbose)
+
+  is_in_function = False
+  is_in_function_start = False
+  prefix_set = set([prefix for prefixes, _ in prefix_list for prefix in prefixes])
+  if args.verbose:
+    print >>sys.stderr, 'Rewriting FileCheck prefixes: %s' % (prefix_set,)
+  output_lines = []
+  output_lines.append(autogenerated_note)
+
+  for input_line in input_lines:
+    if is_in_function_start:
+      if input_line == '':
+        continue
+      if input_line.lstrip().startswith(';'):
+        m = CHECK_RE.match(input_line)
+        if not m or m.group(1) not in prefix_set:
           output_lines.append(input_line)
-        else:
           continue
-        if input_line.strip() == '}':
-          is_in_function = False
-        continue
 
-      if input_line == autogenerated_note:
+      # Print out the various check lines here.
+      output_lines = add_checks(output_lines, prefix_list, func_dict, name)
+      is_in_function_start = False
+
+    if is_in_function:
+      if should_add_line_to_output(input_line, prefix_set) == True:
+        # This input line of the function body will go as-is into the output.
+        output_lines.append(input_line)
+      else:
         continue
+      if input_line.strip() == '}':
+        is_in_function = False
+      continue
 
-      # If it's outside a function, it just gets copied to the output.
-      output_lines.append(input_line)
+    if input_line == autogenerated_note:
+      continue
 
-      m = IR_FUNCTION_RE.match(input_line)
-      if not m:
-        continue
-      name = m.group(1)
-      if args.function is not None and name != args.function:
-        # When filtering on a specific function, skip all others.
-        continue
-      is_in_function = is_in_function_start = True
+    # If it's outside a function, it just gets copied to the output.
+    output_lines.append(input_line)
 
-    if args.verbose:
-      print>>sys.stderr, 'Writing %d lines to %s...' % (len(output_lines), test)
+    m = IR_FUNCTION_RE.match(input_line)
+    if not m:
+      continue
+    name = m.group(1)
+    if args.function is not None and name != args.function:
+      # When filtering on a specific function, skip all others.
+      continue
+    is_in_function = is_in_function_start = True
+
+  if args.verbose:
+    print>>sys.stderr, 'Writing %d lines to %s...' % (len(output_lines), test)
+
+  with open(test, 'wb') as f:
+    f.writelines([l + '\n' for l in output_lines])
+
+
+
+# Run update_test in a worker process, reporting failures instead of raising
+# them, so that one broken test does not stop the others.
+def update_test_worker(job):
+  args, test = job
+  try:
+    update_test(args, test)
+  except Exception as e:
+    return '%s: %s' % (test, e)
+  return None
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('-v', '--verbose', action='store_true',
+                      help='Show verbose output')
+  parser.add_argument('--llc-binary', default='llc',
+                      help='The "llc" binary to use to generate the test case')
+  parser.add_argument(
+      '--function', help='The function in the test file to update')
+  parser.add_argument('-j', '--jobs', type=int, default=1,
+                      help='The number of test files to update in parallel')
+  parser.add_argument('--cache-dir',
+                      help='Reuse the llc outputs stored in this directory '
+                           'for unchanged llc binaries, arguments and IR')
+  parser.add_argument('tests', nargs='+')
+  args = parser.parse_args()
 
-    with open(test, 'wb') as f:
-      f.writelines([l + '\n' for l in output_lines])
+  args.llc_hash = None
+  if args.cache_dir:
+    if not os.path.isdir(args.cache_dir):
+      os.makedirs(args.cache_dir)
+    llc_path = find_llc_binary(args.llc_binary)
+    if llc_path and os.path.isfile(llc_path):
+      args.llc_hash = hash_file(llc_path)
+    else:
+      print >>sys.stderr, ('WARNING: Cannot find %s, not caching its output'
+                           % (args.llc_binary,))
+
+  if args.jobs <= 1 or len(args.tests) <= 1:
+    for test in args.tests:
+      update_test(args, test)
+    return
+
+  pool = multiprocessing.Pool(min(args.jobs, len(args.tests)))
+  try:
+    errors = pool.map(update_test_worker,
+                      [(args, test) for test in args.tests], chunksize=1)
+  finally:
+    pool.terminate()
+  errors = [e for e in errors if e is not None]
+  for e in errors:
+    print >>sys.stderr, 'ERROR: ' + e
+  if errors:
+    sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,69 @@
+import os, sys, tempfile
+import cleaner
+import vscpu
+
+MAX_STEPS = 1000000
+
+class Discard(object):
+    def write(self, text):
+        pass
+
+def write_lines(lines, filename):
+    out = open(filename, "w")
+    for line in lines:
+        out.write(line + "\n")
+    out.close()
+
+def executed(lines, workdir):
+    asm = os.path.join(workdir, "prog.asm")
+    memin = os.path.join(workdir, "prog.in")
+    write_lines(lines, asm)
+    stdout = sys.stdout
+    sys.stdout = Discard()
+    try:
+        vscpu.memgen(asm, memin)
+        cpu = vscpu.CpuState()
+        cpu.readmem(memin)
+        while not cpu.pause and cpu.steps < MAX_STEPS:
+            cpu.execute()
+    except (SystemExit, IndexError):
+        return None
+    finally:
+        sys.stdout = stdout
+    if cpu.steps == MAX_STEPS:
+        return None
+    return cpu.steps
+
+def main():
+    workdir = tempfile.mkdtemp()
+    total_before = 0
+    total_after = 0
+    print("{0:32} {1:>8} {2:>8} {3:>8}".format("test", "before", "after", "saved"))
+    for source in sorted(os.listdir("tests/sources")):
+        name = os.path.splitext(source)[0]
+        filename = "tests/ses/" + name + ".s"
+        if not os.path.exists(filename):
+            continue
+        lines = open(filename).read().splitlines()
+        before = executed(cleaner.clean(lines, False), workdir)
+        after = executed(cleaner.clean(lines, True), workdir)
+        if before == None or after == None:
+            print("{0:32} {1:>8}".format(name, "failed"))
+            continue
+        total_before += before
+        total_after += after
+        saved = 0.0
+        if before:
+            saved = 100.0 * (before - after) / before
+        print("{0:32} {1:8} {2:8} {3:7.1f}%".format(name, before, after, saved))
+    saved = 0.0
+    if total_before:
+        saved = 100.0 * (total_before - total_after) / total_before
+    print("{0:32} {1:8} {2:8} {3:7.1f}%".format("total", total_before, total_after, saved))
+    for filename in os.listdir(workdir):
+        os.remove(os.path.join(workdir, filename))
+    os.rmdir(workdir)
+
+
+if __name__ == "__main__":
+    main()
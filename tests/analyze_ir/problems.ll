@@ -0,0 +1,73 @@
+; Functions for test_analyze_ir.py, each with one kind of problem that the
+; VSCPU pipeline cannot handle, and a main that it can.
+
+define float @float_add(float %a) {
+  %r = fadd float %a, 1.0
+  ret float %r
+}
+
+define i64 @wide_add(i64 %a) {
+  %r = add i64 %a, 1
+  ret i64 %r
+}
+
+define i32 @large_immediate(i32 %a) {
+  %r = add i32 %a, 100000
+  ret i32 %r
+}
+
+define void @nested_loops(i32 %n) {
+entry:
+  br label %outer
+
+outer:
+  %i = phi i32 [ 0, %entry ], [ %i.next, %outer.latch ]
+  br label %inner
+
+inner:
+  %j = phi i32 [ 0, %outer ], [ %j.next, %inner ]
+  %j.next = add i32 %j, 1
+  %inner.cond = icmp slt i32 %j.next, %n
+  br i1 %inner.cond, label %inner, label %outer.latch
+
+outer.latch:
+  %i.next = add i32 %i, 1
+  %outer.cond = icmp slt i32 %i.next, %n
+  br i1 %outer.cond, label %outer, label %exit
+
+exit:
+  br label %return
+
+return:
+  ret void
+}
+
+define void @early_return(i32 %a) {
+entry:
+  %c = icmp slt i32 %a, 6
+  br i1 %c, label %return, label %work
+
+work:
+  br label %return
+
+return:
+  ret void
+}
+
+define void @forever() {
+  call void @forever()
+  ret void
+}
+
+define i32 @main() {
+entry:
+  %c = icmp slt i32 1, 2
+  br i1 %c, label %then, label %end
+
+then:
+  br label %end
+
+end:
+  %r = phi i32 [ 3, %entry ], [ 4, %then ]
+  ret i32 %r
+}
@@ -3,13 +3,11 @@
 2: CPi 16315 14
 3: MUL 16315 16316
 4: CP 16344 16315
-5: CPi 16383 0
-6: CP 16343 16383
-7: CP 16383 16349
-8: CPi 16315 4
-9: MUL 16315 16316
-10: ADD 16383 16315
-11: CPIi 16383 16344
+5: CPi 16343 0
+6: CPi 16315 4
+7: MUL 16315 16316
+8: CPi 16383 16309
+9: CPIi 16383 16344
 16316: 4294967295
 16319: 0
 16349: 16313
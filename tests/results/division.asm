@@ -1,13 +1,11 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16344 3
-3: CPi 16383 0
-4: CP 16343 16383
-5: CP 16383 16349
-6: CPi 16315 4
-7: MUL 16315 16316
-8: ADD 16383 16315
-9: CPIi 16383 16344
+3: CPi 16343 0
+4: CPi 16315 4
+5: MUL 16315 16316
+6: CPi 16383 16309
+7: CPIi 16383 16344
 16316: 4294967295
 16319: 0
 16349: 16313
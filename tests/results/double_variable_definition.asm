@@ -1,19 +1,14 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 72
-3: CP 16383 16349
-4: CPi 16315 4
-5: MUL 16315 16316
-6: ADD 16383 16315
-7: CPIi 16383 16343
-8: CPi 16344 43
-9: CPi 16383 0
-10: CP 16343 16383
-11: CP 16383 16349
-12: CPi 16315 8
-13: MUL 16315 16316
-14: ADD 16383 16315
-15: CPIi 16383 16344
+3: CPi 16383 16309
+4: CPIi 16383 16343
+5: CPi 16344 43
+6: CPi 16343 0
+7: CPi 16315 8
+8: MUL 16315 16316
+9: CPi 16383 16305
+10: CPIi 16383 16344
 16316: 4294967295
 16319: 0
 16349: 16313
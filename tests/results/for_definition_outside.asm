@@ -1,75 +1,40 @@
 0: BZJi 1 0
 1: 2
-2: CP 16383 16349
-3: CPi 16315 4
-4: MUL 16315 16316
-5: ADD 16383 16315
-6: CPIi 16383 16319
-7: CP 16383 16349
-8: CPi 16315 8
-9: MUL 16315 16316
-10: ADD 16383 16315
-11: CPIi 16383 16319
-12: CP 16383 16349
-13: CPi 16315 12
-14: MUL 16315 16316
-15: ADD 16383 16315
-16: CPIi 16383 16319
-17: BZJi 47 0
-18: BZJi 19 0
-19: 20
-20: CP 16383 16349
-21: CPi 16315 8
-22: MUL 16315 16316
-23: ADD 16383 16315
-24: CP 16343 16383
-25: CPI 16343 16343
-26: CP 16343 16343
-27: ADDi 16343 1
-28: CP 16383 16349
-29: CPi 16315 8
-30: MUL 16315 16316
-31: ADD 16383 16315
-32: CPIi 16383 16343
-33: CP 16383 16349
-34: CPi 16315 12
-35: MUL 16315 16316
-36: ADD 16383 16315
-37: CP 16343 16383
-38: CPI 16343 16343
-39: CP 16343 16343
-40: ADDi 16343 1
-41: CP 16383 16349
-42: CPi 16315 12
-43: MUL 16315 16316
-44: ADD 16383 16315
-45: CPIi 16383 16343
-46: BZJi 47 0
-47: 48
-48: CP 16383 16349
-49: CPi 16315 12
-50: MUL 16315 16316
-51: ADD 16383 16315
-52: CP 16343 16383
-53: CP 16317 16343
-54: CPI 16317 16317
-55: CPi 16318 4
-56: LT 16318 16317
-57: LTi 16317 4
-58: BZJ 19 16318
-59: BZJi 60 0
-60: 61
-61: CP 16383 16349
-62: CPi 16315 4
-63: MUL 16315 16316
-64: ADD 16383 16315
-65: CP 16343 16383
-66: CPi 16344 3
-67: CP 16383 16349
-68: CPi 16315 16
-69: MUL 16315 16316
-70: ADD 16383 16315
-71: CPIi 16383 16344
+2: CPi 16383 16309
+3: CPIi 16383 16319
+4: CPi 16383 16305
+5: CPIi 16383 16319
+6: CPi 16383 16301
+7: CPIi 16383 16319
+8: BZJi 22 0
+9: BZJi 10 0
+10: 11
+11: CPi 16343 16305
+12: CPI 16343 16343
+13: ADDi 16343 1
+14: CPi 16383 16305
+15: CPIi 16383 16343
+16: CPi 16343 16301
+17: CPI 16343 16343
+18: ADDi 16343 1
+19: CPi 16383 16301
+20: CPIi 16383 16343
+21: BZJi 22 0
+22: 23
+23: CPi 16317 16301
+24: CPI 16317 16317
+25: CPi 16318 4
+26: LT 16318 16317
+27: LTi 16317 4
+28: BZJ 10 16318
+29: BZJi 30 0
+30: 31
+31: CPi 16343 16309
+32: CPi 16344 3
+33: CPi 16315 16
+34: MUL 16315 16316
+35: CPi 16383 16297
+36: CPIi 16383 16344
 16316: 4294967295
 16319: 0
 16349: 16313
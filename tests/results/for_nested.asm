@@ -1,109 +1,72 @@
 0: BZJi 1 0
 1: 2
-2: CP 16383 16349
-3: CPi 16315 4
-4: MUL 16315 16316
-5: ADD 16383 16315
-6: CPIi 16383 16319
-7: CP 16383 16349
-8: CPi 16315 8
-9: MUL 16315 16316
-10: ADD 16383 16315
-11: CPIi 16383 16319
-12: CP 16383 16349
-13: CPi 16315 12
-14: MUL 16315 16316
-15: ADD 16383 16315
-16: CPIi 16383 16319
-17: BZJi 34 0
-18: BZJi 19 0
-19: 20
-20: CP 16383 16349
-21: CPi 16315 12
-22: MUL 16315 16316
-23: ADD 16383 16315
-24: CP 16343 16383
-25: CPI 16343 16343
-26: CP 16343 16343
-27: ADDi 16343 1
-28: CP 16383 16349
-29: CPi 16315 12
-30: MUL 16315 16316
-31: ADD 16383 16315
-32: CPIi 16383 16343
-33: BZJi 34 0
-34: 35
-35: ! Child Loop
-36: BB0_3 Depth 2
-37: CP 16383 16349
-38: CPi 16315 12
-39: MUL 16315 16316
-40: ADD 16383 16315
-41: CP 16343 16383
-42: CP 16317 16343
-43: CPI 16317 16317
-44: CPi 16318 4
-45: LT 16318 16317
-46: LTi 16317 4
-47: LTi 16318 1
-48: BZJ 100 16318
-49: BZJi 50 0
-50: 51
-51: CP 16383 16349
-52: CPi 16315 16
-53: MUL 16315 16316
-54: ADD 16383 16315
-55: CPIi 16383 16319
-56: BZJi 86 0
-57: BZJi 58 0
-58: 59
-59: CP 16383 16349
-60: CPi 16315 8
-61: MUL 16315 16316
-62: ADD 16383 16315
-63: CP 16343 16383
-64: CP 16383 16349
-65: CPi 16315 16
+2: CPi 16383 16309
+3: CPIi 16383 16319
+4: CPi 16383 16305
+5: CPIi 16383 16319
+6: CPi 16315 12
+7: MUL 16315 16316
+8: CPi 16383 16301
+9: CPIi 16383 16319
+10: BZJi 21 0
+11: BZJi 12 0
+12: 13
+13: CPi 16343 16301
+14: CPI 16343 16343
+15: ADDi 16343 1
+16: CPi 16315 12
+17: MUL 16315 16316
+18: CPi 16383 16301
+19: CPIi 16383 16343
+20: BZJi 21 0
+21: 22
+22: ! Child Loop
+23: BB0_3 Depth 2
+24: CPi 16343 16301
+25: CPi 16317 16301
+26: CPI 16317 16317
+27: CPi 16318 4
+28: LT 16318 16317
+29: LTi 16317 4
+30: LTi 16318 1
+31: BZJ 64 16318
+32: BZJi 33 0
+33: 34
+34: CPi 16315 16
+35: MUL 16315 16316
+36: CPi 16383 16297
+37: CPIi 16383 16319
+38: BZJi 55 0
+39: BZJi 40 0
+40: 41
+41: CPi 16343 16305
+42: CPi 16344 16297
+43: CPI 16343 16343
+44: ADDi 16343 1
+45: CPi 16383 16305
+46: CPIi 16383 16343
+47: CPI 16344 16344
+48: CP 16343 16344
+49: ADDi 16343 1
+50: CPi 16315 16
+51: MUL 16315 16316
+52: CPi 16383 16297
+53: CPIi 16383 16343
+54: BZJi 55 0
+55: 56
+56: ! => This Inner Loop Header: Depth=2
+57: CPi 16317 16297
+58: CPI 16317 16317
+59: CPi 16318 4
+60: LT 16318 16317
+61: LTi 16317 4
+62: BZJi 12 0
+63: BZJi 64 0
+64: 65
+65: CPi 16315 4
 66: MUL 16315 16316
-67: ADD 16383 16315
-68: CP 16344 16383
-69: CPI 16343 16343
-70: CP 16343 16343
-71: ADDi 16343 1
-72: CP 16383 16349
-73: CPi 16315 8
-74: MUL 16315 16316
-75: ADD 16383 16315
-76: CPIi 16383 16343
-77: CPI 16344 16344
-78: CP 16343 16344
-79: ADDi 16343 1
-80: CP 16383 16349
-81: CPi 16315 16
-82: MUL 16315 16316
-83: ADD 16383 16315
-84: CPIi 16383 16343
-85: BZJi 86 0
-86: 87
-87: ! => This Inner Loop Header: Depth=2
-88: CP 16383 16349
-89: CPi 16315 16
-90: MUL 16315 16316
-91: ADD 16383 16315
-92: CP 16343 16383
-93: CP 16317 16343
-94: CPI 16317 16317
-95: CPi 16318 4
-96: LT 16318 16317
-97: LTi 16317 4
-98: BZJi 19 0
-99: BZJi 100 0
-100: 101
-101: CP 16383 16349
-102: CPi 16315 4
-103: MUL 16315 16316
-104: ADD 16383 16315
-105: CP 16343 16383
+67: CPi 16383 16309
+68: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -1,122 +1,76 @@
 0: BZJi 1 0
 1: 2
-2: CP 16383 16349
-3: CPi 16315 4
-4: MUL 16315 16316
-5: ADD 16383 16315
-6: CPIi 16383 16319
-7: CP 16383 16349
-8: CPi 16315 8
-9: MUL 16315 16316
-10: ADD 16383 16315
-11: CPIi 16383 16319
-12: CP 16383 16349
-13: CPi 16315 12
-14: MUL 16315 16316
-15: ADD 16383 16315
-16: CPIi 16383 16319
-17: BZJi 47 0
-18: BZJi 19 0
-19: 20
-20: CP 16383 16349
-21: CPi 16315 8
+2: CPi 16383 16309
+3: CPIi 16383 16319
+4: CPi 16383 16305
+5: CPIi 16383 16319
+6: CPi 16315 12
+7: MUL 16315 16316
+8: CPi 16383 16301
+9: CPIi 16383 16319
+10: BZJi 26 0
+11: BZJi 12 0
+12: 13
+13: CPi 16343 16305
+14: CPI 16343 16343
+15: ADDi 16343 1
+16: CPi 16383 16305
+17: CPIi 16383 16343
+18: CPi 16343 16301
+19: CPI 16343 16343
+20: ADDi 16343 1
+21: CPi 16315 12
 22: MUL 16315 16316
-23: ADD 16383 16315
-24: CP 16343 16383
-25: CPI 16343 16343
-26: CP 16343 16343
-27: ADDi 16343 1
-28: CP 16383 16349
-29: CPi 16315 8
-30: MUL 16315 16316
-31: ADD 16383 16315
-32: CPIi 16383 16343
-33: CP 16383 16349
-34: CPi 16315 12
-35: MUL 16315 16316
-36: ADD 16383 16315
-37: CP 16343 16383
-38: CPI 16343 16343
-39: CP 16343 16343
-40: ADDi 16343 1
-41: CP 16383 16349
-42: CPi 16315 12
-43: MUL 16315 16316
-44: ADD 16383 16315
-45: CPIi 16383 16343
-46: BZJi 47 0
-47: 48
-48: ! Child Loop
-49: BB0_3 Depth 2
-50: CP 16383 16349
-51: CPi 16315 12
-52: MUL 16315 16316
-53: ADD 16383 16315
-54: CP 16343 16383
-55: CP 16317 16343
-56: CPI 16317 16317
-57: CPi 16318 4
-58: LT 16318 16317
-59: LTi 16317 4
-60: LTi 16318 1
-61: BZJ 113 16318
-62: BZJi 63 0
-63: 64
-64: CP 16383 16349
-65: CPi 16315 16
-66: MUL 16315 16316
-67: ADD 16383 16315
-68: CPIi 16383 16319
-69: BZJi 99 0
-70: BZJi 71 0
-71: 72
-72: CP 16383 16349
-73: CPi 16315 8
-74: MUL 16315 16316
-75: ADD 16383 16315
-76: CP 16343 16383
-77: CPI 16343 16343
-78: CP 16343 16343
-79: ADDi 16343 1
-80: CP 16383 16349
-81: CPi 16315 8
-82: MUL 16315 16316
-83: ADD 16383 16315
-84: CPIi 16383 16343
-85: CP 16383 16349
-86: CPi 16315 16
-87: MUL 16315 16316
-88: ADD 16383 16315
-89: CP 16343 16383
-90: CPI 16343 16343
-91: CP 16343 16343
-92: ADDi 16343 1
-93: CP 16383 16349
-94: CPi 16315 16
-95: MUL 16315 16316
-96: ADD 16383 16315
-97: CPIi 16383 16343
-98: BZJi 99 0
-99: 100
-100: ! => This Inner Loop Header: Depth=2
-101: CP 16383 16349
-102: CPi 16315 16
-103: MUL 16315 16316
-104: ADD 16383 16315
-105: CP 16343 16383
-106: CP 16317 16343
-107: CPI 16317 16317
-108: CPi 16318 4
-109: LT 16318 16317
-110: LTi 16317 4
-111: BZJi 19 0
-112: BZJi 113 0
-113: 114
-114: CP 16383 16349
-115: CPi 16315 4
-116: MUL 16315 16316
-117: ADD 16383 16315
-118: CP 16343 16383
+23: CPi 16383 16301
+24: CPIi 16383 16343
+25: BZJi 26 0
+26: 27
+27: ! Child Loop
+28: BB0_3 Depth 2
+29: CPi 16343 16301
+30: CPi 16317 16301
+31: CPI 16317 16317
+32: CPi 16318 4
+33: LT 16318 16317
+34: LTi 16317 4
+35: LTi 16318 1
+36: BZJ 68 16318
+37: BZJi 38 0
+38: 39
+39: CPi 16315 16
+40: MUL 16315 16316
+41: CPi 16383 16297
+42: CPIi 16383 16319
+43: BZJi 59 0
+44: BZJi 45 0
+45: 46
+46: CPi 16343 16305
+47: CPI 16343 16343
+48: ADDi 16343 1
+49: CPi 16383 16305
+50: CPIi 16383 16343
+51: CPi 16343 16297
+52: CPI 16343 16343
+53: ADDi 16343 1
+54: CPi 16315 16
+55: MUL 16315 16316
+56: CPi 16383 16297
+57: CPIi 16383 16343
+58: BZJi 59 0
+59: 60
+60: ! => This Inner Loop Header: Depth=2
+61: CPi 16317 16297
+62: CPI 16317 16317
+63: CPi 16318 4
+64: LT 16318 16317
+65: LTi 16317 4
+66: BZJi 12 0
+67: BZJi 68 0
+68: 69
+69: CPi 16315 4
+70: MUL 16315 16316
+71: CPi 16383 16309
+72: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -1,161 +1,106 @@
 0: BZJi 1 0
 1: 2
-2: CP 16383 16349
-3: CPi 16315 4
-4: MUL 16315 16316
-5: ADD 16383 16315
-6: CPIi 16383 16319
-7: CP 16383 16349
-8: CPi 16315 8
-9: MUL 16315 16316
-10: ADD 16383 16315
-11: CPIi 16383 16319
-12: CP 16383 16349
-13: CPi 16315 12
-14: MUL 16315 16316
-15: ADD 16383 16315
-16: CPIi 16383 16319
-17: BZJi 34 0
-18: BZJi 19 0
-19: 20
-20: CP 16383 16349
-21: CPi 16315 12
-22: MUL 16315 16316
-23: ADD 16383 16315
-24: CP 16343 16383
-25: CPI 16343 16343
-26: CP 16343 16343
-27: ADDi 16343 1
-28: CP 16383 16349
-29: CPi 16315 12
-30: MUL 16315 16316
-31: ADD 16383 16315
-32: CPIi 16383 16343
-33: BZJi 34 0
-34: 35
-35: ! Child Loop
-36: BB0_3 Depth 2
-37: ! Child Loop
-38: BB0_6 Depth 2
-39: CP 16383 16349
-40: CPi 16315 12
-41: MUL 16315 16316
-42: ADD 16383 16315
-43: CP 16343 16383
-44: CP 16317 16343
-45: CPI 16317 16317
-46: CPi 16318 4
-47: LT 16318 16317
-48: LTi 16317 4
-49: LTi 16318 1
-50: BZJ 152 16318
-51: BZJi 52 0
-52: 53
-53: CP 16383 16349
-54: CPi 16315 16
-55: MUL 16315 16316
-56: ADD 16383 16315
-57: CPIi 16383 16319
-58: BZJi 88 0
-59: BZJi 60 0
-60: 61
-61: CP 16383 16349
-62: CPi 16315 8
-63: MUL 16315 16316
-64: ADD 16383 16315
-65: CP 16343 16383
-66: CP 16383 16349
-67: CPi 16315 16
-68: MUL 16315 16316
-69: ADD 16383 16315
-70: CP 16344 16383
-71: CPI 16343 16343
-72: CP 16343 16343
-73: ADDi 16343 1
-74: CP 16383 16349
-75: CPi 16315 8
-76: MUL 16315 16316
-77: ADD 16383 16315
-78: CPIi 16383 16343
-79: CPI 16344 16344
-80: CP 16343 16344
-81: ADDi 16343 1
-82: CP 16383 16349
-83: CPi 16315 16
-84: MUL 16315 16316
-85: ADD 16383 16315
-86: CPIi 16383 16343
-87: BZJi 88 0
-88: 89
-89: ! => This Inner Loop Header: Depth=2
-90: CP 16383 16349
-91: CPi 16315 16
-92: MUL 16315 16316
-93: ADD 16383 16315
-94: CP 16343 16383
-95: CP 16317 16343
-96: CPI 16317 16317
-97: CPi 16318 4
-98: LT 16318 16317
-99: LTi 16317 4
-100: BZJ 60 16318
-101: BZJi 102 0
-102: 103
-103: CP 16383 16349
-104: CPi 16315 20
-105: MUL 16315 16316
-106: ADD 16383 16315
-107: CPIi 16383 16319
-108: BZJi 138 0
-109: BZJi 110 0
-110: 111
-111: CP 16383 16349
-112: CPi 16315 8
-113: MUL 16315 16316
-114: ADD 16383 16315
-115: CP 16343 16383
-116: CP 16383 16349
-117: CPi 16315 20
-118: MUL 16315 16316
-119: ADD 16383 16315
-120: CP 16344 16383
-121: CPI 16343 16343
-122: CP 16343 16343
-123: ADDi 16343 1
-124: CP 16383 16349
-125: CPi 16315 8
-126: MUL 16315 16316
-127: ADD 16383 16315
-128: CPIi 16383 16343
-129: CPI 16344 16344
-130: CP 16343 16344
-131: ADDi 16343 1
-132: CP 16383 16349
-133: CPi 16315 20
-134: MUL 16315 16316
-135: ADD 16383 16315
-136: CPIi 16383 16343
-137: BZJi 138 0
-138: 139
-139: ! => This Inner Loop Header: Depth=2
-140: CP 16383 16349
-141: CPi 16315 20
-142: MUL 16315 16316
-143: ADD 16383 16315
-144: CP 16343 16383
-145: CP 16317 16343
-146: CPI 16317 16317
-147: CPi 16318 4
-148: LT 16318 16317
-149: LTi 16317 4
-150: BZJi 19 0
-151: BZJi 152 0
-152: 153
-153: CP 16383 16349
-154: CPi 16315 4
-155: MUL 16315 16316
-156: ADD 16383 16315
-157: CP 16343 16383
+2: CPi 16383 16309
+3: CPIi 16383 16319
+4: CPi 16383 16305
+5: CPIi 16383 16319
+6: CPi 16315 12
+7: MUL 16315 16316
+8: CPi 16383 16301
+9: CPIi 16383 16319
+10: BZJi 21 0
+11: BZJi 12 0
+12: 13
+13: CPi 16343 16301
+14: CPI 16343 16343
+15: ADDi 16343 1
+16: CPi 16315 12
+17: MUL 16315 16316
+18: CPi 16383 16301
+19: CPIi 16383 16343
+20: BZJi 21 0
+21: 22
+22: ! Child Loop
+23: BB0_3 Depth 2
+24: ! Child Loop
+25: BB0_6 Depth 2
+26: CPi 16343 16301
+27: CPi 16317 16301
+28: CPI 16317 16317
+29: CPi 16318 4
+30: LT 16318 16317
+31: LTi 16317 4
+32: LTi 16318 1
+33: BZJ 98 16318
+34: BZJi 35 0
+35: 36
+36: CPi 16315 16
+37: MUL 16315 16316
+38: CPi 16383 16297
+39: CPIi 16383 16319
+40: BZJi 57 0
+41: BZJi 42 0
+42: 43
+43: CPi 16343 16305
+44: CPi 16344 16297
+45: CPI 16343 16343
+46: ADDi 16343 1
+47: CPi 16383 16305
+48: CPIi 16383 16343
+49: CPI 16344 16344
+50: CP 16343 16344
+51: ADDi 16343 1
+52: CPi 16315 16
+53: MUL 16315 16316
+54: CPi 16383 16297
+55: CPIi 16383 16343
+56: BZJi 57 0
+57: 58
+58: ! => This Inner Loop Header: Depth=2
+59: CPi 16343 16297
+60: CPi 16317 16297
+61: CPI 16317 16317
+62: CPi 16318 4
+63: LT 16318 16317
+64: LTi 16317 4
+65: BZJ 42 16318
+66: BZJi 67 0
+67: 68
+68: CPi 16315 20
+69: MUL 16315 16316
+70: CPi 16383 16293
+71: CPIi 16383 16319
+72: BZJi 89 0
+73: BZJi 74 0
+74: 75
+75: CPi 16343 16305
+76: CPi 16344 16293
+77: CPI 16343 16343
+78: ADDi 16343 1
+79: CPi 16383 16305
+80: CPIi 16383 16343
+81: CPI 16344 16344
+82: CP 16343 16344
+83: ADDi 16343 1
+84: CPi 16315 20
+85: MUL 16315 16316
+86: CPi 16383 16293
+87: CPIi 16383 16343
+88: BZJi 89 0
+89: 90
+90: ! => This Inner Loop Header: Depth=2
+91: CPi 16317 16293
+92: CPI 16317 16317
+93: CPi 16318 4
+94: LT 16318 16317
+95: LTi 16317 4
+96: BZJi 12 0
+97: BZJi 98 0
+98: 99
+99: CPi 16315 4
+100: MUL 16315 16316
+101: CPi 16383 16309
+102: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
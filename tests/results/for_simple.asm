@@ -1,66 +1,38 @@
 0: BZJi 1 0
 1: 2
-2: CP 16383 16349
-3: CPi 16315 4
-4: MUL 16315 16316
-5: ADD 16383 16315
-6: CPIi 16383 16319
-7: CPi 16343 2
-8: CP 16383 16349
-9: CPi 16315 8
-10: MUL 16315 16316
-11: ADD 16383 16315
-12: CPIi 16383 16343
-13: CPi 16343 1
-14: BZJi 39 0
-15: BZJi 16 0
-16: 17
-17: CP 16383 16349
-18: CPi 16315 8
-19: MUL 16315 16316
-20: ADD 16383 16315
-21: CP 16343 16383
-22: CPI 16343 16343
-23: CP 16343 16343
-24: ADDi 16343 1
-25: CP 16383 16349
-26: CPi 16315 8
-27: MUL 16315 16316
-28: ADD 16383 16315
-29: CPIi 16383 16343
-30: CP 16383 16349
-31: CPi 16315 12
+2: CPi 16383 16309
+3: CPIi 16383 16319
+4: CPi 16343 2
+5: CPi 16383 16305
+6: CPIi 16383 16343
+7: CPi 16343 1
+8: BZJi 20 0
+9: BZJi 10 0
+10: 11
+11: CPi 16343 16305
+12: CPI 16343 16343
+13: ADDi 16343 1
+14: CPi 16383 16305
+15: CPIi 16383 16343
+16: CPi 16343 16301
+17: CPI 16343 16343
+18: ADDi 16343 1
+19: BZJi 20 0
+20: 21
+21: CPi 16383 16301
+22: CPIi 16383 16343
+23: CPi 16317 16301
+24: CPI 16317 16317
+25: CPi 16318 4
+26: LT 16318 16317
+27: LTi 16317 4
+28: BZJ 10 16318
+29: BZJi 30 0
+30: 31
+31: CPi 16315 4
 32: MUL 16315 16316
-33: ADD 16383 16315
-34: CP 16343 16383
-35: CPI 16343 16343
-36: CP 16343 16343
-37: ADDi 16343 1
-38: BZJi 39 0
-39: 40
-40: CP 16383 16349
-41: CPi 16315 12
-42: MUL 16315 16316
-43: ADD 16383 16315
-44: CPIi 16383 16343
-45: CP 16383 16349
-46: CPi 16315 12
-47: MUL 16315 16316
-48: ADD 16383 16315
-49: CP 16343 16383
-50: CP 16317 16343
-51: CPI 16317 16317
-52: CPi 16318 4
-53: LT 16318 16317
-54: LTi 16317 4
-55: BZJ 16 16318
-56: BZJi 57 0
-57: 58
-58: CP 16383 16349
-59: CPi 16315 4
-60: MUL 16315 16316
-61: ADD 16383 16315
-62: CP 16343 16383
+33: CPi 16383 16309
+34: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -1,82 +1,44 @@
 0: BZJi 1 0
 1: 2
-2: CP 16383 16349
-3: CPi 16315 4
-4: MUL 16315 16316
-5: ADD 16383 16315
-6: CPIi 16383 16319
-7: CP 16383 16349
-8: CPi 16315 8
-9: MUL 16315 16316
-10: ADD 16383 16315
-11: CPIi 16383 16319
-12: CP 16383 16349
-13: CPi 16315 12
-14: MUL 16315 16316
-15: ADD 16383 16315
-16: CPIi 16383 16319
-17: BZJi 60 0
-18: BZJi 19 0
-19: 20
-20: CP 16383 16349
-21: CPi 16315 12
-22: MUL 16315 16316
-23: ADD 16383 16315
-24: CP 16343 16383
-25: CP 16383 16349
-26: CPi 16315 8
-27: MUL 16315 16316
-28: ADD 16383 16315
-29: CP 16344 16383
-30: CPI 16343 16343
-31: CP 16343 16343
-32: ADDi 16343 1
-33: CP 16383 16349
-34: CPi 16315 12
-35: MUL 16315 16316
-36: ADD 16383 16315
-37: CPIi 16383 16343
-38: CPI 16344 16344
-39: CP 16343 16344
-40: ADDi 16343 1
-41: CP 16383 16349
-42: CPi 16315 8
-43: MUL 16315 16316
-44: ADD 16383 16315
-45: CPIi 16383 16343
-46: CP 16383 16349
-47: CPi 16315 12
-48: MUL 16315 16316
-49: ADD 16383 16315
-50: CP 16343 16383
-51: CPI 16343 16343
-52: CP 16343 16343
-53: ADDi 16343 1
-54: CP 16383 16349
-55: CPi 16315 12
-56: MUL 16315 16316
-57: ADD 16383 16315
-58: CPIi 16383 16343
-59: BZJi 60 0
-60: 61
-61: CP 16383 16349
-62: CPi 16315 12
-63: MUL 16315 16316
-64: ADD 16383 16315
-65: CP 16343 16383
-66: CP 16317 16343
-67: CPI 16317 16317
-68: CPi 16318 4
-69: LT 16318 16317
-70: LTi 16317 4
-71: BZJ 19 16318
-72: BZJi 73 0
-73: 74
-74: CP 16383 16349
-75: CPi 16315 4
-76: MUL 16315 16316
-77: ADD 16383 16315
-78: CP 16343 16383
+2: CPi 16383 16309
+3: CPIi 16383 16319
+4: CPi 16383 16305
+5: CPIi 16383 16319
+6: CPi 16383 16301
+7: CPIi 16383 16319
+8: BZJi 28 0
+9: BZJi 10 0
+10: 11
+11: CPi 16343 16301
+12: CPi 16344 16305
+13: CPI 16343 16343
+14: ADDi 16343 1
+15: CPi 16383 16301
+16: CPIi 16383 16343
+17: CPI 16344 16344
+18: CP 16343 16344
+19: ADDi 16343 1
+20: CPi 16383 16305
+21: CPIi 16383 16343
+22: CPi 16343 16301
+23: CPI 16343 16343
+24: ADDi 16343 1
+25: CPi 16383 16301
+26: CPIi 16383 16343
+27: BZJi 28 0
+28: 29
+29: CPi 16317 16301
+30: CPI 16317 16317
+31: CPi 16318 4
+32: LT 16318 16317
+33: LTi 16317 4
+34: BZJ 10 16318
+35: BZJi 36 0
+36: 37
+37: CPi 16315 4
+38: MUL 16315 16316
+39: CPi 16383 16309
+40: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
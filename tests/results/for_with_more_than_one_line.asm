@@ -1,75 +1,42 @@
 0: BZJi 1 0
 1: 2
-2: CP 16383 16349
-3: CPi 16315 4
-4: MUL 16315 16316
-5: ADD 16383 16315
-6: CPIi 16383 16319
-7: CP 16383 16349
-8: CPi 16315 8
-9: MUL 16315 16316
-10: ADD 16383 16315
-11: CPIi 16383 16319
-12: CP 16383 16349
-13: CPi 16315 12
-14: MUL 16315 16316
-15: ADD 16383 16315
-16: CPIi 16383 16319
-17: CPi 16343 1
-18: BZJi 53 0
-19: BZJi 20 0
-20: 21
-21: CP 16383 16349
-22: CPi 16315 8
-23: MUL 16315 16316
-24: ADD 16383 16315
-25: CP 16344 16383
-26: CPI 16344 16344
-27: CP 16344 16344
-28: ADDi 16344 1
-29: CP 16383 16349
-30: CPi 16315 8
-31: MUL 16315 16316
-32: ADD 16383 16315
-33: CPIi 16383 16344
-34: CP 16383 16349
-35: CPi 16315 8
+2: CPi 16383 16309
+3: CPIi 16383 16319
+4: CPi 16383 16305
+5: CPIi 16383 16319
+6: CPi 16383 16301
+7: CPIi 16383 16319
+8: CPi 16343 1
+9: BZJi 25 0
+10: BZJi 11 0
+11: 12
+12: CPi 16344 16305
+13: CPI 16344 16344
+14: ADDi 16344 1
+15: CPi 16383 16305
+16: CPIi 16383 16344
+17: CPi 16383 16305
+18: CPIi 16383 16343
+19: CPi 16344 16301
+20: CPI 16344 16344
+21: ADDi 16344 1
+22: CPi 16383 16301
+23: CPIi 16383 16344
+24: BZJi 25 0
+25: 26
+26: CPi 16344 16301
+27: CPi 16317 16301
+28: CPI 16317 16317
+29: CPi 16318 4
+30: LT 16318 16317
+31: LTi 16317 4
+32: BZJ 11 16318
+33: BZJi 34 0
+34: 35
+35: CPi 16315 4
 36: MUL 16315 16316
-37: ADD 16383 16315
-38: CPIi 16383 16343
-39: CP 16383 16349
-40: CPi 16315 12
-41: MUL 16315 16316
-42: ADD 16383 16315
-43: CP 16344 16383
-44: CPI 16344 16344
-45: CP 16344 16344
-46: ADDi 16344 1
-47: CP 16383 16349
-48: CPi 16315 12
-49: MUL 16315 16316
-50: ADD 16383 16315
-51: CPIi 16383 16344
-52: BZJi 53 0
-53: 54
-54: CP 16383 16349
-55: CPi 16315 12
-56: MUL 16315 16316
-57: ADD 16383 16315
-58: CP 16344 16383
-59: CP 16317 16344
-60: CPI 16317 16317
-61: CPi 16318 4
-62: LT 16318 16317
-63: LTi 16317 4
-64: BZJ 20 16318
-65: BZJi 66 0
-66: 67
-67: CP 16383 16349
-68: CPi 16315 4
-69: MUL 16315 16316
-70: ADD 16383 16315
-71: CP 16343 16383
+37: CPi 16383 16309
+38: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -5,11 +5,10 @@
 4: CP 16327 16319
 5: 6
 6: CPi 16343 3
-7: CP 16383 16349
-8: CPi 16315 4
-9: MUL 16315 16316
-10: ADD 16383 16315
-11: CPIi 16383 16343
+7: CPi 16315 4
+8: MUL 16315 16316
+9: CPi 16383 16309
+10: CPIi 16383 16343
 16316: 4294967295
 16319: 0
 16349: 16313
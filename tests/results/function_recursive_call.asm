@@ -6,11 +6,10 @@
 5: 6
 6: CPi 16343 3
 7: BZJi 5 0
-8: CP 16383 16349
-9: CPi 16315 4
-10: MUL 16315 16316
-11: ADD 16383 16315
-12: CPIi 16383 16343
+8: CPi 16315 4
+9: MUL 16315 16316
+10: CPi 16383 16309
+11: CPIi 16383 16343
 16316: 4294967295
 16319: 0
 16349: 16313
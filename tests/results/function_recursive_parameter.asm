@@ -1,40 +1,33 @@
 0: BZJi 1 0
 1: 2
-2: BZJi 6 0
-3: CPi 16327 3
-4: CPI 16319 16319
-5: CP 16327 16319
-6: 7
-7: CP 16383 16349
-8: CPi 16315 4
-9: MUL 16315 16316
-10: ADD 16383 16315
-11: CPIi 16383 16343
-12: CPI 16343 16343
-13: CP 16343 16343
-14: ADDi 16343 1
-15: CP 16317 16343
-16: CPI 16317 16317
-17: CPi 16318 5
-18: LT 16318 16317
-19: LTi 16317 5
-20: CP 16383 16349
-21: CPi 16315 4
-22: MUL 16315 16316
-23: ADD 16383 16315
-24: CPIi 16383 16343
-25: LTi 16318 1
-26: BZJ 36 16318
-27: BZJi 28 0
-28: 29
-29: BZJi 6 0
-30: CP 16383 16349
-31: CPi 16315 4
-32: MUL 16315 16316
-33: ADD 16383 16315
-34: CP 16327 16383
-35: BZJi 36 0
-36: 37
+2: BZJi 5 0
+3: CPI 16319 16319
+4: CP 16327 16319
+5: 6
+6: CPi 16383 16309
+7: CPIi 16383 16343
+8: CPI 16343 16343
+9: ADDi 16343 1
+10: CP 16317 16343
+11: CPI 16317 16317
+12: CPi 16318 5
+13: LT 16318 16317
+14: LTi 16317 5
+15: CPi 16315 4
+16: MUL 16315 16316
+17: CPi 16383 16309
+18: CPIi 16383 16343
+19: LTi 16318 1
+20: BZJ 29 16318
+21: BZJi 22 0
+22: 23
+23: BZJi 5 0
+24: CPi 16315 4
+25: MUL 16315 16316
+26: CPi 16383 16309
+27: CPi 16327 16309
+28: BZJi 29 0
+29: 30
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -4,37 +4,29 @@
 3: CPI 16319 16319
 4: CP 16327 16319
 5: 6
-6: CPi 16383 0
-7: CP 16343 16383
-8: CP 16317 16343
-9: CPI 16317 16317
-10: CPi 16318 6
-11: LT 16318 16317
-12: LTi 16317 6
-13: CP 16383 16349
-14: CPi 16315 4
-15: MUL 16315 16316
-16: ADD 16383 16315
-17: CPIi 16383 16319
-18: LTi 16317 1
-19: BZJ 36 16317
-20: BZJi 21 0
-21: 22
-22: CP 16383 16349
+6: CPi 16343 0
+7: CPi 16317 0
+8: CPI 16317 16317
+9: CPi 16318 6
+10: LT 16318 16317
+11: LTi 16317 6
+12: CPi 16315 4
+13: MUL 16315 16316
+14: CPi 16383 16309
+15: CPIi 16383 16319
+16: LTi 16317 1
+17: BZJ 28 16317
+18: BZJi 19 0
+19: 20
+20: CPi 16343 16309
+21: CPI 16343 16343
+22: ADDi 16343 1
 23: CPi 16315 4
 24: MUL 16315 16316
-25: ADD 16383 16315
-26: CP 16343 16383
-27: CPI 16343 16343
-28: CP 16343 16343
-29: ADDi 16343 1
-30: CP 16383 16349
-31: CPi 16315 4
-32: MUL 16315 16316
-33: ADD 16383 16315
-34: CPIi 16383 16343
-35: BZJi 36 0
-36: 37
+25: CPi 16383 16309
+26: CPIi 16383 16343
+27: BZJi 28 0
+28: 29
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -1,23 +1,17 @@
 0: BZJi 1 0
 1: 2
-2: BZJi 6 0
-3: CPi 16327 3
-4: CPI 16319 16319
-5: CP 16327 16319
-6: 7
-7: CP 16383 16349
-8: CPi 16315 4
-9: MUL 16315 16316
-10: ADD 16383 16315
-11: CPIi 16383 16343
-12: CPI 16343 16343
-13: CP 16343 16343
-14: ADDi 16343 1
-15: CP 16383 16349
-16: CPi 16315 4
-17: MUL 16315 16316
-18: ADD 16383 16315
-19: CPIi 16383 16343
+2: BZJi 5 0
+3: CPI 16319 16319
+4: CP 16327 16319
+5: 6
+6: CPi 16383 16309
+7: CPIi 16383 16343
+8: CPI 16343 16343
+9: ADDi 16343 1
+10: CPi 16315 4
+11: MUL 16315 16316
+12: CPi 16383 16309
+13: CPIi 16383 16343
 16316: 4294967295
 16319: 0
 16349: 16313
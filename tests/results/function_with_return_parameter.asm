@@ -1,68 +1,46 @@
 0: BZJi 1 0
 1: 2
-2: CP 16383 16349
-3: CPi 16315 4
-4: MUL 16315 16316
-5: ADD 16383 16315
-6: CPIi 16383 16319
-7: BZJi 11 0
-8: CPi 16327 3
-9: CPI 16319 16319
-10: CP 16327 16319
-11: 12
-12: CP 16383 16349
-13: CPi 16315 8
-14: MUL 16315 16316
-15: ADD 16383 16315
-16: CPIi 16383 16343
-17: CPI 16343 16343
-18: CP 16343 16343
-19: ADDi 16343 1
-20: CP 16317 16343
-21: CPI 16317 16317
-22: CPi 16318 5
-23: LT 16318 16317
-24: LTi 16317 5
-25: CP 16383 16349
-26: CPi 16315 8
-27: MUL 16315 16316
-28: ADD 16383 16315
-29: CPIi 16383 16343
-30: LTi 16318 1
-31: BZJ 47 16318
+2: CPi 16315 4
+3: MUL 16315 16316
+4: CPi 16383 16309
+5: CPIi 16383 16319
+6: BZJi 9 0
+7: CPI 16319 16319
+8: CP 16327 16319
+9: 10
+10: CPi 16383 16305
+11: CPIi 16383 16343
+12: CPI 16343 16343
+13: ADDi 16343 1
+14: CP 16317 16343
+15: CPI 16317 16317
+16: CPi 16318 5
+17: LT 16318 16317
+18: LTi 16317 5
+19: CPi 16315 8
+20: MUL 16315 16316
+21: CPi 16383 16305
+22: CPIi 16383 16343
+23: LTi 16318 1
+24: BZJ 33 16318
+25: BZJi 26 0
+26: 27
+27: BZJi 9 0
+28: CPi 16327 16305
+29: CPi 16383 16309
+30: CPIi 16383 16319
+31: BZJi 38 0
 32: BZJi 33 0
 33: 34
-34: BZJi 11 0
-35: CP 16383 16349
-36: CPi 16315 8
-37: MUL 16315 16316
-38: ADD 16383 16315
-39: CP 16327 16383
-40: CP 16383 16349
-41: CPi 16315 4
-42: MUL 16315 16316
-43: ADD 16383 16315
-44: CPIi 16383 16319
-45: BZJi 59 0
-46: BZJi 47 0
-47: 48
-48: CP 16383 16349
-49: CPi 16315 8
-50: MUL 16315 16316
-51: ADD 16383 16315
-52: CP 16343 16383
-53: CP 16383 16349
-54: CPi 16315 4
-55: MUL 16315 16316
-56: ADD 16383 16315
-57: CPIi 16383 16343
-58: BZJi 59 0
-59: 60
-60: CP 16383 16349
-61: CPi 16315 4
-62: MUL 16315 16316
-63: ADD 16383 16315
-64: CP 16343 16383
+34: CPi 16343 16305
+35: CPi 16383 16309
+36: CPIi 16383 16343
+37: BZJi 38 0
+38: 39
+39: CPi 16315 4
+40: MUL 16315 16316
+41: CPi 16383 16309
+42: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
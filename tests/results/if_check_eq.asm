@@ -1,76 +1,42 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 4
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16343 5
+6: CPi 16383 16301
 7: CPIi 16383 16343
-8: CPi 16343 5
-9: CP 16383 16349
-10: CPi 16315 12
-11: MUL 16315 16316
-12: ADD 16383 16315
-13: CPIi 16383 16343
-14: CP 16383 16349
-15: CPi 16315 8
-16: MUL 16315 16316
-17: ADD 16383 16315
-18: CP 16343 16383
-19: CP 16383 16349
-20: CPi 16315 12
-21: MUL 16315 16316
-22: ADD 16383 16315
-23: CP 16344 16383
-24: CP 16383 16349
-25: CPi 16315 4
-26: MUL 16315 16316
-27: ADD 16383 16315
-28: CPIi 16383 16319
-29: CPi 16345 6
-30: CP 16317 16343
-31: CP 16318 16344
-32: CPI 16317 16317
-33: CPI 16318 16318
-34: CP 16314 16317
-35: LT 16317 16318
-36: LT 16318 16314
-37: CP 16383 16349
-38: CPi 16315 16
-39: MUL 16315 16316
-40: ADD 16383 16315
-41: CPIi 16383 16345
-42: ADD 16317 16318
-43: LTi 16317 1
-44: BZJ 67 16317
-45: BZJi 46 0
-46: 47
-47: CP 16383 16349
-48: CPi 16315 8
-49: MUL 16315 16316
-50: ADD 16383 16315
-51: CP 16343 16383
-52: CP 16383 16349
-53: CPi 16315 12
-54: MUL 16315 16316
-55: ADD 16383 16315
-56: CP 16344 16383
-57: CPI 16343 16343
-58: CPI 16344 16344
-59: CP 16343 16343
-60: ADD 16343 16344
-61: CP 16383 16349
-62: CPi 16315 16
-63: MUL 16315 16316
-64: ADD 16383 16315
-65: CPIi 16383 16343
-66: BZJi 67 0
-67: 68
-68: CP 16383 16349
-69: CPi 16315 4
-70: MUL 16315 16316
-71: ADD 16383 16315
-72: CP 16343 16383
+8: CPi 16344 16301
+9: CPi 16383 16309
+10: CPIi 16383 16319
+11: CPi 16345 6
+12: CPi 16317 16305
+13: CPi 16318 16301
+14: CPI 16317 16317
+15: CPI 16318 16318
+16: CP 16314 16317
+17: LT 16317 16318
+18: LT 16318 16314
+19: CPi 16383 16297
+20: CPIi 16383 16345
+21: ADD 16317 16318
+22: LTi 16317 1
+23: BZJ 34 16317
+24: BZJi 25 0
+25: 26
+26: CPi 16343 16305
+27: CPi 16344 16301
+28: CPI 16343 16343
+29: CPI 16344 16344
+30: ADD 16343 16344
+31: CPi 16383 16297
+32: CPIi 16383 16343
+33: BZJi 34 0
+34: 35
+35: CPi 16315 4
+36: MUL 16315 16316
+37: CPi 16383 16309
+38: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -1,75 +1,41 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 5
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
-7: CPIi 16383 16343
-8: CP 16383 16349
-9: CPi 16315 12
-10: MUL 16315 16316
-11: ADD 16383 16315
-12: CPIi 16383 16343
-13: CP 16383 16349
-14: CPi 16315 8
-15: MUL 16315 16316
-16: ADD 16383 16315
-17: CP 16343 16383
-18: CP 16383 16349
-19: CPi 16315 12
-20: MUL 16315 16316
-21: ADD 16383 16315
-22: CP 16344 16383
-23: CP 16383 16349
-24: CPi 16315 4
-25: MUL 16315 16316
-26: ADD 16383 16315
-27: CPIi 16383 16319
-28: CPi 16345 6
-29: CP 16317 16343
-30: CP 16318 16344
-31: CPI 16317 16317
-32: CPI 16318 16318
-33: CP 16314 16317
-34: LT 16317 16318
-35: LT 16318 16314
-36: CP 16383 16349
-37: CPi 16315 16
-38: MUL 16315 16316
-39: ADD 16383 16315
-40: CPIi 16383 16345
-41: ADD 16317 16318
-42: LTi 16317 1
-43: BZJ 66 16317
-44: BZJi 45 0
-45: 46
-46: CP 16383 16349
-47: CPi 16315 8
-48: MUL 16315 16316
-49: ADD 16383 16315
-50: CP 16343 16383
-51: CP 16383 16349
-52: CPi 16315 12
-53: MUL 16315 16316
-54: ADD 16383 16315
-55: CP 16344 16383
-56: CPI 16343 16343
-57: CPI 16344 16344
-58: CP 16343 16343
-59: ADD 16343 16344
-60: CP 16383 16349
-61: CPi 16315 16
-62: MUL 16315 16316
-63: ADD 16383 16315
-64: CPIi 16383 16343
-65: BZJi 66 0
-66: 67
-67: CP 16383 16349
-68: CPi 16315 4
-69: MUL 16315 16316
-70: ADD 16383 16315
-71: CP 16343 16383
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16383 16301
+6: CPIi 16383 16343
+7: CPi 16344 16301
+8: CPi 16383 16309
+9: CPIi 16383 16319
+10: CPi 16345 6
+11: CPi 16317 16305
+12: CPi 16318 16301
+13: CPI 16317 16317
+14: CPI 16318 16318
+15: CP 16314 16317
+16: LT 16317 16318
+17: LT 16318 16314
+18: CPi 16383 16297
+19: CPIi 16383 16345
+20: ADD 16317 16318
+21: LTi 16317 1
+22: BZJ 33 16317
+23: BZJi 24 0
+24: 25
+25: CPi 16343 16305
+26: CPi 16344 16301
+27: CPI 16343 16343
+28: CPI 16344 16344
+29: ADD 16343 16344
+30: CPi 16383 16297
+31: CPIi 16383 16343
+32: BZJi 33 0
+33: 34
+34: CPi 16315 4
+35: MUL 16315 16316
+36: CPi 16383 16309
+37: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
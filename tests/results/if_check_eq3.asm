@@ -1,75 +1,42 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 6
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
-7: CPIi 16383 16343
-8: CPi 16344 5
-9: CP 16383 16349
-10: CPi 16315 12
-11: MUL 16315 16316
-12: ADD 16383 16315
-13: CPIi 16383 16344
-14: CP 16383 16349
-15: CPi 16315 8
-16: MUL 16315 16316
-17: ADD 16383 16315
-18: CP 16344 16383
-19: CP 16383 16349
-20: CPi 16315 12
-21: MUL 16315 16316
-22: ADD 16383 16315
-23: CP 16345 16383
-24: CP 16383 16349
-25: CPi 16315 4
-26: MUL 16315 16316
-27: ADD 16383 16315
-28: CPIi 16383 16319
-29: CP 16317 16344
-30: CP 16318 16345
-31: CPI 16317 16317
-32: CPI 16318 16318
-33: CP 16314 16317
-34: LT 16317 16318
-35: LT 16318 16314
-36: CP 16383 16349
-37: CPi 16315 16
-38: MUL 16315 16316
-39: ADD 16383 16315
-40: CPIi 16383 16343
-41: ADD 16317 16318
-42: LTi 16317 1
-43: BZJ 66 16317
-44: BZJi 45 0
-45: 46
-46: CP 16383 16349
-47: CPi 16315 8
-48: MUL 16315 16316
-49: ADD 16383 16315
-50: CP 16343 16383
-51: CP 16383 16349
-52: CPi 16315 12
-53: MUL 16315 16316
-54: ADD 16383 16315
-55: CP 16344 16383
-56: CPI 16343 16343
-57: CPI 16344 16344
-58: CP 16343 16343
-59: ADD 16343 16344
-60: CP 16383 16349
-61: CPi 16315 16
-62: MUL 16315 16316
-63: ADD 16383 16315
-64: CPIi 16383 16343
-65: BZJi 66 0
-66: 67
-67: CP 16383 16349
-68: CPi 16315 4
-69: MUL 16315 16316
-70: ADD 16383 16315
-71: CP 16343 16383
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16344 5
+6: CPi 16383 16301
+7: CPIi 16383 16344
+8: CPi 16344 16305
+9: CPi 16345 16301
+10: CPi 16383 16309
+11: CPIi 16383 16319
+12: CPi 16317 16305
+13: CPi 16318 16301
+14: CPI 16317 16317
+15: CPI 16318 16318
+16: CP 16314 16317
+17: LT 16317 16318
+18: LT 16318 16314
+19: CPi 16383 16297
+20: CPIi 16383 16343
+21: ADD 16317 16318
+22: LTi 16317 1
+23: BZJ 34 16317
+24: BZJi 25 0
+25: 26
+26: CPi 16343 16305
+27: CPi 16344 16301
+28: CPI 16343 16343
+29: CPI 16344 16344
+30: ADD 16343 16344
+31: CPi 16383 16297
+32: CPIi 16383 16343
+33: BZJi 34 0
+34: 35
+35: CPi 16315 4
+36: MUL 16315 16316
+37: CPi 16383 16309
+38: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -1,74 +1,41 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 6
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
-7: CPIi 16383 16343
-8: CPi 16344 5
-9: CP 16383 16349
-10: CPi 16315 12
-11: MUL 16315 16316
-12: ADD 16383 16315
-13: CPIi 16383 16344
-14: CP 16383 16349
-15: CPi 16315 8
-16: MUL 16315 16316
-17: ADD 16383 16315
-18: CP 16344 16383
-19: CP 16383 16349
-20: CPi 16315 12
-21: MUL 16315 16316
-22: ADD 16383 16315
-23: CP 16345 16383
-24: CP 16383 16349
-25: CPi 16315 4
-26: MUL 16315 16316
-27: ADD 16383 16315
-28: CPIi 16383 16319
-29: CP 16317 16344
-30: CP 16318 16345
-31: CPI 16317 16317
-32: CPI 16318 16318
-33: CP 16314 16317
-34: LT 16317 16318
-35: LT 16318 16314
-36: CP 16383 16349
-37: CPi 16315 16
-38: MUL 16315 16316
-39: ADD 16383 16315
-40: CPIi 16383 16343
-41: LTi 16317 1
-42: BZJ 65 16317
-43: BZJi 44 0
-44: 45
-45: CP 16383 16349
-46: CPi 16315 8
-47: MUL 16315 16316
-48: ADD 16383 16315
-49: CP 16343 16383
-50: CP 16383 16349
-51: CPi 16315 12
-52: MUL 16315 16316
-53: ADD 16383 16315
-54: CP 16344 16383
-55: CPI 16343 16343
-56: CPI 16344 16344
-57: CP 16343 16343
-58: ADD 16343 16344
-59: CP 16383 16349
-60: CPi 16315 16
-61: MUL 16315 16316
-62: ADD 16383 16315
-63: CPIi 16383 16343
-64: BZJi 65 0
-65: 66
-66: CP 16383 16349
-67: CPi 16315 4
-68: MUL 16315 16316
-69: ADD 16383 16315
-70: CP 16343 16383
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16344 5
+6: CPi 16383 16301
+7: CPIi 16383 16344
+8: CPi 16344 16305
+9: CPi 16345 16301
+10: CPi 16383 16309
+11: CPIi 16383 16319
+12: CPi 16317 16305
+13: CPi 16318 16301
+14: CPI 16317 16317
+15: CPI 16318 16318
+16: CP 16314 16317
+17: LT 16317 16318
+18: LT 16318 16314
+19: CPi 16383 16297
+20: CPIi 16383 16343
+21: LTi 16317 1
+22: BZJ 33 16317
+23: BZJi 24 0
+24: 25
+25: CPi 16343 16305
+26: CPi 16344 16301
+27: CPI 16343 16343
+28: CPI 16344 16344
+29: ADD 16343 16344
+30: CPi 16383 16297
+31: CPIi 16383 16343
+32: BZJi 33 0
+33: 34
+34: CPi 16315 4
+35: MUL 16315 16316
+36: CPi 16383 16309
+37: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -1,74 +1,40 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 5
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
-7: CPIi 16383 16343
-8: CP 16383 16349
-9: CPi 16315 12
-10: MUL 16315 16316
-11: ADD 16383 16315
-12: CPIi 16383 16343
-13: CP 16383 16349
-14: CPi 16315 8
-15: MUL 16315 16316
-16: ADD 16383 16315
-17: CP 16343 16383
-18: CP 16383 16349
-19: CPi 16315 12
-20: MUL 16315 16316
-21: ADD 16383 16315
-22: CP 16344 16383
-23: CP 16383 16349
-24: CPi 16315 4
-25: MUL 16315 16316
-26: ADD 16383 16315
-27: CPIi 16383 16319
-28: CPi 16345 6
-29: CP 16317 16343
-30: CP 16318 16344
-31: CPI 16317 16317
-32: CPI 16318 16318
-33: CP 16314 16317
-34: LT 16317 16318
-35: LT 16318 16314
-36: CP 16383 16349
-37: CPi 16315 16
-38: MUL 16315 16316
-39: ADD 16383 16315
-40: CPIi 16383 16345
-41: LTi 16318 1
-42: BZJ 65 16318
-43: BZJi 44 0
-44: 45
-45: CP 16383 16349
-46: CPi 16315 8
-47: MUL 16315 16316
-48: ADD 16383 16315
-49: CP 16343 16383
-50: CP 16383 16349
-51: CPi 16315 12
-52: MUL 16315 16316
-53: ADD 16383 16315
-54: CP 16344 16383
-55: CPI 16343 16343
-56: CPI 16344 16344
-57: CP 16343 16343
-58: ADD 16343 16344
-59: CP 16383 16349
-60: CPi 16315 16
-61: MUL 16315 16316
-62: ADD 16383 16315
-63: CPIi 16383 16343
-64: BZJi 65 0
-65: 66
-66: CP 16383 16349
-67: CPi 16315 4
-68: MUL 16315 16316
-69: ADD 16383 16315
-70: CP 16343 16383
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16383 16301
+6: CPIi 16383 16343
+7: CPi 16344 16301
+8: CPi 16383 16309
+9: CPIi 16383 16319
+10: CPi 16345 6
+11: CPi 16317 16305
+12: CPi 16318 16301
+13: CPI 16317 16317
+14: CPI 16318 16318
+15: CP 16314 16317
+16: LT 16317 16318
+17: LT 16318 16314
+18: CPi 16383 16297
+19: CPIi 16383 16345
+20: LTi 16318 1
+21: BZJ 32 16318
+22: BZJi 23 0
+23: 24
+24: CPi 16343 16305
+25: CPi 16344 16301
+26: CPI 16343 16343
+27: CPI 16344 16344
+28: ADD 16343 16344
+29: CPi 16383 16297
+30: CPIi 16383 16343
+31: BZJi 32 0
+32: 33
+33: CPi 16315 4
+34: MUL 16315 16316
+35: CPi 16383 16309
+36: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -1,73 +1,39 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 5
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
-7: CPIi 16383 16343
-8: CP 16383 16349
-9: CPi 16315 12
-10: MUL 16315 16316
-11: ADD 16383 16315
-12: CPIi 16383 16343
-13: CP 16383 16349
-14: CPi 16315 8
-15: MUL 16315 16316
-16: ADD 16383 16315
-17: CP 16343 16383
-18: CP 16383 16349
-19: CPi 16315 12
-20: MUL 16315 16316
-21: ADD 16383 16315
-22: CP 16344 16383
-23: CP 16383 16349
-24: CPi 16315 4
-25: MUL 16315 16316
-26: ADD 16383 16315
-27: CPIi 16383 16319
-28: CPi 16345 6
-29: CP 16317 16343
-30: CP 16318 16344
-31: CPI 16317 16317
-32: CPI 16318 16318
-33: CP 16314 16317
-34: LT 16317 16318
-35: LT 16318 16314
-36: CP 16383 16349
-37: CPi 16315 16
-38: MUL 16315 16316
-39: ADD 16383 16315
-40: CPIi 16383 16345
-41: BZJ 64 16317
-42: BZJi 43 0
-43: 44
-44: CP 16383 16349
-45: CPi 16315 8
-46: MUL 16315 16316
-47: ADD 16383 16315
-48: CP 16343 16383
-49: CP 16383 16349
-50: CPi 16315 12
-51: MUL 16315 16316
-52: ADD 16383 16315
-53: CP 16344 16383
-54: CPI 16343 16343
-55: CPI 16344 16344
-56: CP 16343 16343
-57: ADD 16343 16344
-58: CP 16383 16349
-59: CPi 16315 16
-60: MUL 16315 16316
-61: ADD 16383 16315
-62: CPIi 16383 16343
-63: BZJi 64 0
-64: 65
-65: CP 16383 16349
-66: CPi 16315 4
-67: MUL 16315 16316
-68: ADD 16383 16315
-69: CP 16343 16383
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16383 16301
+6: CPIi 16383 16343
+7: CPi 16344 16301
+8: CPi 16383 16309
+9: CPIi 16383 16319
+10: CPi 16345 6
+11: CPi 16317 16305
+12: CPi 16318 16301
+13: CPI 16317 16317
+14: CPI 16318 16318
+15: CP 16314 16317
+16: LT 16317 16318
+17: LT 16318 16314
+18: CPi 16383 16297
+19: CPIi 16383 16345
+20: BZJ 31 16317
+21: BZJi 22 0
+22: 23
+23: CPi 16343 16305
+24: CPi 16344 16301
+25: CPI 16343 16343
+26: CPI 16344 16344
+27: ADD 16343 16344
+28: CPi 16383 16297
+29: CPIi 16383 16343
+30: BZJi 31 0
+31: 32
+32: CPi 16315 4
+33: MUL 16315 16316
+34: CPi 16383 16309
+35: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -1,73 +1,40 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 6
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
-7: CPIi 16383 16343
-8: CPi 16344 5
-9: CP 16383 16349
-10: CPi 16315 12
-11: MUL 16315 16316
-12: ADD 16383 16315
-13: CPIi 16383 16344
-14: CP 16383 16349
-15: CPi 16315 8
-16: MUL 16315 16316
-17: ADD 16383 16315
-18: CP 16344 16383
-19: CP 16383 16349
-20: CPi 16315 12
-21: MUL 16315 16316
-22: ADD 16383 16315
-23: CP 16345 16383
-24: CP 16383 16349
-25: CPi 16315 4
-26: MUL 16315 16316
-27: ADD 16383 16315
-28: CPIi 16383 16319
-29: CP 16317 16344
-30: CP 16318 16345
-31: CPI 16317 16317
-32: CPI 16318 16318
-33: CP 16314 16317
-34: LT 16317 16318
-35: LT 16318 16314
-36: CP 16383 16349
-37: CPi 16315 16
-38: MUL 16315 16316
-39: ADD 16383 16315
-40: CPIi 16383 16343
-41: BZJ 64 16317
-42: BZJi 43 0
-43: 44
-44: CP 16383 16349
-45: CPi 16315 8
-46: MUL 16315 16316
-47: ADD 16383 16315
-48: CP 16343 16383
-49: CP 16383 16349
-50: CPi 16315 12
-51: MUL 16315 16316
-52: ADD 16383 16315
-53: CP 16344 16383
-54: CPI 16343 16343
-55: CPI 16344 16344
-56: CP 16343 16343
-57: ADD 16343 16344
-58: CP 16383 16349
-59: CPi 16315 16
-60: MUL 16315 16316
-61: ADD 16383 16315
-62: CPIi 16383 16343
-63: BZJi 64 0
-64: 65
-65: CP 16383 16349
-66: CPi 16315 4
-67: MUL 16315 16316
-68: ADD 16383 16315
-69: CP 16343 16383
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16344 5
+6: CPi 16383 16301
+7: CPIi 16383 16344
+8: CPi 16344 16305
+9: CPi 16345 16301
+10: CPi 16383 16309
+11: CPIi 16383 16319
+12: CPi 16317 16305
+13: CPi 16318 16301
+14: CPI 16317 16317
+15: CPI 16318 16318
+16: CP 16314 16317
+17: LT 16317 16318
+18: LT 16318 16314
+19: CPi 16383 16297
+20: CPIi 16383 16343
+21: BZJ 32 16317
+22: BZJi 23 0
+23: 24
+24: CPi 16343 16305
+25: CPi 16344 16301
+26: CPI 16343 16343
+27: CPI 16344 16344
+28: ADD 16343 16344
+29: CPi 16383 16297
+30: CPIi 16383 16343
+31: BZJi 32 0
+32: 33
+33: CPi 16315 4
+34: MUL 16315 16316
+35: CPi 16383 16309
+36: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
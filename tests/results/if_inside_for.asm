@@ -1,87 +1,49 @@
 0: BZJi 1 0
 1: 2
-2: CP 16383 16349
-3: CPi 16315 4
-4: MUL 16315 16316
-5: ADD 16383 16315
-6: CPIi 16383 16319
-7: CP 16383 16349
-8: CPi 16315 8
-9: MUL 16315 16316
-10: ADD 16383 16315
-11: CPIi 16383 16319
-12: CP 16383 16349
-13: CPi 16315 12
-14: MUL 16315 16316
-15: ADD 16383 16315
-16: CPIi 16383 16319
-17: BZJi 34 0
-18: BZJi 19 0
-19: 20
-20: CP 16383 16349
-21: CPi 16315 12
-22: MUL 16315 16316
-23: ADD 16383 16315
-24: CP 16343 16383
-25: CPI 16343 16343
-26: CP 16343 16343
-27: ADDi 16343 1
-28: CP 16383 16349
-29: CPi 16315 12
-30: MUL 16315 16316
-31: ADD 16383 16315
-32: CPIi 16383 16343
-33: BZJi 34 0
-34: 35
-35: CP 16383 16349
-36: CPi 16315 12
-37: MUL 16315 16316
-38: ADD 16383 16315
-39: CP 16343 16383
-40: CP 16317 16343
-41: CPI 16317 16317
-42: CPi 16318 4
-43: LT 16318 16317
-44: LTi 16317 4
-45: LTi 16318 1
-46: BZJ 78 16318
-47: BZJi 48 0
-48: 49
-49: CP 16383 16349
-50: CPi 16315 12
-51: MUL 16315 16316
-52: ADD 16383 16315
-53: CP 16343 16383
-54: CP 16317 16343
-55: CPI 16317 16317
-56: CPi 16318 4
-57: LT 16318 16317
-58: LTi 16317 4
-59: LTi 16317 1
-60: BZJ 19 16317
-61: BZJi 62 0
-62: 63
-63: CP 16383 16349
-64: CPi 16315 8
-65: MUL 16315 16316
-66: ADD 16383 16315
-67: CP 16343 16383
-68: CPI 16343 16343
-69: CP 16343 16343
-70: ADDi 16343 1
-71: CP 16383 16349
-72: CPi 16315 8
-73: MUL 16315 16316
-74: ADD 16383 16315
-75: CPIi 16383 16343
-76: BZJi 19 0
-77: BZJi 78 0
-78: 79
-79: CP 16383 16349
-80: CPi 16315 4
-81: MUL 16315 16316
-82: ADD 16383 16315
-83: CP 16343 16383
+2: CPi 16383 16309
+3: CPIi 16383 16319
+4: CPi 16383 16305
+5: CPIi 16383 16319
+6: CPi 16383 16301
+7: CPIi 16383 16319
+8: BZJi 17 0
+9: BZJi 10 0
+10: 11
+11: CPi 16343 16301
+12: CPI 16343 16343
+13: ADDi 16343 1
+14: CPi 16383 16301
+15: CPIi 16383 16343
+16: BZJi 17 0
+17: 18
+18: CPi 16317 16301
+19: CPI 16317 16317
+20: CPi 16318 4
+21: LT 16318 16317
+22: LTi 16317 4
+23: LTi 16318 1
+24: BZJ 41 16318
+25: BZJi 26 0
+26: 27
+27: CPi 16317 16301
+28: CPI 16317 16317
+29: LTi 16317 4
+30: LTi 16317 1
+31: BZJ 10 16317
+32: BZJi 33 0
+33: 34
+34: CPi 16343 16305
+35: CPI 16343 16343
+36: ADDi 16343 1
+37: CPi 16383 16305
+38: CPIi 16383 16343
+39: BZJi 10 0
+40: BZJi 41 0
+41: 42
+42: CPi 16315 4
+43: MUL 16315 16316
+44: CPi 16383 16309
+45: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
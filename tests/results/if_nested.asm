@@ -1,81 +1,47 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 4
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16343 5
+6: CPi 16383 16301
 7: CPIi 16383 16343
-8: CPi 16343 5
-9: CP 16383 16349
-10: CPi 16315 12
-11: MUL 16315 16316
-12: ADD 16383 16315
-13: CPIi 16383 16343
-14: CP 16383 16349
-15: CPi 16315 8
-16: MUL 16315 16316
-17: ADD 16383 16315
-18: CP 16343 16383
-19: CP 16383 16349
-20: CPi 16315 12
-21: MUL 16315 16316
-22: ADD 16383 16315
-23: CP 16344 16383
-24: CP 16383 16349
-25: CPi 16315 4
-26: MUL 16315 16316
-27: ADD 16383 16315
-28: CPIi 16383 16319
-29: CPi 16345 6
-30: CP 16317 16343
-31: CP 16318 16344
-32: CPI 16317 16317
-33: CPI 16318 16318
-34: CP 16314 16317
-35: LT 16317 16318
-36: LT 16318 16314
-37: CP 16383 16349
-38: CPi 16315 16
-39: MUL 16315 16316
-40: ADD 16383 16315
-41: CPIi 16383 16345
-42: BZJ 72 16318
-43: BZJi 44 0
-44: 45
-45: CP 16383 16349
-46: CPi 16315 16
-47: MUL 16315 16316
-48: ADD 16383 16315
-49: CP 16343 16383
-50: CP 16383 16349
-51: CPi 16315 12
-52: MUL 16315 16316
-53: ADD 16383 16315
-54: CP 16344 16383
-55: CP 16317 16343
-56: CP 16318 16344
-57: CPI 16317 16317
-58: CPI 16318 16318
-59: CP 16314 16317
-60: LT 16317 16318
-61: LT 16318 16314
-62: BZJ 72 16318
-63: BZJi 64 0
-64: 65
-65: CPi 16343 9
-66: CP 16383 16349
-67: CPi 16315 16
-68: MUL 16315 16316
-69: ADD 16383 16315
-70: CPIi 16383 16343
-71: BZJi 72 0
-72: 73
-73: CP 16383 16349
-74: CPi 16315 4
-75: MUL 16315 16316
-76: ADD 16383 16315
-77: CP 16343 16383
+8: CPi 16344 16301
+9: CPi 16383 16309
+10: CPIi 16383 16319
+11: CPi 16345 6
+12: CPi 16317 16305
+13: CPi 16318 16301
+14: CPI 16317 16317
+15: CPI 16318 16318
+16: CP 16314 16317
+17: LT 16317 16318
+18: LT 16318 16314
+19: CPi 16383 16297
+20: CPIi 16383 16345
+21: BZJ 39 16318
+22: BZJi 23 0
+23: 24
+24: CPi 16344 16301
+25: CPi 16317 16297
+26: CPi 16318 16301
+27: CPI 16317 16317
+28: CPI 16318 16318
+29: CP 16314 16317
+30: LT 16317 16318
+31: LT 16318 16314
+32: BZJ 39 16318
+33: BZJi 34 0
+34: 35
+35: CPi 16343 9
+36: CPi 16383 16297
+37: CPIi 16383 16343
+38: BZJi 39 0
+39: 40
+40: CPi 16315 4
+41: MUL 16315 16316
+42: CPi 16383 16309
+43: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -1,115 +1,59 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 4
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16343 5
+6: CPi 16383 16301
 7: CPIi 16383 16343
-8: CPi 16343 5
-9: CP 16383 16349
-10: CPi 16315 12
-11: MUL 16315 16316
-12: ADD 16383 16315
-13: CPIi 16383 16343
-14: CP 16383 16349
-15: CPi 16315 8
-16: MUL 16315 16316
-17: ADD 16383 16315
-18: CP 16343 16383
-19: CP 16383 16349
-20: CPi 16315 12
-21: MUL 16315 16316
-22: ADD 16383 16315
-23: CP 16344 16383
-24: CP 16383 16349
-25: CPi 16315 4
-26: MUL 16315 16316
-27: ADD 16383 16315
-28: CPIi 16383 16319
-29: CPi 16345 6
-30: CP 16317 16343
-31: CP 16318 16344
-32: CPI 16317 16317
-33: CPI 16318 16318
-34: CP 16314 16317
-35: LT 16317 16318
-36: LT 16318 16314
-37: CP 16383 16349
-38: CPi 16315 16
-39: MUL 16315 16316
-40: ADD 16383 16315
-41: CPIi 16383 16345
-42: BZJ 65 16317
-43: BZJi 44 0
-44: 45
-45: CP 16383 16349
-46: CPi 16315 16
-47: MUL 16315 16316
-48: ADD 16383 16315
-49: CP 16343 16383
-50: CP 16383 16349
-51: CPi 16315 12
-52: MUL 16315 16316
-53: ADD 16383 16315
-54: CP 16344 16383
-55: CP 16317 16343
-56: CP 16318 16344
-57: CPI 16317 16317
-58: CPI 16318 16318
-59: CP 16314 16317
-60: LT 16317 16318
-61: LT 16318 16314
-62: LTi 16318 1
-63: BZJ 85 16318
-64: BZJi 65 0
-65: 66
-66: CP 16383 16349
-67: CPi 16315 16
-68: MUL 16315 16316
-69: ADD 16383 16315
-70: CP 16343 16383
-71: CP 16383 16349
-72: CPi 16315 8
-73: MUL 16315 16316
-74: ADD 16383 16315
-75: CP 16344 16383
-76: CP 16317 16343
-77: CP 16318 16344
-78: CPI 16317 16317
-79: CPI 16318 16318
-80: CP 16314 16317
-81: LT 16317 16318
-82: LT 16318 16314
-83: BZJ 106 16318
-84: BZJi 85 0
-85: 86
-86: CP 16383 16349
-87: CPi 16315 8
-88: MUL 16315 16316
-89: ADD 16383 16315
-90: CP 16343 16383
-91: CP 16383 16349
-92: CPi 16315 12
-93: MUL 16315 16316
-94: ADD 16383 16315
-95: CP 16344 16383
-96: CPI 16343 16343
-97: CPI 16344 16344
-98: CP 16343 16343
-99: ADD 16343 16344
-100: CP 16383 16349
-101: CPi 16315 16
-102: MUL 16315 16316
-103: ADD 16383 16315
-104: CPIi 16383 16343
-105: BZJi 106 0
-106: 107
-107: CP 16383 16349
-108: CPi 16315 4
-109: MUL 16315 16316
-110: ADD 16383 16315
-111: CP 16343 16383
+8: CPi 16383 16309
+9: CPIi 16383 16319
+10: CPi 16345 6
+11: CPi 16317 16305
+12: CPi 16318 16301
+13: CPI 16317 16317
+14: CPI 16318 16318
+15: LT 16317 16318
+16: CPi 16383 16297
+17: CPIi 16383 16345
+18: BZJ 31 16317
+19: BZJi 20 0
+20: 21
+21: CPi 16317 16297
+22: CPi 16318 16301
+23: CPI 16317 16317
+24: CPI 16318 16318
+25: CP 16314 16317
+26: LT 16317 16318
+27: LT 16318 16314
+28: LTi 16318 1
+29: BZJ 42 16318
+30: BZJi 31 0
+31: 32
+32: CPi 16344 16305
+33: CPi 16317 16297
+34: CPi 16318 16305
+35: CPI 16317 16317
+36: CPI 16318 16318
+37: CP 16314 16317
+38: LT 16317 16318
+39: LT 16318 16314
+40: BZJ 51 16318
+41: BZJi 42 0
+42: 43
+43: CPi 16343 16305
+44: CPi 16344 16301
+45: CPI 16343 16343
+46: CPI 16344 16344
+47: ADD 16343 16344
+48: CPi 16383 16297
+49: CPIi 16383 16343
+50: BZJi 51 0
+51: 52
+52: CPi 16315 4
+53: MUL 16315 16316
+54: CPi 16383 16309
+55: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
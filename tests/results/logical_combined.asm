@@ -1,114 +1,60 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 4
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16343 5
+6: CPi 16383 16301
 7: CPIi 16383 16343
-8: CPi 16343 5
-9: CP 16383 16349
-10: CPi 16315 12
-11: MUL 16315 16316
-12: ADD 16383 16315
-13: CPIi 16383 16343
-14: CP 16383 16349
-15: CPi 16315 8
-16: MUL 16315 16316
-17: ADD 16383 16315
-18: CP 16343 16383
-19: CP 16383 16349
-20: CPi 16315 12
-21: MUL 16315 16316
-22: ADD 16383 16315
-23: CP 16344 16383
-24: CP 16383 16349
-25: CPi 16315 4
-26: MUL 16315 16316
-27: ADD 16383 16315
-28: CPIi 16383 16319
-29: CPi 16345 6
-30: CP 16317 16343
-31: CP 16318 16344
-32: CPI 16317 16317
-33: CPI 16318 16318
-34: CP 16314 16317
-35: LT 16317 16318
-36: LT 16318 16314
-37: CP 16383 16349
-38: CPi 16315 16
-39: MUL 16315 16316
-40: ADD 16383 16315
-41: CPIi 16383 16345
-42: BZJ 84 16317
-43: BZJi 44 0
-44: 45
-45: CP 16383 16349
-46: CPi 16315 16
-47: MUL 16315 16316
-48: ADD 16383 16315
-49: CP 16343 16383
-50: CP 16383 16349
-51: CPi 16315 12
-52: MUL 16315 16316
-53: ADD 16383 16315
-54: CP 16344 16383
-55: CP 16317 16343
-56: CP 16318 16344
-57: CPI 16317 16317
-58: CPI 16318 16318
-59: CP 16314 16317
-60: LT 16317 16318
-61: LT 16318 16314
-62: BZJ 84 16318
-63: BZJi 64 0
-64: 65
-65: CP 16383 16349
-66: CPi 16315 16
-67: MUL 16315 16316
-68: ADD 16383 16315
-69: CP 16343 16383
-70: CP 16383 16349
-71: CPi 16315 8
-72: MUL 16315 16316
-73: ADD 16383 16315
-74: CP 16344 16383
-75: CP 16317 16343
-76: CP 16318 16344
-77: CPI 16317 16317
-78: CPI 16318 16318
-79: CP 16314 16317
-80: LT 16317 16318
-81: LT 16318 16314
-82: BZJ 105 16318
-83: BZJi 84 0
-84: 85
-85: CP 16383 16349
-86: CPi 16315 8
-87: MUL 16315 16316
-88: ADD 16383 16315
-89: CP 16343 16383
-90: CP 16383 16349
-91: CPi 16315 12
-92: MUL 16315 16316
-93: ADD 16383 16315
-94: CP 16344 16383
-95: CPI 16343 16343
-96: CPI 16344 16344
-97: CP 16343 16343
-98: ADD 16343 16344
-99: CP 16383 16349
-100: CPi 16315 16
-101: MUL 16315 16316
-102: ADD 16383 16315
-103: CPIi 16383 16343
-104: BZJi 105 0
-105: 106
-106: CP 16383 16349
-107: CPi 16315 4
-108: MUL 16315 16316
-109: ADD 16383 16315
-110: CP 16343 16383
+8: CPi 16383 16309
+9: CPIi 16383 16319
+10: CPi 16345 6
+11: CPi 16317 16305
+12: CPi 16318 16301
+13: CPI 16317 16317
+14: CPI 16318 16318
+15: CP 16314 16317
+16: LT 16317 16318
+17: LT 16318 16314
+18: CPi 16383 16297
+19: CPIi 16383 16345
+20: BZJ 43 16317
+21: BZJi 22 0
+22: 23
+23: CPi 16317 16297
+24: CPi 16318 16301
+25: CPI 16317 16317
+26: CPI 16318 16318
+27: CP 16314 16317
+28: LT 16317 16318
+29: LT 16318 16314
+30: BZJ 43 16318
+31: BZJi 32 0
+32: 33
+33: CPi 16344 16305
+34: CPi 16317 16297
+35: CPi 16318 16305
+36: CPI 16317 16317
+37: CPI 16318 16318
+38: CP 16314 16317
+39: LT 16317 16318
+40: LT 16318 16314
+41: BZJ 52 16318
+42: BZJi 43 0
+43: 44
+44: CPi 16343 16305
+45: CPi 16344 16301
+46: CPI 16343 16343
+47: CPI 16344 16344
+48: ADD 16343 16344
+49: CPi 16383 16297
+50: CPIi 16383 16343
+51: BZJi 52 0
+52: 53
+53: CPi 16315 4
+54: MUL 16315 16316
+55: CPi 16383 16309
+56: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
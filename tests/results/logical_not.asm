@@ -1,75 +1,41 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 4
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16343 5
+6: CPi 16383 16301
 7: CPIi 16383 16343
-8: CPi 16343 5
-9: CP 16383 16349
-10: CPi 16315 12
-11: MUL 16315 16316
-12: ADD 16383 16315
-13: CPIi 16383 16343
-14: CP 16383 16349
-15: CPi 16315 8
-16: MUL 16315 16316
-17: ADD 16383 16315
-18: CP 16343 16383
-19: CP 16383 16349
-20: CPi 16315 12
-21: MUL 16315 16316
-22: ADD 16383 16315
-23: CP 16344 16383
-24: CP 16383 16349
-25: CPi 16315 4
-26: MUL 16315 16316
-27: ADD 16383 16315
-28: CPIi 16383 16319
-29: CPi 16345 6
-30: CP 16317 16343
-31: CP 16318 16344
-32: CPI 16317 16317
-33: CPI 16318 16318
-34: CP 16314 16317
-35: LT 16317 16318
-36: LT 16318 16314
-37: CP 16383 16349
-38: CPi 16315 16
-39: MUL 16315 16316
-40: ADD 16383 16315
-41: CPIi 16383 16345
-42: LTi 16317 1
-43: BZJ 66 16317
-44: BZJi 45 0
-45: 46
-46: CP 16383 16349
-47: CPi 16315 8
-48: MUL 16315 16316
-49: ADD 16383 16315
-50: CP 16343 16383
-51: CP 16383 16349
-52: CPi 16315 12
-53: MUL 16315 16316
-54: ADD 16383 16315
-55: CP 16344 16383
-56: CPI 16343 16343
-57: CPI 16344 16344
-58: CP 16343 16343
-59: ADD 16343 16344
-60: CP 16383 16349
-61: CPi 16315 16
-62: MUL 16315 16316
-63: ADD 16383 16315
-64: CPIi 16383 16343
-65: BZJi 66 0
-66: 67
-67: CP 16383 16349
-68: CPi 16315 4
-69: MUL 16315 16316
-70: ADD 16383 16315
-71: CP 16343 16383
+8: CPi 16344 16301
+9: CPi 16383 16309
+10: CPIi 16383 16319
+11: CPi 16345 6
+12: CPi 16317 16305
+13: CPi 16318 16301
+14: CPI 16317 16317
+15: CPI 16318 16318
+16: CP 16314 16317
+17: LT 16317 16318
+18: LT 16318 16314
+19: CPi 16383 16297
+20: CPIi 16383 16345
+21: LTi 16317 1
+22: BZJ 33 16317
+23: BZJi 24 0
+24: 25
+25: CPi 16343 16305
+26: CPi 16344 16301
+27: CPI 16343 16343
+28: CPI 16344 16344
+29: ADD 16343 16344
+30: CPi 16383 16297
+31: CPIi 16383 16343
+32: BZJi 33 0
+33: 34
+34: CPi 16315 4
+35: MUL 16315 16316
+36: CPi 16383 16309
+37: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
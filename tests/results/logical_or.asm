@@ -1,95 +1,51 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 4
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16343 5
+6: CPi 16383 16301
 7: CPIi 16383 16343
-8: CPi 16343 5
-9: CP 16383 16349
-10: CPi 16315 12
-11: MUL 16315 16316
-12: ADD 16383 16315
-13: CPIi 16383 16343
-14: CP 16383 16349
-15: CPi 16315 8
-16: MUL 16315 16316
-17: ADD 16383 16315
-18: CP 16343 16383
-19: CP 16383 16349
-20: CPi 16315 12
-21: MUL 16315 16316
-22: ADD 16383 16315
-23: CP 16344 16383
-24: CP 16383 16349
-25: CPi 16315 4
-26: MUL 16315 16316
-27: ADD 16383 16315
-28: CPIi 16383 16319
-29: CPi 16345 6
-30: CP 16317 16343
-31: CP 16318 16344
-32: CPI 16317 16317
-33: CPI 16318 16318
-34: CP 16314 16317
-35: LT 16317 16318
-36: LT 16318 16314
-37: CP 16383 16349
-38: CPi 16315 16
-39: MUL 16315 16316
-40: ADD 16383 16315
-41: CPIi 16383 16345
-42: LTi 16317 1
-43: BZJ 65 16317
-44: BZJi 45 0
-45: 46
-46: CP 16383 16349
-47: CPi 16315 16
-48: MUL 16315 16316
-49: ADD 16383 16315
-50: CP 16343 16383
-51: CP 16383 16349
-52: CPi 16315 12
-53: MUL 16315 16316
-54: ADD 16383 16315
-55: CP 16344 16383
-56: CP 16317 16343
-57: CP 16318 16344
-58: CPI 16317 16317
-59: CPI 16318 16318
-60: CP 16314 16317
-61: LT 16317 16318
-62: LT 16318 16314
-63: BZJ 86 16318
-64: BZJi 65 0
-65: 66
-66: CP 16383 16349
-67: CPi 16315 8
-68: MUL 16315 16316
-69: ADD 16383 16315
-70: CP 16343 16383
-71: CP 16383 16349
-72: CPi 16315 12
-73: MUL 16315 16316
-74: ADD 16383 16315
-75: CP 16344 16383
-76: CPI 16343 16343
-77: CPI 16344 16344
-78: CP 16343 16343
-79: ADD 16343 16344
-80: CP 16383 16349
-81: CPi 16315 16
-82: MUL 16315 16316
-83: ADD 16383 16315
-84: CPIi 16383 16343
-85: BZJi 86 0
-86: 87
-87: CP 16383 16349
-88: CPi 16315 4
-89: MUL 16315 16316
-90: ADD 16383 16315
-91: CP 16343 16383
+8: CPi 16383 16309
+9: CPIi 16383 16319
+10: CPi 16345 6
+11: CPi 16317 16305
+12: CPi 16318 16301
+13: CPI 16317 16317
+14: CPI 16318 16318
+15: CP 16314 16317
+16: LT 16317 16318
+17: LT 16318 16314
+18: CPi 16383 16297
+19: CPIi 16383 16345
+20: LTi 16317 1
+21: BZJ 34 16317
+22: BZJi 23 0
+23: 24
+24: CPi 16344 16301
+25: CPi 16317 16297
+26: CPi 16318 16301
+27: CPI 16317 16317
+28: CPI 16318 16318
+29: CP 16314 16317
+30: LT 16317 16318
+31: LT 16318 16314
+32: BZJ 43 16318
+33: BZJi 34 0
+34: 35
+35: CPi 16343 16305
+36: CPi 16344 16301
+37: CPI 16343 16343
+38: CPI 16344 16344
+39: ADD 16343 16344
+40: CPi 16383 16297
+41: CPIi 16383 16343
+42: BZJi 43 0
+43: 44
+44: CPi 16315 4
+45: MUL 16315 16316
+46: CPi 16383 16309
+47: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
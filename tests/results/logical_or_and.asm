@@ -1,115 +1,60 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 4
-3: CP 16383 16349
-4: CPi 16315 8
-5: MUL 16315 16316
-6: ADD 16383 16315
+3: CPi 16383 16305
+4: CPIi 16383 16343
+5: CPi 16343 5
+6: CPi 16383 16301
 7: CPIi 16383 16343
-8: CPi 16343 5
-9: CP 16383 16349
-10: CPi 16315 12
-11: MUL 16315 16316
-12: ADD 16383 16315
-13: CPIi 16383 16343
-14: CP 16383 16349
-15: CPi 16315 8
-16: MUL 16315 16316
-17: ADD 16383 16315
-18: CP 16343 16383
-19: CP 16383 16349
-20: CPi 16315 12
-21: MUL 16315 16316
-22: ADD 16383 16315
-23: CP 16344 16383
-24: CP 16383 16349
-25: CPi 16315 4
-26: MUL 16315 16316
-27: ADD 16383 16315
-28: CPIi 16383 16319
-29: CPi 16345 6
-30: CP 16317 16343
-31: CP 16318 16344
-32: CPI 16317 16317
-33: CPI 16318 16318
-34: CP 16314 16317
-35: LT 16317 16318
-36: LT 16318 16314
-37: CP 16383 16349
-38: CPi 16315 16
-39: MUL 16315 16316
-40: ADD 16383 16315
-41: CPIi 16383 16345
-42: LTi 16317 1
-43: BZJ 65 16317
-44: BZJi 45 0
-45: 46
-46: CP 16383 16349
-47: CPi 16315 16
-48: MUL 16315 16316
-49: ADD 16383 16315
-50: CP 16343 16383
-51: CP 16383 16349
-52: CPi 16315 12
-53: MUL 16315 16316
-54: ADD 16383 16315
-55: CP 16344 16383
-56: CP 16317 16343
-57: CP 16318 16344
-58: CPI 16317 16317
-59: CPI 16318 16318
-60: CP 16314 16317
-61: LT 16317 16318
-62: LT 16318 16314
-63: BZJ 106 16318
-64: BZJi 65 0
-65: 66
-66: CP 16383 16349
-67: CPi 16315 16
-68: MUL 16315 16316
-69: ADD 16383 16315
-70: CP 16343 16383
-71: CP 16383 16349
-72: CPi 16315 8
-73: MUL 16315 16316
-74: ADD 16383 16315
-75: CP 16344 16383
-76: CP 16317 16343
-77: CP 16318 16344
-78: CPI 16317 16317
-79: CPI 16318 16318
-80: CP 16314 16317
-81: LT 16317 16318
-82: LT 16318 16314
-83: BZJ 106 16318
-84: BZJi 85 0
-85: 86
-86: CP 16383 16349
-87: CPi 16315 8
-88: MUL 16315 16316
-89: ADD 16383 16315
-90: CP 16343 16383
-91: CP 16383 16349
-92: CPi 16315 12
-93: MUL 16315 16316
-94: ADD 16383 16315
-95: CP 16344 16383
-96: CPI 16343 16343
-97: CPI 16344 16344
-98: CP 16343 16343
-99: ADD 16343 16344
-100: CP 16383 16349
-101: CPi 16315 16
-102: MUL 16315 16316
-103: ADD 16383 16315
-104: CPIi 16383 16343
-105: BZJi 106 0
-106: 107
-107: CP 16383 16349
-108: CPi 16315 4
-109: MUL 16315 16316
-110: ADD 16383 16315
-111: CP 16343 16383
+8: CPi 16383 16309
+9: CPIi 16383 16319
+10: CPi 16345 6
+11: CPi 16317 16305
+12: CPi 16318 16301
+13: CPI 16317 16317
+14: CPI 16318 16318
+15: LT 16317 16318
+16: CPi 16383 16297
+17: CPIi 16383 16345
+18: LTi 16317 1
+19: BZJ 32 16317
+20: BZJi 21 0
+21: 22
+22: CPi 16344 16301
+23: CPi 16317 16297
+24: CPi 16318 16301
+25: CPI 16317 16317
+26: CPI 16318 16318
+27: CP 16314 16317
+28: LT 16317 16318
+29: LT 16318 16314
+30: BZJ 52 16318
+31: BZJi 32 0
+32: 33
+33: CPi 16344 16305
+34: CPi 16317 16297
+35: CPi 16318 16305
+36: CPI 16317 16317
+37: CPI 16318 16318
+38: CP 16314 16317
+39: LT 16317 16318
+40: LT 16318 16314
+41: BZJ 52 16318
+42: BZJi 43 0
+43: 44
+44: CPi 16343 16305
+45: CPi 16344 16301
+46: CPI 16343 16343
+47: CPI 16344 16344
+48: ADD 16343 16344
+49: CPi 16383 16297
+50: CPIi 16383 16343
+51: BZJi 52 0
+52: 53
+53: CPi 16315 4
+54: MUL 16315 16316
+55: CPi 16383 16309
+56: CPi 16343 16309
 16316: 4294967295
 16319: 0
 16349: 16313
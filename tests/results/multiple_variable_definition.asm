@@ -1,25 +1,17 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 72
-3: CP 16383 16349
-4: CPi 16315 4
-5: MUL 16315 16316
-6: ADD 16383 16315
+3: CPi 16383 16309
+4: CPIi 16383 16343
+5: CPi 16343 43
+6: CPi 16383 16305
 7: CPIi 16383 16343
-8: CPi 16343 43
-9: CP 16383 16349
-10: CPi 16315 8
+8: CPi 16344 13
+9: CPi 16343 0
+10: CPi 16315 12
 11: MUL 16315 16316
-12: ADD 16383 16315
-13: CPIi 16383 16343
-14: CPi 16344 13
-15: CPi 16383 0
-16: CP 16343 16383
-17: CP 16383 16349
-18: CPi 16315 12
-19: MUL 16315 16316
-20: ADD 16383 16315
-21: CPIi 16383 16344
+12: CPi 16383 16301
+13: CPIi 16383 16344
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -1,32 +1,20 @@
 0: BZJi 1 0
 1: 2
 2: CPi 16343 72
-3: CP 16383 16349
-4: CPi 16315 4
-5: MUL 16315 16316
-6: ADD 16383 16315
-7: CPIi 16383 16343
-8: CP 16383 16349
-9: CPi 16315 4
-10: MUL 16315 16316
-11: ADD 16383 16315
-12: CP 16343 16383
-13: CPi 16344 43
-14: CP 16383 16349
-15: CPi 16315 8
-16: MUL 16315 16316
-17: ADD 16383 16315
-18: CPIi 16383 16344
-19: CPI 16343 16343
-20: CP 16344 16343
-21: ADDi 16344 43
-22: CPi 16383 0
-23: CP 16343 16383
-24: CP 16383 16349
-25: CPi 16315 12
-26: MUL 16315 16316
-27: ADD 16383 16315
-28: CPIi 16383 16344
+3: CPi 16383 16309
+4: CPIi 16383 16343
+5: CPi 16343 16309
+6: CPi 16344 43
+7: CPi 16383 16305
+8: CPIi 16383 16344
+9: CPI 16343 16343
+10: CP 16344 16343
+11: ADDi 16344 43
+12: CPi 16343 0
+13: CPi 16315 12
+14: MUL 16315 16316
+15: CPi 16383 16301
+16: CPIi 16383 16344
 16316: 4294967295
 16319: 0
 16349: 16313
@@ -0,0 +1,60 @@
+"""Tests of analyze_ir.py on the functions in analyze_ir/problems.ll
+
+    python -m unittest discover -s tests
+
+The Python bindings must find libLLVM, through LD_LIBRARY_PATH for example,
+and llvm-as must be on the PATH.
+"""
+
+import os, sys
+import unittest
+from distutils.spawn import find_executable
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, os.pardir))
+
+import analyze_ir
+
+FIXTURE = os.path.join(TESTS_DIR, "analyze_ir", "problems.ll")
+LLVM_AS = find_executable("llvm-as")
+
+@unittest.skipIf(LLVM_AS == None, "llvm-as is not on the PATH")
+class TestAnalyzeIR(unittest.TestCase):
+    def analyze(self):
+        filename, error, functions = analyze_ir.analyze_file((FIXTURE,
+                                                              LLVM_AS))
+        self.assertEqual(filename, FIXTURE)
+        self.assertEqual(error, None)
+        return dict((name, (problems, estimate))
+                    for name, problems, estimate in functions)
+
+    def test_types_and_immediates(self):
+        functions = self.analyze()
+        self.assertEqual(sorted(functions["float_add"][0]),
+                         ["floating point", "instruction FAdd"])
+        self.assertEqual(list(functions["wide_add"][0]), ["64-bit integer"])
+        self.assertEqual(functions["large_immediate"][0],
+                         {"immediate 100000": 1})
+
+    def test_control_flow(self):
+        functions = self.analyze()
+        self.assertEqual(functions["nested_loops"][0], {"nested loop": 1})
+        self.assertEqual(functions["early_return"][0],
+                         {"branch to return": 1})
+        self.assertEqual(functions["forever"][0],
+                         {"recursion without a base case": 1})
+
+    def test_supported(self):
+        problems, estimate = self.analyze()["main"]
+        self.assertEqual(problems, {})
+        self.assertTrue(estimate > 0)
+
+    def test_missing_file(self):
+        filename, error, functions = analyze_ir.analyze_file(
+            (os.path.join(TESTS_DIR, "analyze_ir", "missing.bc"), LLVM_AS))
+        self.assertNotEqual(error, None)
+        self.assertEqual(functions, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
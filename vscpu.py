@@ -2,7 +2,13 @@
 """VerySimpleCPU"""
 import sys
 import re
-#TODO: .v and rs232 output?
+import struct
+import zlib
+from collections import namedtuple
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
 
 MEMSIZE = 16384
 
@@ -60,6 +66,66 @@ VALIDARGS = [
             "^ *[0-9]+: *0x[0-9A-Fa-f]+ *$",
         ]
 
+# trace file: header, then a stream of fixed-width records, optionally
+# compressed as a whole. a record is
+# step, pc, instruction word, number of reads, 3 read addresses,
+# written address, old value, new value
+TRACEMAGIC = b"VSTR"
+TRACEHEADER = struct.Struct("<4sBB")
+TRACERECORD = struct.Struct("<QHIB3HHII")
+TRACEVERSION = 1
+TRACENOADDR = 0xFFFF
+TRACEBUFSIZE = 1 << 16
+
+TRACERAW = 0
+TRACEZLIB = 1
+TRACELZ4 = 2
+
+TraceRecord = namedtuple("TraceRecord",
+                         "step pc word reads written old new")
+
+MEMLATENCY = 20
+
+# rs232 stream: one frame per initialized word, a final frame with address
+# RS232END tells the loader to start. frame is start byte, address and
+# data big endian, and a checksum making the byte sum of address, data
+# and checksum zero
+RS232START = 0x7E
+RS232END = 0xFFFF
+RS232FRAME = struct.Struct(">BHIB")
+
+# exported memory image formats by file extension
+EXPORTERS = {
+        ".mem"   : "exportreadmemh",
+        ".hex"   : "exportreadmemh",
+        ".coe"   : "exportcoe",
+        ".mif"   : "exportmif",
+        ".rs232" : "exportrs232"
+        }
+
+# cycles of the multi-cycle datapath per instruction: 1 fetch, 1 decode,
+# 1 per data memory read and 1 for the write back (all but BZJ). CPI reads
+# mem[arg1] and mem[mem[arg1]], CPIi reads mem[arg0] and mem[arg1], the
+# others read mem[arg0] (all but CP) and mem[arg1] unless immediate
+TIMING = {
+        "ADD"   : 5,
+        "NAND"  : 5,
+        "SRL"   : 5,
+        "LT"    : 5,
+        "CP"    : 4,
+        "CPI"   : 5,
+        "BZJ"   : 4,
+        "MUL"   : 5,
+        "ADDi"  : 4,
+        "NANDi" : 4,
+        "SRLi"  : 4,
+        "LTi"   : 4,
+        "CPi"   : 3,
+        "CPIi"  : 5,
+        "BZJi"  : 3,
+        "MULi"  : 4
+        }
+
 
 def readnumber(instr):
     """read 0x formatted hex or decimal"""
@@ -71,6 +137,287 @@ def readnumber(instr):
     return val
 
 
+def tracecompression(filename):
+    """pick trace compression from the file extension"""
+    if filename.endswith(".lz4"):
+        if lz4 is None:
+            print "lz4 module is not available, install it or use .z"
+            quit()
+        return TRACELZ4
+    if filename.endswith(".z") or filename.endswith(".zlib"):
+        return TRACEZLIB
+    return TRACERAW
+
+
+class TraceWriter(object):
+    """buffered writer for binary execution traces"""
+    def __init__(self, filenameout, compression=TRACERAW,
+                 bufsize=TRACEBUFSIZE):
+        super(TraceWriter, self).__init__()
+        self.flout = open(filenameout, 'wb')
+        self.flout.write(TRACEHEADER.pack(TRACEMAGIC, TRACEVERSION,
+                                          compression))
+        self.compressor = None
+        if compression == TRACEZLIB:
+            self.compressor = zlib.compressobj()
+        elif compression == TRACELZ4:
+            self.compressor = lz4.frame.LZ4FrameCompressor()
+            self.flout.write(self.compressor.begin())
+        self.bufsize = bufsize
+        self.buf = []
+        self.buflen = 0
+
+    def write(self, step, pc_, word, reads, written, old, new):
+        """append one record, flushing once the buffer is full"""
+        nreads = len(reads)
+        reads = list(reads) + [TRACENOADDR] * (3 - nreads)
+        self.buf.append(TRACERECORD.pack(step, pc_, word, nreads,
+                                         reads[0], reads[1], reads[2],
+                                         written, old, new))
+        self.buflen += TRACERECORD.size
+        if self.buflen >= self.bufsize:
+            self.flush()
+
+    def flush(self):
+        """push buffered records through the compressor to the file"""
+        data = b"".join(self.buf)
+        self.buf = []
+        self.buflen = 0
+        if self.compressor is not None:
+            data = self.compressor.compress(data)
+        self.flout.write(data)
+
+    def close(self):
+        """flush everything and finish the compressed stream"""
+        if self.flout.closed:
+            return
+        self.flush()
+        if self.compressor is not None:
+            self.flout.write(self.compressor.flush())
+        self.flout.close()
+
+
+def readtrace(filenamein, chunksize=TRACEBUFSIZE):
+    """lazily iterate TraceRecords of a trace file"""
+    flin = open(filenamein, 'rb')
+    magic, version, compression = TRACEHEADER.unpack(
+        flin.read(TRACEHEADER.size))
+    assert magic == TRACEMAGIC and version == TRACEVERSION
+
+    decompressor = None
+    if compression == TRACEZLIB:
+        decompressor = zlib.decompressobj()
+    elif compression == TRACELZ4:
+        assert lz4 is not None
+        decompressor = lz4.frame.LZ4FrameDecompressor()
+
+    pending = b""
+    while True:
+        chunk = flin.read(chunksize)
+        if not chunk:
+            break
+        if decompressor is not None:
+            chunk = decompressor.decompress(chunk)
+        pending += chunk
+        usable = len(pending) - len(pending) % TRACERECORD.size
+        for offset in range(0, usable, TRACERECORD.size):
+            fields = TRACERECORD.unpack_from(pending, offset)
+            nreads = fields[3]
+            yield TraceRecord(fields[0], fields[1], fields[2],
+                              fields[4:4 + nreads], fields[7], fields[8],
+                              fields[9])
+        pending = pending[usable:]
+    flin.close()
+    assert not pending, "truncated trace file"
+
+
+class MainMemory(object):
+    """last level of a memory hierarchy, every access costs latency"""
+    def __init__(self, latency=MEMLATENCY):
+        super(MainMemory, self).__init__()
+        self.name = "mem"
+        self.latency = latency
+        self.reads = 0
+        self.writes = 0
+
+    def access(self, addr, write=False):
+        """return cycles spent on one word access"""
+        if write:
+            self.writes += 1
+        else:
+            self.reads += 1
+        return self.latency
+
+    def report(self):
+        """one line of statistics"""
+        return "{0}: {1} reads, {2} writes".format(self.name, self.reads,
+                                                   self.writes)
+
+
+class Cache(object):
+    """set-associative write-back write-allocate cache with lru
+    replacement, ways=1 is direct-mapped. sizes are in words"""
+    def __init__(self, name, size, linesize, ways, latency, nextlevel):
+        super(Cache, self).__init__()
+        assert size % (linesize * ways) == 0
+        self.name = name
+        self.linesize = linesize
+        self.ways = ways
+        self.numsets = size / (linesize * ways)
+        self.latency = latency
+        self.nextlevel = nextlevel
+        # every set is a list of [tag, dirty], most recently used last
+        self.sets = [[] for _ in range(self.numsets)]
+        self.hits = 0
+        self.misses = 0
+        self.writebacks = 0
+
+    def access(self, addr, write=False):
+        """return cycles spent on one word access"""
+        line = addr / self.linesize
+        ways = self.sets[line % self.numsets]
+        tag = line / self.numsets
+        for way in ways:
+            if way[0] == tag:
+                self.hits += 1
+                ways.remove(way)
+                ways.append(way)
+                way[1] = way[1] or write
+                return self.latency
+
+        self.misses += 1
+        cycles = self.latency
+        if len(ways) == self.ways:
+            victim = ways.pop(0)
+            if victim[1]:
+                self.writebacks += 1
+                cycles += self.nextlevel.access(
+                    (victim[0] * self.numsets + line % self.numsets)
+                    * self.linesize, True)
+        cycles += self.nextlevel.access(line * self.linesize)
+        ways.append([tag, write])
+        return cycles
+
+    def report(self):
+        """one line of statistics"""
+        accesses = self.hits + self.misses
+        rate = 0.0
+        if accesses:
+            rate = 100.0 * self.hits / accesses
+        return "{0}: {1} accesses, {2} hits, {3} misses, {4} writebacks, " \
+               "{5:.2f}% hit rate".format(self.name, accesses, self.hits,
+                                          self.misses, self.writebacks, rate)
+
+
+class MemoryModel(object):
+    """feeds the address stream of a CpuState through a cache hierarchy"""
+    def __init__(self, levels):
+        super(MemoryModel, self).__init__()
+        self.levels = levels
+        self.top = levels[0]
+        self.cycles = 0
+
+    def fetch(self, addr):
+        """instruction fetch"""
+        self.cycles += self.top.access(addr)
+
+    def read(self, addr):
+        """data read"""
+        self.cycles += self.top.access(addr)
+
+    def write(self, addr):
+        """data write"""
+        self.cycles += self.top.access(addr, True)
+
+    def report(self):
+        """statistics of every level and the estimated memory cycles"""
+        lines = [level.report() for level in self.levels]
+        lines.append("estimated memory cycles: {0}".format(self.cycles))
+        return lines
+
+
+def parsememmodel(spec, memlatency=MEMLATENCY):
+    """build a MemoryModel from size:linesize:ways:latency cache levels
+    separated by commas, e.g. 1024:4:1:1,8192:8:4:6"""
+    levels = [MainMemory(memlatency)]
+    cachespecs = [part for part in spec.split(",") if part]
+    for idx in reversed(range(len(cachespecs))):
+        words = cachespecs[idx].split(":")
+        if len(words) != 4:
+            print "Invalid cache level '" + cachespecs[idx] + "'"
+            quit()
+        size, linesize, ways, latency = [readnumber(x) for x in words]
+        if size % (linesize * ways) != 0:
+            print "Cache size must be a multiple of linesize*ways"
+            quit()
+        levels.insert(0, Cache("L" + str(idx + 1), size, linesize, ways,
+                               latency, levels[0]))
+    return MemoryModel(levels)
+
+
+class TimingModel(object):
+    """counts cycles of retired instructions from a per-opcode table"""
+    def __init__(self, table=None):
+        super(TimingModel, self).__init__()
+        if table is None:
+            table = TIMING
+        # indexed by the top 4 bits of the word, opcode and immediate bit
+        self.names = [None] * 16
+        self.costs = [0] * 16
+        for name in OPDICT:
+            self.names[OPDICT[name] >> 28] = name
+            self.costs[OPDICT[name] >> 28] = table[name]
+        self.counts = [0] * 16
+        self.cycles = 0
+
+    def count(self, word):
+        """account one instruction word"""
+        self.counts[word >> 28] += 1
+        self.cycles += self.costs[word >> 28]
+
+    def report(self):
+        """per opcode breakdown, total cycles and cpi"""
+        lines = []
+        instructions = sum(self.counts)
+        for idx in range(16):
+            if self.counts[idx]:
+                lines.append("{0:6} {1:10} x {2:3} = {3} cycles".format(
+                    self.names[idx], self.counts[idx], self.costs[idx],
+                    self.counts[idx] * self.costs[idx]))
+        cpi = 0.0
+        if instructions:
+            cpi = float(self.cycles) / instructions
+        lines.append("total cycles: {0}".format(self.cycles))
+        lines.append("CPI: {0:.3f}".format(cpi))
+        return lines
+
+
+def readtiming(filenamein):
+    """read a timing table, lines of <mnemonic> <cycles>, unlisted
+    mnemonics keep their default cost"""
+    table = dict(TIMING)
+    flin = open(filenamein, 'r')
+    lineno = 0
+    for line in flin:
+        lineno += 1
+        words = re.sub("//.*", "", line).split()
+        if not words:
+            continue
+        if len(words) != 2 or words[0] not in OPDICT:
+            print "<"+filenamein+"> parse error at line " + str(lineno)
+            quit()
+        table[words[0]] = readnumber(words[1])
+    flin.close()
+    return table
+
+
+def rs232frame(addr, word):
+    """one frame of the rs232 stream"""
+    total = (addr >> 8) + addr + (word >> 24) + (word >> 16) + (word >> 8) \
+            + word
+    return RS232FRAME.pack(RS232START, addr, word, -total & 0xFF)
+
+
 class CpuState(object):
     """CPU state object"""
     def __init__(self):
@@ -79,6 +426,11 @@ class CpuState(object):
         self.pause = False
         self.mem =  [0] * MEMSIZE
         self.modified =  [0] * MEMSIZE
+        self.steps = 0
+        self.trace = None
+        self.memmodel = None
+        self.timing = None
+        self.quiet = False
 
     def dumpmemdecimal(self, filenameout):
         """dump decimal to file"""
@@ -100,6 +452,82 @@ class CpuState(object):
             idx += 1
         flout.close()
 
+    def lastmodified(self):
+        """highest initialized address, -1 if memory is empty"""
+        idx = MEMSIZE - 1
+        while idx >= 0 and not self.modified[idx]:
+            idx -= 1
+        return idx
+
+    def exportreadmemh(self, filenameout):
+        """write initialized words in verilog $readmemh format"""
+        flout = open(filenameout, 'w')
+        expected = None
+        for idx in range(MEMSIZE):
+            if not self.modified[idx]:
+                continue
+            if idx != expected:
+                flout.write("@{0:04x}\n".format(idx))
+            flout.write("{0:08x}\n".format(self.mem[idx]))
+            expected = idx + 1
+        flout.close()
+
+    def exportcoe(self, filenameout):
+        """write xilinx coe, uninitialized words up to the last
+        initialized one are written as zero"""
+        flout = open(filenameout, 'w')
+        flout.write("memory_initialization_radix=16;\n")
+        flout.write("memory_initialization_vector=\n")
+        last = self.lastmodified()
+        for idx in range(last + 1):
+            word = self.mem[idx] if self.modified[idx] else 0
+            flout.write("{0:08x}{1}\n".format(word,
+                                              ";" if idx == last else ","))
+        if last < 0:
+            flout.write("0;\n")
+        flout.close()
+
+    def exportmif(self, filenameout):
+        """write altera mif, gaps are zero filled ranges"""
+        flout = open(filenameout, 'w')
+        flout.write("DEPTH = {0};\nWIDTH = 32;\n".format(MEMSIZE))
+        flout.write("ADDRESS_RADIX = HEX;\nDATA_RADIX = HEX;\n")
+        flout.write("CONTENT\nBEGIN\n")
+        gap = None
+        for idx in range(MEMSIZE + 1):
+            if idx < MEMSIZE and not self.modified[idx]:
+                if gap is None:
+                    gap = idx
+                continue
+            if gap is not None:
+                if gap == idx - 1:
+                    flout.write("{0:04X} : 00000000;\n".format(gap))
+                else:
+                    flout.write("[{0:04X}..{1:04X}] : 00000000;\n".format(
+                        gap, idx - 1))
+                gap = None
+            if idx < MEMSIZE:
+                flout.write("{0:04X} : {1:08X};\n".format(idx, self.mem[idx]))
+        flout.write("END;\n")
+        flout.close()
+
+    def exportrs232(self, filenameout):
+        """write the framed serial byte stream for the uart loader"""
+        flout = open(filenameout, 'wb')
+        for idx in range(MEMSIZE):
+            if self.modified[idx]:
+                flout.write(rs232frame(idx, self.mem[idx]))
+        flout.write(rs232frame(RS232END, 0))
+        flout.close()
+
+    def export(self, filenameout):
+        """write the memory image in the format named by the extension"""
+        ext = filenameout[filenameout.rfind("."):]
+        if ext not in EXPORTERS:
+            print "Unknown export format '" + ext + "'"
+            quit()
+        getattr(self, EXPORTERS[ext])(filenameout)
+
     def readmem(self, filenamein):
         """read memin.txt into memory"""
         flin = open(filenamein, 'r')
@@ -119,18 +547,73 @@ class CpuState(object):
         """check if mem[addr] is garbage for every addr in addrlist"""
         for addr in addrlist:
             if not self.modified[addr]:
-                print "Accesed garbage data at mem[{0}]".format(addr)
+                if not self.quiet:
+                    print "Accesed garbage data at mem[{0}]".format(addr)
                 self.pause = True
                 self.pc_ -= 1
                 return False
         return True
 
 
-    def execute(self): #this needs to be restructured at some point
-        """excute one step"""
-        modifiedlocal =  [0] * MEMSIZE
-        before = list(self.mem)
+    def accesses(self, word):
+        """memory addresses read and written by an instruction word"""
+        op_ = word >> 29
+        immediate = (word >> 28) & 0x00000001
+        arg0 = (word >> 14) & 0x00003FFF
+        arg1org = word & 0x00003FFF
+
+        reads = []
+        if op_ != CP and op_ != CPI:
+            reads.append(arg0)
+        if not immediate:
+            reads.append(arg1org)
+
+        written = arg0
+        if op_ == CPI and not immediate:
+            reads.append(self.mem[arg1org])
+        elif op_ == CPI:
+            reads = [arg0, arg1org]
+            written = self.mem[arg0]
+        elif op_ == BZ:
+            written = None
+        return reads, written
+
+    def execute(self):
+        """excute one step, feeding the trace and models if attached"""
+        if self.trace is None and self.memmodel is None and \
+                self.timing is None:
+            if self.step():
+                self.steps += 1
+            return
+
+        pc_ = self.pc_
+        word = self.mem[pc_]
+        reads, written = self.accesses(word)
+        old = 0
+        if written is not None and written < MEMSIZE:
+            old = self.mem[written]
+
+        if not self.step():
+            return
+        if self.timing is not None:
+            self.timing.count(word)
+        if self.memmodel is not None:
+            self.memmodel.fetch(pc_)
+            for addr in reads:
+                self.memmodel.read(addr)
+            if written is not None:
+                self.memmodel.write(written)
+        if self.trace is not None:
+            if written is None:
+                self.trace.write(self.steps, pc_, word, reads, TRACENOADDR,
+                                 0, 0)
+            else:
+                self.trace.write(self.steps, pc_, word, reads, written, old,
+                                 self.mem[written])
+        self.steps += 1
 
+    def step(self): #this needs to be restructured at some point
+        """excute one instruction, False if it could not be completed"""
 
         op_ = (self.mem[self.pc_] >> 29)
         immediate = (self.mem[self.pc_] >> 28) & 0x00000001
@@ -139,46 +622,44 @@ class CpuState(object):
 
         self.pc_ += 1
         self.modified[arg0] = 1
-        modifiedlocal[arg0] = 1
 
         if not self.checkvalidity([self.pc_ - 1]):
-            return
+            return False
 
 
         if not immediate:
             if not self.checkvalidity([arg1org]):
-                return
+                return False
             arg1 = self.mem[arg1org]
             self.modified[arg1org] = 1
-            modifiedlocal[arg1org] = 1
         else:
             arg1 = arg1org
 
 
         if op_ == ADD:
             if not self.checkvalidity([arg0]):
-                return
+                return False
             self.mem[arg0] = (self.mem[arg0] + arg1) & 0xFFFFFFFF
         elif op_ == NAND:
             if not self.checkvalidity([arg0]):
-                return
+                return False
             self.mem[arg0] = (~(self.mem[arg0] & arg1)) & 0xFFFFFFFF
         elif op_ == SRL:
             if not self.checkvalidity([arg0]):
-                return
+                return False
             if arg1 < 32:
                 self.mem[arg0] = (self.mem[arg0] >> arg1) & 0xFFFFFFFF
             else:
                 self.mem[arg0] = (self.mem[arg0] << (arg1 - 32)) & 0xFFFFFFFF
         elif op_ == LT:
             if not self.checkvalidity([arg0]):
-                return
+                return False
             self.mem[arg0] = int(self.mem[arg0] < arg1)
         elif op_ == CP:
             self.mem[arg0] = arg1
         elif op_ == BZ:
             if not self.checkvalidity([arg0]):
-                return
+                return False
             if not immediate:
                 if not arg1:
                     if self.pc_ == self.mem[arg0] + 1:
@@ -196,34 +677,32 @@ class CpuState(object):
         elif op_ == CPI:
             if not immediate:
                 if not self.checkvalidity([arg0, arg1org, self.mem[arg1org]]):
-                    return
+                    return False
 
                 self.mem[arg0] = self.mem[self.mem[arg1org]]
                 self.modified[arg0] = 1
                 self.modified[arg1org] = 1
                 self.modified[self.mem[arg1org]] = 1
-                modifiedlocal[arg0] = 1
-                modifiedlocal[arg1org] = 1
-                modifiedlocal[self.mem[arg1org]] = 1
             else:
                 if not self.checkvalidity([arg0, arg1org]):
-                    return
+                    return False
                 self.mem[self.mem[arg0]] = self.mem[arg1org]
                 self.modified[self.mem[arg0]] = 1
                 self.modified[arg1org] = 1
                 self.modified[arg0] = 1
-                modifiedlocal[self.mem[arg0]] = 1
-                modifiedlocal[arg1org] = 1
-                modifiedlocal[arg0] = 1
         elif op_ == MUL:
             if not self.checkvalidity([arg0]):
-                return
+                return False
             self.mem[arg0] = (self.mem[arg0] * arg1) & 0xFFFFFFFF
+        return True
 
 
 
-def memgen(filenamein, filenameout):
-    """parse code into memin format"""
+def memgen(filenamein, filenameout, log=None):
+    """parse code into memin format, reporting errors to log (stdout by
+    default)"""
+    if log is None:
+        log = sys.stdout
     flin = open(filenamein, 'r')
     flout = open(filenameout, 'w')
     lineno = 0
@@ -239,8 +718,8 @@ def memgen(filenamein, filenameout):
                 break
 
         if invalid:
-            print "<"+filenamein+"> parse error at line " + str(lineno + 1)
-            print '"' + line +'"'
+            print >>log, "<"+filenamein+"> parse error at line " + str(lineno + 1)
+            print >>log, '"' + line +'"'
             quit()
 
         #line = re.sub(":", "", line)
@@ -252,8 +731,8 @@ def memgen(filenamein, filenameout):
             if words[1] in OPDICT:
                 op_ = OPDICT[words[1]]
             else:
-                print "Unkown operation '" + words[1] + "'",
-                print "at line " + str(lineno + 1)
+                print >>log, "Unkown operation '" + words[1] + "'",
+                print >>log, "at line " + str(lineno + 1)
                 quit()
 
             in1 = readnumber(words[2])
@@ -267,35 +746,96 @@ def memgen(filenamein, filenameout):
         elif len(words) == 0: #empty line
             continue
         else:
-            print "Parser messed up somewhere"
+            print >>log, "Parser messed up somewhere"
             quit()
 
     flin.close()
     flout.close()
 
 
+def splitoptions(argv):
+    """separate --name=value options from positional arguments"""
+    args = []
+    options = {}
+    for arg in argv:
+        if arg.startswith("--") and "=" in arg:
+            key, val = arg[2:].split("=", 1)
+            options[key] = val
+        else:
+            args.append(arg)
+    return args, options
+
+
+def finish(mycpu, name):
+    """close the trace, print statistics and dump memory"""
+    if mycpu.trace:
+        mycpu.trace.close()
+    if mycpu.memmodel or mycpu.timing:
+        print "Executed {0} instructions".format(mycpu.steps)
+    if mycpu.timing:
+        for line in mycpu.timing.report():
+            print line
+    if mycpu.memmodel:
+        for line in mycpu.memmodel.report():
+            print line
+    mycpu.dumpmemdecimal("tests/douts/"+name+".dout")
+    mycpu.dumpmemhex("tests/houts/"+name+".hout")
+
+
 def main():
     """main function"""
 
-    finished = False
-
     cmd = None
 
-    print "Processing:  "+sys.argv[1]
+    args, options = splitoptions(sys.argv)
 
-    if len(sys.argv) == 3:
-        cmd = sys.argv[2]
-    elif len(sys.argv) == 2:
+    if len(args) == 3:
+        cmd = args[2]
+    elif len(args) == 2:
         cmd = "x"
     else:
-        print "{0} <input>".format(sys.argv[0])
-        print "{0} <input> <r|q>".format(sys.argv[0])
+        print "{0} <input>".format(args[0])
+        print "{0} <input> <r|q>".format(args[0])
+        print "options: --trace=<file[.z|.lz4]>"
+        print "         --cache=<size:linesize:ways:latency,...>"
+        print "         --memlatency=<cycles>"
+        print "         --timing=<default|table file>"
+        print "         --export=<file.mem|.hex|.coe|.mif|.rs232,...>"
         quit()
 
+    name = args[1]
+    print "Processing:  "+name
 
     mycpu = CpuState()
-    memgen("tests/results/"+sys.argv[1]+".asm", "tests/ins/"+sys.argv[1]+".in")
-    mycpu.readmem("tests/ins/"+sys.argv[1]+".in")
+    memgen("tests/results/"+name+".asm", "tests/ins/"+name+".in")
+    mycpu.readmem("tests/ins/"+name+".in")
+    if "export" in options:
+        for filenameout in options["export"].split(","):
+            mycpu.export(filenameout)
+    if "trace" in options:
+        mycpu.trace = TraceWriter(options["trace"],
+                                  tracecompression(options["trace"]))
+    try:
+        run(mycpu, name, cmd, options)
+    finally:
+        # also on the quit() paths, so that a crashing run leaves a complete
+        # trace behind
+        if mycpu.trace:
+            mycpu.trace.close()
+
+def run(mycpu, name, cmd, options):
+    """set up the models, then run the program as cmd asks"""
+    finished = False
+
+    if "cache" in options or "memlatency" in options:
+        mycpu.memmodel = parsememmodel(
+            options.get("cache", ""),
+            readnumber(options.get("memlatency", str(MEMLATENCY))))
+    if "timing" in options:
+        table = None
+        if options["timing"] != "default":
+            table = readtiming(options["timing"])
+        mycpu.timing = TimingModel(table)
 
     while cmd != 'q' and cmd != 'r':
         print "\nProgram parsed successfully."
@@ -305,8 +845,7 @@ def main():
     if cmd == 'q':
         while not mycpu.pause:
             mycpu.execute()
-        mycpu.dumpmemdecimal("tests/douts/"+sys.argv[1]+".dout")
-        mycpu.dumpmemhex("tests/houts/"+sys.argv[1]+".hout")
+        finish(mycpu, name)
         quit()
 
     while True:
@@ -343,8 +882,7 @@ def main():
 
             mycpu.mem[aaa] = bbb
             mycpu.modified[aaa] = 1
-    mycpu.dumpmemdecimal("tests/douts/"+sys.argv[1]+".dout")
-    mycpu.dumpmemhex("tests/houts/"+sys.argv[1]+".hout")
+    finish(mycpu, name)
 
 if __name__ == '__main__':
     main()